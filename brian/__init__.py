@@ -158,6 +158,22 @@ define_global_preference(
          ''')
 set_global_preferences(usenewpropagate=False)
 
+define_global_preference(
+    'fusedsteps', '0',
+    desc='''
+         Maximum number of time steps that a :class:`Network` runs in a
+         single call of a generated function which calls the whole update
+         schedule of a clock, avoiding the Python overheads of iterating
+         over the schedule and checking the clock at each step. This is
+         mostly useful for small networks, where these overheads are
+         significant. The network only checks whether it was stopped and
+         reports progress between these blocks of steps. Clocks with user
+         defined network operations or functions are always updated step
+         by step.
+         Set to 0 to switch it off.
+         ''')
+set_global_preferences(fusedsteps=0)
+
 define_global_preference(
     'usecstdp', 'False',
     desc='''
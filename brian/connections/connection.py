@@ -230,6 +230,35 @@ class Connection(magic.InstanceTracker, ObjectContainer):
             # If specified, modulation state variable
             if self._nstate_mod is not None:
                 sv_pre = self.source._S[self._nstate_mod]
+            if isinstance(self.W, SparseConnectionMatrix):
+                # Work directly on the CSR arrays of the matrix, without
+                # creating a row object per spike
+                W = self.W
+                if not isinstance(spikes, numpy.ndarray):
+                    spikes = array(spikes, dtype=int)
+                if not self._useaccel:
+                    synapses, counts = W.get_rows_synapses(spikes)
+                    if len(synapses):
+                        weights = W.alldata[synapses]
+                        if self._nstate_mod is not None:
+                            weights *= repeat(sv_pre[spikes], counts)
+                        increments = bincount(W.allj[synapses], weights)
+                        sv[:len(increments)] += increments
+                else:
+                    nspikes = len(spikes)
+                    rowind = W.rowind
+                    allj = W.allj
+                    alldata = W.alldata
+                    if self._nstate_mod is None:
+                        code = propagate_weave_code_csr
+                        codevars = propagate_weave_code_csr_vars
+                    else:
+                        code = propagate_weave_code_csr_modulation
+                        codevars = propagate_weave_code_csr_modulation_vars
+                    weave.inline(code, codevars,
+                                 compiler=self._cpp_compiler,
+                                 extra_compile_args=self._extra_compile_args)
+                return
             # Get the rows of the connection matrix, each row will be either a
             # DenseConnectionVector or a SparseConnectionVector.
             rows = self.W.get_rows(spikes)
@@ -31,6 +31,10 @@ class ConnectionMatrix(object):
     ``get_cols(cols)``
         Returns a list of cols, should be implemented without Python
         function calls for efficiency if possible.
+    ``get_rows_synapses(rows)``
+        For sparse and dense matrices, returns the concatenated indices of
+        the entries of the given rows in the underlying data array, and the
+        number of entries in each row.
     ``insert(i,j,x)``, ``remove(i,j)``
         For sparse connection matrices which support it, insert a new
         entry or remove an existing one.
@@ -163,6 +167,18 @@ class DenseConnectionMatrix(ConnectionMatrix, numpy.ndarray):
     def get_rows(self, rows):
         return [self.rows[i] for i in rows]
 
+    def get_rows_synapses(self, rows):
+        '''
+        Returns ``(synapses, counts)`` where ``synapses`` is the concatenation
+        of the indices into the flattened matrix of the entries of the given
+        rows, and ``counts[k]`` is the number of entries in row ``rows[k]``
+        (i.e. the number of columns).
+        '''
+        rows = asarray(rows, dtype=int)
+        n = self.shape[1]
+        synapses = (rows[:, newaxis] * n + arange(n)).reshape(-1)
+        return synapses, n * ones(len(rows), dtype=int)
+
     def get_cols(self, cols):
         return [self.cols[i] for i in cols]
 
@@ -407,6 +423,22 @@ class SparseConnectionMatrix(ConnectionMatrix):
     def get_rows(self, rows):
         return [self.rows[i] for i in rows]
 
+    def get_rows_synapses(self, rows):
+        '''
+        Returns ``(synapses, counts)`` where ``synapses`` is the concatenation
+        of the indices into ``alldata`` and ``allj`` of the entries of the
+        given rows, and ``counts[k]`` is the number of entries in row
+        ``rows[k]``. No per-row object is created.
+        '''
+        rows = asarray(rows, dtype=int)
+        starts = asarray(self.rowind[rows], dtype=int)
+        counts = asarray(self.rowind[rows + 1], dtype=int) - starts
+        # synapse k of the concatenation is at starts[r]+(k-offsets[r]) where
+        # r is the row it belongs to and offsets the cumulative counts
+        offsets = cumsum(counts) - counts
+        synapses = arange(counts.sum()) + repeat(starts - offsets, counts)
+        return synapses, counts
+
     def get_col(self, j):
         if self.column_access:
             return SparseConnectionVector(self.shape[0], self.coli[j], self.alldata[self.coldataindices[j]])
@@ -75,6 +75,11 @@ class DelayConnection(Connection):
     the spike is propagated to that row as for a standard connection (although
     this won't be propagated to the target until a later time).
     
+    For sparse and dense matrices, the delays are quantised to integer time
+    steps once (and again after they are changed), giving for each synapse
+    its position relative to the current row in the flattened array. All the
+    spikes of a time step are then propagated with a single scatter-add.
+    
     **Warning**
     
     If you are using a dynamic connection matrix, it is your responsibility to
@@ -103,6 +108,8 @@ class DelayConnection(Connection):
         if isinstance(structure, str):
             structure = construction_matrix_register[structure]
         self.delayvec = structure((len(source), len(target)), **kwds)
+        # quantised delays, computed by _quantise_delays when needed
+        self._delay_offsets = None
         self._cur_delay_ind = 0
         # this network operation is added to the Network object via the contained_objects
         # protocol (see the line after the function definition). The standard Connection.propagate
@@ -133,6 +140,10 @@ class DelayConnection(Connection):
         if not self.iscompressed:
             self.compress()
         if len(spikes):
+            if isinstance(self.W, (SparseConnectionMatrix,
+                                   DenseConnectionMatrix)):
+                self._propagate_quantised(spikes)
+                return
             # Target state variable
             dr = self._delayedreaction
             # If specified, modulation state variable
@@ -202,13 +213,90 @@ class DelayConnection(Connection):
                              type_converters=weave.converters.blitz,
                              extra_compile_args=self._extra_compile_args)
 
+    def _quantise_delays(self):
+        '''
+        Computes ``_delay_offsets``, the offset of each synapse in the
+        flattened ``_delayedreaction`` array relative to the current row,
+        i.e. ``delay_steps*N+j``, aligned with the data of ``W``, and
+        ``_delay_rowind`` such that the synapses of row ``i`` are
+        ``rowind[i]:rowind[i+1]``.
+        '''
+        N = self._delayedreaction.shape[1]
+        if isinstance(self.W, SparseConnectionMatrix):
+            delays = self.delayvec.alldata
+            if len(delays) != len(self.W.alldata):
+                raise RuntimeError('Weight and delay matrices must be kept in synchrony for sparse matrices.')
+            targets = self.W.allj
+            rowind = self.W.rowind
+        else:
+            delays = asarray(self.delayvec).reshape(-1)
+            targets = tile(arange(N), self.W.shape[0])
+            rowind = arange(0, self.W.shape[0] * N + 1, N)
+        steps = array(self._invtargetdt * delays, dtype=int) % self._max_delay
+        self._delay_offsets = steps * N + targets
+        self._delay_rowind = rowind
+
+    def _propagate_quantised(self, spikes):
+        '''
+        Propagates all the spikes at once to the flattened
+        ``_delayedreaction`` array, using the quantised delays.
+        '''
+        if self._delay_offsets is None:
+            self._quantise_delays()
+        if not isinstance(spikes, numpy.ndarray):
+            spikes = array(spikes, dtype=int)
+        drflat = self._delayedreaction.reshape(-1)
+        drsize = len(drflat)
+        cdioffset = self._cur_delay_ind * self._delayedreaction.shape[1]
+        offsets = self._delay_offsets
+        if isinstance(self.W, SparseConnectionMatrix):
+            data = self.W.alldata
+        else:
+            data = asarray(self.W).reshape(-1)
+        if self._nstate_mod is not None:
+            sv_pre = self.source._S[self._nstate_mod]
+        if not self._useaccel:
+            synapses, counts = self.W.get_rows_synapses(spikes)
+            if not len(synapses):
+                return
+            weights = data[synapses]
+            if self._nstate_mod is not None:
+                weights *= repeat(sv_pre[spikes], counts)
+            # offsets are smaller than drsize, so a single subtraction
+            # replaces the modulo of the circular indexing scheme
+            drinds = offsets[synapses] + cdioffset
+            drinds[drinds >= drsize] -= drsize
+            # add the bincount over the modified elements (much faster than
+            # numpy.add.at, which is also missing in numpy<1.8); the indices
+            # can wrap around the buffer, so that their range is not used
+            modified, inverse = unique(drinds, return_inverse=True)
+            drflat[modified] += bincount(inverse, weights)
+        else:
+            nspikes = len(spikes)
+            rowind = self._delay_rowind
+            if self._nstate_mod is None:
+                code = delay_propagate_weave_code_offsets
+                codevars = delay_propagate_weave_code_offsets_vars
+            else:
+                code = delay_propagate_weave_code_offsets_modulation
+                codevars = delay_propagate_weave_code_offsets_modulation_vars
+            weave.inline(code, codevars,
+                         compiler=self._cpp_compiler,
+                         extra_compile_args=self._extra_compile_args)
+
     def do_propagate(self):
         self.propagate(self.source.get_spikes(0))
 
+    def _get_delay_property(self):
+        # the delays can be modified through the returned matrix
+        self._delay_offsets = None
+        return self.delayvec
+
     def _set_delay_property(self, val):
         self.delayvec[:] = val
+        self._delay_offsets = None
 
-    delay = property(fget=lambda self:self.delayvec, fset=_set_delay_property)
+    delay = property(fget=_get_delay_property, fset=_set_delay_property)
 
     def compress(self):
         if not self.iscompressed:
@@ -253,6 +341,7 @@ class DelayConnection(Connection):
                     self.delayvec.set_row(i, array(todense(delayvec[i, :]), copy=False).flatten())
                 
             Connection.compress(self)
+            self._delay_offsets = None
 
     def set_delays(self, source=None, target=None, delay=None):
         '''
@@ -271,6 +360,7 @@ class DelayConnection(Connection):
         '''
         if delay is None:
             return
+        self._delay_offsets = None
         W = self.W
         P = source or self.source
         Q = target or self.target
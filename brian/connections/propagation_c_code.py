@@ -58,6 +58,31 @@ propagate_weave_code_sparse_modulation = '''
     }
     '''
 
+################## SPARSE (CSR ARRAYS) #########################################
+
+propagate_weave_code_csr_vars = ['sv', 'rowind', 'allj', 'alldata', 'spikes',
+                                 'nspikes']
+propagate_weave_code_csr = '''
+    for(int j=0;j<nspikes;j++)
+    {
+        long i = spikes[j];
+        for(long k=rowind[i];k<rowind[i+1];k++)
+            sv[allj[k]] += alldata[k];
+    }
+    '''
+
+propagate_weave_code_csr_modulation_vars = ['sv', 'sv_pre', 'rowind', 'allj',
+                                            'alldata', 'spikes', 'nspikes']
+propagate_weave_code_csr_modulation = '''
+    for(int j=0;j<nspikes;j++)
+    {
+        long i = spikes[j];
+        double mod = sv_pre[i];
+        for(long k=rowind[i];k<rowind[i+1];k++)
+            sv[allj[k]] += alldata[k]*mod;
+    }
+    '''
+
 ################## DENSE #######################################################
 
 propagate_weave_code_dense_vars = ['sv', 'spikes', 'nspikes', 'N', 'rows']
@@ -167,6 +192,41 @@ delay_propagate_weave_code_sparse_modulation = """
     }
     """
 
+################## PRE-QUANTISED DELAYS ########################################
+
+delay_propagate_weave_code_offsets_vars = [
+    'drflat', 'rowind', 'offsets', 'data', 'spikes', 'nspikes', 'cdioffset',
+    'drsize']
+delay_propagate_weave_code_offsets = """
+    for(int j=0;j<nspikes;j++)
+    {
+        long i = spikes[j];
+        for(long k=rowind[i];k<rowind[i+1];k++)
+        {
+            long off = offsets[k]+cdioffset;
+            if(off>=drsize) off -= drsize;
+            drflat[off] += data[k];
+        }
+    }
+    """
+
+delay_propagate_weave_code_offsets_modulation_vars = [
+    'sv_pre', 'drflat', 'rowind', 'offsets', 'data', 'spikes', 'nspikes',
+    'cdioffset', 'drsize']
+delay_propagate_weave_code_offsets_modulation = """
+    for(int j=0;j<nspikes;j++)
+    {
+        long i = spikes[j];
+        double mod = sv_pre[i];
+        for(long k=rowind[i];k<rowind[i+1];k++)
+        {
+            long off = offsets[k]+cdioffset;
+            if(off>=drsize) off -= drsize;
+            drflat[off] += data[k]*mod;
+        }
+    }
+    """
+
 ################## DENSE #######################################################
 
 delay_propagate_weave_code_dense_vars = [
@@ -15,6 +15,8 @@ from brian.stdunits import um
 import warnings
 from pylab import figure
 import copy
+import os
+import hashlib
 try:
     from mpl_toolkits.mplot3d import Axes3D
 except:
@@ -22,17 +24,24 @@ except:
 
 __all__ = ['Morphology', 'Cylinder', 'Soma']
 
+swc_types = ['undefined', 'soma', 'axon', 'dendrite', 'apical', 'fork', 'end', 'custom']
+
+# Default directory of the cache of SWC files, and version of the cached
+# arrays (part of the key, to be changed if the format changes)
+default_swc_cache = os.path.join(os.path.expanduser('~'), '.brian', 'morphology')
+swc_cache_version = '2'
+
 
 class Morphology(object):
     '''
     Neuronal morphology (=tree of branches).
     '''
-    def __init__(self, filename=None, n=None):
+    def __init__(self, filename=None, n=None, cache=False):
         self.children = []
         self._namedkid = {}
         self.iscompressed = False
         if filename is not None:
-            self.loadswc(filename)
+            self.loadswc(filename, cache=cache)
         elif n is not None: # Creates a branch with n compartments
             # The problem here is that these parameters should have some self-consistency
             self.x, self.y, self.z, self.diameter, self.length, self.area = [zeros(n) for _ in range(6)]
@@ -63,7 +72,7 @@ class Morphology(object):
         self.y = l * sin(theta) * sin(phi)
         self.z = l * cos(theta)
 
-    def loadswc(self, filename):
+    def loadswc(self, filename, cache=False):
         '''
         Reads a SWC file containing a neuronal morphology.
         Large database at http://neuromorpho.org/neuroMorpho        
@@ -86,39 +95,67 @@ class Morphology(object):
         x, y, z gives the cartesian coordinates of each node.
         R is the radius at that node.
         P indicates the parent (the integer label) of the current point or -1 to indicate an origin (soma). 
+        
+        The arrays of the morphology can be cached on disk, indexed by the
+        content of the file, so that a file is only parsed the first time it is
+        loaded. ``cache`` is the cache directory, ``True`` for the default
+        directory (``~/.brian/morphology``) or ``False`` for no cache (the
+        default).
         '''
-        # 1) Create the list of segments, each segment has a list of children
-        lines = open(filename).read().splitlines()
-        segment = [] # list of segments
-        types = ['undefined', 'soma', 'axon', 'dendrite', 'apical', 'fork', 'end', 'custom']
-        previousn = -1
-        for line in lines:
-            if line[0] != '#': # comment
-                numbers = line.split()
-                n = int(numbers[0]) - 1
-                T = types[int(numbers[1])]
-                x = float(numbers[2]) * um
-                y = float(numbers[3]) * um
-                z = float(numbers[4]) * um
-                R = float(numbers[5]) * um
-                P = int(numbers[6]) - 1 # 0-based indexing
-                if (n != previousn + 1):
-                    raise ValueError, "Bad format in file " + filename
-                seg = dict(x=x, y=y, z=z, T=T, diameter=2 * R, parent=P, children=[])
-                location = (x, y, z)
-                if T == 'soma':
-                    seg['area'] = 4 * pi * R ** 2
-                    seg['length'] = 0 * um
-                else: # dendrite
-                    locationP = (segment[P]['x'], segment[P]['y'], segment[P]['z'])
-                    seg['length'] = (sum((array(location) - array(locationP)) ** 2)) ** .5 * meter
-                    seg['area'] = seg['length'] * 2 * pi * R
-                if P >= 0:
-                    segment[P]['children'].append(n)
-                segment.append(seg)
-                previousn = n
-        # We assume that the first segment is the root
-        self.create_from_segments(segment)
+        text = open(filename).read()
+        arrays = None
+        if cache:
+            if cache is True:
+                cache = default_swc_cache
+            key = hashlib.sha1(swc_cache_version + text).hexdigest()
+            cachefile = os.path.join(cache, key + '.npz')
+            if os.path.exists(cachefile):
+                try:
+                    data = load(cachefile)
+                    arrays = dict((name, data[name]) for name in data.files)
+                    data.close()
+                except Exception: # corrupted cache file, the file is parsed again
+                    arrays = None
+        if arrays is None:
+            arrays = parse_swc(text, filename)
+            if cache:
+                try:
+                    if not os.path.exists(cache):
+                        os.makedirs(cache)
+                    # Written to a temporary file first, so that other processes
+                    # never read an incomplete file
+                    tmpfile = cachefile + '.' + str(os.getpid())
+                    f = open(tmpfile, 'wb')
+                    savez(f, **arrays)
+                    f.close()
+                    os.rename(tmpfile, cachefile)
+                except (IOError, OSError):
+                    warnings.warn('Could not write the morphology cache in ' + cache)
+        self.create_from_arrays(arrays)
+
+    def create_from_arrays(self, arrays):
+        """
+        Creates the morphology from the arrays returned by parse_swc, where
+        compartments are ordered by branch, depth-first (as in a compressed
+        morphology).
+        """
+        start, size = arrays['branch_start'], arrays['branch_size']
+        types, parent = arrays['branch_type'], arrays['branch_parent']
+        branches = [self] + [Morphology() for _ in range(1, len(start))]
+        for i, branch in enumerate(branches):
+            compartments = slice(start[i], start[i] + size[i])
+            branch.diameter = arrays['diameter'][compartments]
+            branch.length = arrays['length'][compartments]
+            branch.area = arrays['area'][compartments]
+            branch.x = arrays['x'][compartments]
+            branch.y = arrays['y'][compartments]
+            branch.z = arrays['z'][compartments]
+            branch.type = swc_types[types[i]]
+            if parent[i] >= 0:
+                branches[parent[i]].children.append(branch)
+        for branch in branches:
+            branch.name_children()
+        return self
 
     def create_from_segments(self, segment, origin=0):
         """
@@ -140,6 +177,13 @@ class Morphology(object):
         self.type = segment[n]['T'] # normally same type for all compartments in the branch
         # Create children (list)
         self.children = [Morphology().create_from_segments(segment, origin=c) for c in segment[n]['children']]
+        self.name_children()
+        return self
+
+    def name_children(self):
+        """
+        Creates the dictionary of names of the children (_namedkid).
+        """
         # Create dictionary of names (enumerates children from number 1)
         for i, child in enumerate(self.children):
             self._namedkid[str(i + 1)] = child
@@ -157,7 +201,6 @@ class Morphology(object):
         if len(self.children) == 2:
             self._namedkid['L'] = self._namedkid['1']
             self._namedkid['R'] = self._namedkid['2']
-        return self
 
     def branch(self):
         '''
@@ -356,6 +399,99 @@ class Morphology(object):
             c.plot(origin=(x[-1], y[-1], z[-1]), axes=axes, simple=simple)
 
 
+def parse_swc(text, filename=''):
+    '''
+    Parses the content of a SWC file (see Morphology.loadswc) and returns a
+    dictionary of arrays:
+    
+    * ``x``, ``y``, ``z``, ``diameter``, ``length``, ``area`` for the
+      compartments (in meters), ordered by branch, depth-first.
+    * ``branch_start``, ``branch_size``: first compartment and number of
+      compartments of each branch.
+    * ``branch_type``: type of each branch (index in swc_types).
+    * ``branch_parent``: index of the parent branch, -1 for the root.
+    
+    A branch ends at a point that does not have exactly one child (or at a
+    soma point), and the point with the smallest label is the root. The
+    points can be in any order in the file.
+    '''
+    lines = [line for line in text.splitlines() if line.strip() and line[0] != '#']
+    data = fromstring(' '.join(lines), sep=' ')
+    if len(data) != 7 * len(lines):
+        raise ValueError, "Bad format in file " + filename
+    data = data.reshape((len(lines), 7))
+    data = data[argsort(data[:, 0], kind='mergesort')] # sorted by label
+    n = len(data)
+    labels = data[:, 0].astype(int)
+    if any(labels[1:] == labels[:-1]):
+        raise ValueError, "Bad format in file " + filename
+    # Parents as indexes of points
+    parent_labels = data[:, 6].astype(int)
+    P = minimum(searchsorted(labels, parent_labels), n - 1)
+    P[parent_labels < 0] = -1
+    if sum(P == -1) > 1:
+        raise ValueError, "Several roots (points without parent) in file " + filename
+    if P[0] != -1 or any(labels[P[P >= 0]] != parent_labels[P >= 0]):
+        raise ValueError, "Bad format in file " + filename
+    T = data[:, 1].astype(int)
+    soma = T == swc_types.index('soma')
+    nchildren = zeros(n, dtype=int) # (bincount has no minlength in numpy<1.6)
+    if any(P >= 0):
+        counts = bincount(P[P >= 0])
+        nchildren[:len(counts)] = counts
+    # The points are renumbered so that the points of each branch are
+    # contiguous. A point continues the branch of its parent if it is its only
+    # child (and the parent is not a soma point). The first point of its
+    # branch (head) and the position in the branch (rank) of each point are
+    # found by pointer jumping.
+    continues = P >= 0
+    continues[continues] = (nchildren[P[continues]] == 1) & ~soma[P[continues]]
+    head = where(continues, P, arange(n))
+    rank = continues.astype(int)
+    while any(head[head] != head):
+        rank = rank + rank[head]
+        head = head[head]
+    order = lexsort((rank, head))
+    index = empty(n, dtype=int)
+    index[order] = arange(n)
+    data, T, soma, nchildren, P = data[order], T[order], soma[order], nchildren[order], P[order]
+    P[P >= 0] = index[P[P >= 0]]
+    location = data[:, 2:5] * float(um)
+    x, y, z = location.T
+    R = data[:, 5] * float(um)
+    diameter = 2 * R
+    length = zeros(n)
+    dendrite = (~soma) & (P >= 0)
+    length[dendrite] = sum((location[dendrite] - location[P[dendrite]]) ** 2, axis=1) ** .5
+    area = length * 2 * pi * R
+    area[soma] = 4 * pi * R[soma] ** 2
+    # Children of each point, in the order of the labels
+    children = argsort(P, kind='mergesort')
+    first_child = searchsorted(P[children], arange(n))
+    # Branches, depth-first
+    ends = flatnonzero((nchildren != 1) | soma)
+    start, size, types, parent = [], [], [], []
+    stack = [(0, -1)]
+    while stack:
+        s, p = stack.pop()
+        e = ends[searchsorted(ends, s)]
+        index = len(start)
+        start.append(s)
+        size.append(e - s + 1)
+        types.append(T[e])
+        parent.append(p)
+        kids = children[first_child[e]:first_child[e] + nchildren[e]]
+        stack.extend([(kid, index) for kid in kids[::-1]])
+    start, size = array(start), array(size)
+    branch_start = cumsum(size) - size
+    # Indexes of the compartments, ordered by branch
+    order = repeat(start - branch_start, size) + arange(sum(size))
+    return dict(x=x[order], y=y[order], z=z[order], diameter=diameter[order],
+                length=length[order], area=area[order],
+                branch_start=branch_start, branch_size=size,
+                branch_type=array(types), branch_parent=array(parent))
+
+
 class Cylinder(Morphology):
     """
     A cylinder.
@@ -4,7 +4,6 @@ See BEP-15
 
 TODO:
 * Threshold and reset are special (not as normal NeuronGroup because only 1 spike)
-* Hines method
 * Point processes
 * StateMonitor
 * neuron.plot('gl')
@@ -23,8 +22,8 @@ from brian.clock import guess_clock
 from itertools import count
 from brian.neurongroup import NeuronGroup
 from scipy.linalg import solve_banded
-from numpy import zeros, ones, isscalar, diag_indices, pi
-from numpy.linalg import solve
+from numpy import zeros, ones, isscalar, diag_indices, pi, array, bincount, tile, arange, \
+                  flatnonzero, argsort, hstack, add
 import numpy
 try:
     import sympy
@@ -39,13 +38,22 @@ __all__ = ['SpatialNeuron', 'CompartmentalNeuron']
 class SpatialNeuron(NeuronGroup):
     """
     Compartmental model with morphology.
+    
+    With ``copies=K``, the group holds K neurons with the same morphology
+    (but possibly different parameters), which are simulated together. The
+    state variables then have K*len(morphology) values, the compartments of
+    copy k being in the k-th block (i.e., ``neuron.v.reshape((K,-1))[k]``),
+    and ``neuron.copy(k)`` returns copy k as a SpatialNeuron with the usual
+    subtree access (e.g. ``neuron.copy(k).axon.gl``).
     """
     def __init__(self, morphology=None, model=None, threshold=None, reset=NoReset(),
                  refractory=0 * ms, level=0,
                  clock=None, unit_checking=True,
-                 compile=False, freeze=False, Cm=0.9 * uF / cm ** 2, Ri=150 * ohm * cm):
+                 compile=False, freeze=False, Cm=0.9 * uF / cm ** 2, Ri=150 * ohm * cm,
+                 copies=1):
         clock = guess_clock(clock)
-        N = len(morphology) # number of compartments
+        n = len(morphology) # number of compartments
+        N = n * copies
 
         if isinstance(model, str):
             model = Equations(model, level=level + 1)
@@ -102,6 +110,7 @@ class SpatialNeuron(NeuronGroup):
         #self.Cm = Cm # could be a vector?
         self.Cm = ones(len(self))*Cm #  Temporary hack - so that it can be a vector, later
         self.Ri = Ri
+        self.copies = copies
         self._state_updater = SpatialStateUpdater(self, clock)
         #S0 = {}
         # Fill missing units
@@ -115,10 +124,25 @@ class SpatialNeuron(NeuronGroup):
         # Insert morphology
         self.morphology = morphology
         self.morphology.compress(diameter=self.diameter, length=self.length, x=self.x, y=self.y, z=self.z, area=self.area)
+        # The morphology is a view on the first copy
+        for var in ['diameter', 'length', 'x', 'y', 'z', 'area']:
+            values = self.state_(var)
+            values.reshape((copies, n))[1:] = values[:n]
 
     def subgroup(self, N): # Subgrouping cannot be done in this way
         raise NotImplementedError
 
+    def copy(self, k):
+        '''
+        Returns copy number k of the neuron (see ``copies``).
+        '''
+        if k < 0 or k >= self.copies:
+            raise IndexError, "Copy " + str(k) + " does not exist"
+        n = len(self.morphology)
+        N = self[k * n:(k + 1) * n]
+        N.copies = 1
+        return N
+
     def __getitem__(self, x):
         '''
         Subgrouping mechanism.
@@ -127,6 +151,8 @@ class SpatialNeuron(NeuronGroup):
         TODO:
         self[:] returns the full branch.
         '''
+        if self.copies > 1:
+            raise IndexError, "Subtrees must be accessed on one copy of the neuron, e.g. neuron.copy(0)[x]"
         morpho = self.morphology[x]
         N = self[morpho._origin:morpho._origin + len(morpho)]
         N.morphology = morpho
@@ -241,50 +267,118 @@ class SpatialStateUpdater_new(StateUpdater):
         for kid in (morphology.children):
             nbranches+=self.number_branches(kid,n+nbranches,n)
         return nbranches
+
+    def branches(self,morphology):
+        '''
+        Returns the list of branches, in the order of their index numbers
+        (depth-first, see number_branches).
+        '''
+        branches=[morphology]
+        for kid in (morphology.children):
+            branches.extend(self.branches(kid))
+        return branches
     
     def prepare(self):
         '''
         Preparation of data structures.
         See the relevant document.
+        
+        The systems are built for one copy of the morphology (the first n
+        compartments), and then repeated for all copies, with the membrane
+        capacitance of each compartment of each copy: the banded systems
+        of the copies are solved as a single system (they are independent
+        because the first compartment of each copy has no axial current),
+        and the system connecting branches is solved for all copies at once.
         '''
+        n=len(self.neuron.morphology) # number of compartments of one copy
+        K=self.neuron.copies
         # Correction for soma (a bit of a hack), so that it has negligible axial resistance
         if self.neuron.morphology.type=='soma':
-            self.neuron.length[0]=self.neuron.diameter[0]*0.01
+            self.neuron.length[::n]=self.neuron.diameter[0]*0.01
+        diameter,length,area=self.neuron.diameter[:n],self.neuron.length[:n],self.neuron.area[:n]
         # Inverse axial resistance
-        self.invr=zeros(len(self.neuron))
-        self.invr[1:]=pi/(2*self.neuron.Ri)*(self.neuron.diameter[:-1]*self.neuron.diameter[1:])/\
-                   (self.neuron.length[:-1]+self.neuron.length[1:])
+        self.invr=zeros(n)
+        self.invr[1:]=pi/(2*self.neuron.Ri)*(diameter[:-1]*diameter[1:])/\
+                   (length[:-1]+length[1:])
         # Note: this would give nan for the soma
         self.cut_branches(self.neuron.morphology)
         
         # Linear systems
         # The particular solution
         '''a[i,j]=ab[u+i-j,j]''' # u is the number of upper diagonals = 1
-        self.ab_star=zeros((3,len(self.neuron)))
-        self.ab_star[0,1:]=self.invr[1:]/self.neuron.area[:-1]
-        self.ab_star[2,:-1]=self.invr[1:]/self.neuron.area[1:]
-        self.ab_star[1,:]=-self.neuron.Cm/self.neuron.clock.dt-self.invr/self.neuron.area
-        self.ab_star[1,:-1]-=self.invr[1:]/self.neuron.area[:-1]
+        self.ab_star=zeros((3,n))
+        self.ab_star[0,1:]=self.invr[1:]/area[:-1]
+        self.ab_star[2,:-1]=self.invr[1:]/area[1:]
+        self.ab_star[1,:]=-self.invr/area
+        self.ab_star[1,:-1]-=self.invr[1:]/area[:-1]
         # Homogeneous solutions
-        self.ab_plus=zeros((3,len(self.neuron)))
-        self.ab_minus=zeros((3,len(self.neuron)))
+        self.ab_plus=zeros((3,n))
+        self.ab_minus=zeros((3,n))
         self.ab_plus[:]=self.ab_star
         self.ab_minus[:]=self.ab_star
-        self.b_plus=zeros(len(self.neuron))
-        self.b_minus=zeros(len(self.neuron))
-        # Solutions
-        self.v_star=zeros(len(self.neuron))
-        self.u_plus=zeros(len(self.neuron))
-        self.u_minus=zeros(len(self.neuron))
+        self.b_plus=zeros(n)
+        self.b_minus=zeros(n)
         
         # Boundary conditions
         self.boundary_conditions(self.neuron.morphology)
         
+        # Repeat the systems for all copies
+        self.ab_star=tile(self.ab_star,(1,K))
+        self.ab_plus=tile(self.ab_plus,(1,K))
+        self.ab_minus=tile(self.ab_minus,(1,K))
+        self.b_plus=tile(self.b_plus,K)
+        self.b_minus=tile(self.b_minus,K)
+        # Capacitance term, which may differ between copies
+        for ab in self.ab_star,self.ab_plus,self.ab_minus:
+            ab[1,:]-=self.neuron.Cm/self.neuron.clock.dt
+        # Solutions
+        self.v_star=zeros(n*K)
+        self.u_plus=zeros(n*K)
+        self.u_minus=zeros(n*K)
+        
         # Linear system for connecting branches
-        n=1+self.number_branches(self.neuron.morphology) # number of nodes (2 for the root)
-        self.P=zeros((n,n)) # matrix
-        self.B=zeros(n) # vector RHS
-        self.V=zeros(n) # solution = voltages at nodes
+        # Node 0 is the start of the root branch and node i is the end of branch
+        # number i-1. Each node is only connected to its parent node and to its
+        # children, and branches are numbered depth-first, so the parent of a node
+        # always has a lower number: the system can be solved in O(n) by Hines'
+        # method (see solve_tree).
+        # There is one such system per copy, the values for all copies are
+        # stored in arrays of shape (number of nodes, K).
+        self.number_branches(self.neuron.morphology)
+        branches=self.branches(self.neuron.morphology)
+        nnodes=1+len(branches) # number of nodes (2 for the root)
+        self.first=array([branch._origin for branch in branches]) # first compartments
+        self.last=array([branch._origin+len(branch.x)-1 for branch in branches]) # last compartments
+        self.invr0=array([branch.invr0 for branch in branches])
+        self.invrn=array([branch.invrn for branch in branches])
+        self.parent=array([0]+[branch.parent+1 for branch in branches]) # parent node of each node
+        # Indexes of the parent nodes of branches 1... in the flattened node arrays
+        self.parent_index=(self.parent[2:].reshape((-1,1))*K+arange(K)).flatten()
+        # Nodes at the start and end of the branch of each compartment
+        self.start_node=zeros(n,dtype=int)
+        self.end_node=zeros(n,dtype=int)
+        for branch in branches:
+            self.start_node[branch._origin:branch._origin+len(branch.x)]=branch.parent+1
+            self.end_node[branch._origin:branch._origin+len(branch.x)]=branch.index+1
+        self.d=zeros((nnodes,K)) # diagonal of the matrix
+        self.a=zeros((nnodes,K)) # a[i]=P[i,parent[i]]
+        self.b=zeros((nnodes,K)) # b[i]=P[parent[i],i]
+        self.B=zeros((nnodes,K)) # vector RHS
+        self.V=zeros((nnodes,K)) # solution = voltages at nodes
+        # Levels of the tree for solve_tree: the nodes of a level only depend
+        # on their parents, so that each level is processed with array
+        # operations. Nodes are sorted by parent in each level, so that the
+        # values of the children of a node can be summed with reduceat.
+        depth=zeros(nnodes,dtype=int)
+        for i in xrange(1,nnodes):
+            depth[i]=depth[self.parent[i]]+1
+        self.levels=[]
+        for level in xrange(depth.max(),0,-1): # deepest level first
+            nodes=flatnonzero(depth==level)
+            nodes=nodes[argsort(self.parent[nodes],kind='mergesort')]
+            parents=self.parent[nodes]
+            first=flatnonzero(hstack((True,parents[1:]!=parents[:-1])))
+            self.levels.append((nodes,parents,first,parents[first]))
 
     def boundary_conditions(self,morphology):
         '''
@@ -347,51 +441,70 @@ class SpatialStateUpdater_new(StateUpdater):
         ab[1,:]-=neuron._gtot
         self.u_minus[:]=solve_banded((1,1),ab,b,overwrite_ab=True,overwrite_b=True)
         # Solve the linear system connecting branches
-        self.P[:]=0
-        self.B[:]=0
-        self.fill_matrix(self.neuron.morphology)
-        self.V = solve(self.P,self.B)
+        self.fill_matrix()
+        self.solve_tree()
         # Calculate solutions by linear combination
-        self.linear_combination(self.neuron.morphology)
-        
-    def linear_combination(self,morphology):
+        K=self.neuron.copies
+        v_star,u_plus,u_minus=[u.reshape((K,-1)) for u in self.v_star,self.u_plus,self.u_minus]
+        neuron.v=(v_star+self.V[self.start_node].T*u_minus+self.V[self.end_node].T*u_plus).flatten()
+
+    def fill_matrix(self):
         '''
-        Calculates solutions by linear combination
+        Fills the matrix of the linear system that connects branches together
+        (diagonal d, coefficients a and b with the parent nodes, RHS B).
         '''
-        first=morphology._origin # first compartment
-        last=first+len(morphology.x)-1 # last compartment
-        i=morphology.index+1
-        i_parent=morphology.parent+1
-        self.neuron.v[first:last+1]=self.v_star[first:last+1]+self.V[i_parent]*self.u_minus[first:last+1]\
-                                                             +self.V[i]*self.u_plus[first:last+1]
-        # Recursive call
-        for kid in (morphology.children):
-            self.linear_combination(kid)
+        K=self.neuron.copies
+        # Solutions as arrays of shape (compartments of one copy, K)
+        v_star,u_plus,u_minus=[u.reshape((K,-1)).T for u in self.v_star,self.u_plus,self.u_minus]
+        first,last=self.first,self.last
+        invr0,invrn=self.invr0.reshape((-1,1)),self.invrn.reshape((-1,1))
+        # Towards children (node i is the end of branch i-1)
+        self.d[1:]=(1-u_plus[last])*invrn
+        self.a[1:]=-u_minus[last]*invrn
+        self.B[1:]=v_star[last]*invrn
+        # Towards parent
+        # First branch, sealed end
+        self.d[0]=u_minus[first[0]]-1
+        self.b[1]=u_plus[first[0]]
+        self.B[0]=-v_star[first[0]]
+        # Other branches
+        self.d+=self.sum_to_parents((1-u_minus[first[1:]])*invr0[1:])
+        self.b[2:]=-u_plus[first[1:]]*invr0[1:]
+        self.B+=self.sum_to_parents(v_star[first[1:]]*invr0[1:])
 
-    def fill_matrix(self,morphology):
+    def sum_to_parents(self,values):
         '''
-        Recursively fills the matrix of the linear system that connects branches together.
+        Sums the values of branches 1... (array of shape (branches-1,K)) into
+        their parent nodes.
         '''
-        first=morphology._origin # first compartment
-        last=first+len(morphology.x)-1 # last compartment
-        i=morphology.index+1
-        i_parent=morphology.parent+1
-        # Towards parent
-        if i==1: # first branch, sealed end
-            self.P[0,0]=self.u_minus[first]-1
-            self.P[0,1]=self.u_plus[first]
-            self.B[0]=-self.v_star[first]
-        else:
-            self.P[i_parent,i_parent]+=(1-self.u_minus[first])*morphology.invr0
-            self.P[i_parent,i]-=self.u_plus[first]*morphology.invr0
-            self.B[i_parent]+=self.v_star[first]*morphology.invr0
-        # Towards children
-        self.P[i,i]=(1-self.u_plus[last])*morphology.invrn
-        self.P[i,i_parent]=-self.u_minus[last]*morphology.invrn
-        self.B[i]=self.v_star[last]*morphology.invrn
-        # Recursive call
-        for kid in (morphology.children):
-            self.fill_matrix(kid)
+        sums=zeros(self.d.size)
+        if len(self.parent_index): # (bincount has no minlength in numpy<1.6)
+            counts=bincount(self.parent_index,values.flatten())
+            sums[:len(counts)]=counts
+        return sums.reshape(self.d.shape)
+
+    def solve_tree(self):
+        '''
+        Solves the linear system that connects branches together with Hines'
+        method: each node is eliminated into its parent, starting from the last
+        one (parents have lower numbers), then the voltages are obtained from
+        the root. This destroys d and B. All copies are solved together (each
+        row of the arrays holds the values of one node for all copies).
+        
+        The nodes of each level of the tree are eliminated together (see
+        prepare), so that the loops are over the levels rather than the
+        nodes. There is no compiled version (with weave or an extension
+        module): the system has one node per branch, so that it is small
+        compared to the banded systems of the compartments.
+        '''
+        d,a,b,B,V=self.d,self.a,self.b,self.B,self.V
+        for nodes,parents,first,unique_parents in self.levels:
+            f=b[nodes]/d[nodes]
+            d[unique_parents]-=add.reduceat(f*a[nodes],first)
+            B[unique_parents]-=add.reduceat(f*B[nodes],first)
+        V[0]=B[0]/d[0]
+        for nodes,parents,first,unique_parents in reversed(self.levels):
+            V[nodes]=(B[nodes]-a[nodes]*V[parents])/d[nodes]
 
     def __len__(self):
         '''
@@ -12,7 +12,7 @@ from brian.directcontrol import SpikeGeneratorGroup
 from brian.units import *
 from brian.neurongroup import *
 from brian.directcontrol import SpikeGeneratorThreshold
-from brian.monitor import SpikeMonitor, FileSpikeMonitor
+from brian.monitor import SpikeMonitor, FileSpikeMonitor, BackgroundWriter
 from brian.clock import guess_clock
 from brian.stateupdater import *
 
@@ -247,40 +247,44 @@ def save_AER(spikemonitor, f):
         f.close()
     
 class AERSpikeMonitor(FileSpikeMonitor):
-    """Records spikes to an AER file
-    
+    """Records spikes to an AER file
+    
     Initialised as::
     
-        FileSpikeMonitor(source, filename[, record=False])
+        AERSpikeMonitor(source, filename[, record=False])
     
     Does everything that a :class:`SpikeMonitor` does except ONLY records
-    the spikes to the named file in AER format. 
-
+    the spikes to the named file in AER format, with timestamps in
+    microseconds. As for :class:`FileSpikeMonitor`, the spikes are written
+    by a background thread.
     
-    Has one additional method:
+    Has two additional methods:
     
-    ``close_file()``
+    ``flush()``
+        Waits until all the spikes have been written to the file (this
+        is done automatically at the end of each run).
+    ``close()``
         Closes the file manually (will happen automatically when
         the program ends).
     """
-    def __init__(self, source, filename, record=False, delay=0):
-        super(FileSpikeMonitor, self).__init__(source, record, delay)
-        self.filename = filename
-        self.f = open(filename, 'wb')
-        header = HEADER
-        header += str(datetime.datetime.now()) + '\n'
-        self.f.write(header)
-
+    def open(self):
+        self.f = open(self.filename, 'wb')
+        header = HEADER
+        header += str(datetime.datetime.now()) + '\n'
+        self.f.write(header)
+        self._writer = BackgroundWriter(self.f, self.format)
+
     def propagate(self, spikes):
-#        super(AERSpikeMonitor, self).propagate(spikes)
-        # TODO do it better, no struct.pack! check numpy doc for 
-        
-#        addr = array(spikes).newbyteorder('>')
-        for i in spikes:
-            addr = struct.pack('>i', i)
-            self.f.write(addr)
-            time = struct.pack('>i', int(ceil(float(self.source.clock.t/usecond))))
-            self.f.write(time)
+        if len(spikes):
+            self._writer.write(array(spikes, dtype=int32),
+                               int(ceil(float(self.source.clock.t/usecond))))
+
+    @staticmethod
+    def format(addr, timestamp):
+        x = zeros(2*len(addr), dtype='>i4') # big endian
+        x[::2] = addr
+        x[1::2] = timestamp
+        return x.tostring()
     
 ########### AER addressing stuff ######################
 
@@ -3,6 +3,13 @@ The Bufferable class serves as a base for all the other Brian.hears classes
 '''
 from numpy import zeros, empty, hstack, vstack, arange, diff
 
+def _accepts_out(method):
+    '''
+    Whether the function or method has an ``out`` argument.
+    '''
+    code = getattr(method, 'func_code', None)
+    return code is not None and 'out' in code.co_varnames[:code.co_argcount]
+
 class Bufferable(object):
     '''
     Base class for Brian.hears classes
@@ -33,6 +40,11 @@ class Bufferable(object):
     ``buffer_fetch_next(samples)``
         Returns the next ``samples`` from the buffer.
     
+    The method can also have an ``out`` argument, ``buffer_fetch_next(samples,
+    out=None)``, in which case it may be passed an array of shape
+    ``(samples, nchannels)`` in which it should write the samples (and return
+    it), so that they are written directly into the buffer cache.
+    
     The default methods for ``buffer_init()`` and ``buffer_fetch()`` will
     define a buffer cache which will get larger if it needs to to accommodate
     a ``buffer_fetch(start, end)`` where ``end-start`` is larger than the
@@ -48,6 +60,13 @@ class Bufferable(object):
     filters that need to update on a shorter time window than the overall
     buffer size.
     
+    The cache is stored in an array which is allocated once (and enlarged if
+    a larger segment is requested), split in two halves which are used in
+    turn, and ``buffer_fetch()`` returns views of this array. The arrays
+    returned by ``buffer_fetch()`` are therefore only valid until the next
+    call of ``buffer_fetch()`` or ``buffer_init()`` (after which they may be
+    overwritten), and should be copied if they are kept.
+    
     The following attributes will automatically be maintained:
     
     ``self.cached_buffer_start``, ``self.cached_buffer_end``
@@ -67,7 +86,7 @@ class Bufferable(object):
         if start==self.cached_buffer_start and end==self.cached_buffer_end:
             return self.cached_buffer_output
         if start==self.cached_buffer_end and end-start==self.cached_buffer_output.shape[0]:
-            self.cached_buffer_output = self._buffer_fetch_next(end-start)
+            self.cached_buffer_output = self._buffer_fetch_next_cached(end-start)
             self.cached_buffer_start = start
             self.cached_buffer_end = end
             return self.cached_buffer_output
@@ -91,38 +110,79 @@ class Bufferable(object):
         if hasattr(self, 'minimum_buffer_size'):
             samples = max(samples, self.minimum_buffer_size)
             end = self.cached_buffer_end+samples
-        newsegment = self._buffer_fetch_next(samples)
         # otherwise we have an overlap situation - I guess this won't really
         # happen very often but it has to be handled correctly in case.
         new_end = end
         # if end-start is longer than the size of the current cached buffer, we
         # will have to increase the size of the cache
         new_start = min(new_end-self.cached_buffer_output.shape[0], start)
-        new_size = new_end-new_start
-        new_output = empty((new_size, self.nchannels))
-        if samples!=new_size:
-            new_output[:new_size-samples, :] = self.cached_buffer_output[samples-new_size:, :]
-        new_output[new_size-samples:, :] = newsegment
+        # number of samples of the current cache which are kept
+        kept = self.cached_buffer_end-new_start
+        if kept<=0:
+            new_output = self._buffer_fetch_next_cached(samples)
+        else:
+            new_output = self._buffer_window(kept+samples)
+            new_output[:kept, :] = self.cached_buffer_output[-kept:, :]
+            newsegment = new_output[kept:, :]
+            output = self._buffer_fetch_next(samples, newsegment)
+            if output is not newsegment:
+                newsegment[:] = output
         self.cached_buffer_output = new_output
-        self.cached_buffer_start = new_start
+        self.cached_buffer_start = new_end-new_output.shape[0]
         self.cached_buffer_end = new_end
         # return only those values up to the requested end point
         return new_output[start-self.cached_buffer_start:req_end-self.cached_buffer_start, :]
     
-    def _buffer_fetch_next(self, samples):
+    def _buffer_window(self, samples):
+        # Returns an array of shape (samples, nchannels) in the half of the
+        # cache storage which was not used by the previous fetch, so that the
+        # arrays returned by the previous fetch are not overwritten
+        storage = self._buffer_storage
+        if storage.shape[0]<2*samples:
+            storage = self._buffer_storage = empty((2*samples, self.nchannels))
+        self._buffer_half = 1-self._buffer_half
+        i = self._buffer_half*(storage.shape[0]//2)
+        return storage[i:i+samples, :]
+    
+    def _buffer_writes_out(self):
+        # Whether buffer_fetch_next writes the samples into its out argument
+        return _accepts_out(self.buffer_fetch_next)
+    
+    def _buffer_fetch_next_cached(self, samples):
+        # Returns the next samples, written directly into the cache storage
+        # if possible
+        if self._buffer_writes_out() or \
+           samples>getattr(self, 'maximum_buffer_size', samples):
+            return self._buffer_fetch_next(samples, self._buffer_window(samples))
+        return self._buffer_fetch_next(samples)
+    
+    def _buffer_fetch_next(self, samples, out=None):
+        # Returns the next samples, written into out if buffer_fetch_next has
+        # an out argument (otherwise the array returned by buffer_fetch_next
+        # is returned as it is).
         # This method checks if there is a maximum buffer size, and if so
-        # splits the buffer_fetch_next into multiple pieces of at most this size
-        if not hasattr(self, 'maximum_buffer_size'):
+        # splits the buffer_fetch_next into multiple pieces of at most this
+        # size, written into out
+        if not hasattr(self, 'maximum_buffer_size') or samples<=self.maximum_buffer_size:
+            if out is not None and _accepts_out(self.buffer_fetch_next):
+                return self.buffer_fetch_next(samples, out=out)
             return self.buffer_fetch_next(samples)
+        if out is None:
+            out = empty((samples, self.nchannels))
         bufsize = self.maximum_buffer_size
-        endpoints = hstack((arange(0, samples, bufsize), samples))
-        sizes = diff(endpoints)
-        return vstack(tuple(self.buffer_fetch_next(size) for size in sizes))
+        for i in xrange(0, samples, bufsize):
+            piece = out[i:i+bufsize, :]
+            output = self._buffer_fetch_next(piece.shape[0], piece)
+            if output is not piece:
+                piece[:] = output
+        return out
     
     def buffer_init(self):
         self.cached_buffer_output = zeros((0, self.nchannels))
         self.cached_buffer_start = 0
         self.cached_buffer_end = 0
+        self._buffer_storage = zeros((0, self.nchannels))
+        self._buffer_half = 0
     
     def buffer_fetch_next(self, samples):
         raise NotImplementedError
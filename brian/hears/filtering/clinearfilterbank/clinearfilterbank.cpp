@@ -0,0 +1,173 @@
+#include "clinearfilterbank.h"
+#include<stdexcept>
+#ifdef _OPENMP
+#include<omp.h>
+#endif
+
+// The channels are filtered in blocks of CHANNEL_BLOCK channels (filtered in
+// parallel by different threads), and the samples in chunks of SAMPLE_CHUNK
+// samples, which are filtered by each stage of the cascade in turn, so that
+// the coefficients, state and samples of a stage stay in the cache. The inner
+// loops are over channels, which are contiguous in all the arrays.
+#define CHANNEL_BLOCK 32
+#define SAMPLE_CHUNK 64
+
+// Cascade of direct form II transposed filters. If interpolate is true, the
+// coefficients at sample s are b0+t*(b-b0) (and the same for a), with
+// t=(s+1)/numsamples, otherwise they are b and a (b0 and a0 are not used).
+template<bool interpolate>
+void linear_filterbank(const double *b0, const double *a0, const double *b,
+                       const double *a, double *zi, const double *x, double *y,
+                       int n, int m, int p, int numsamples, int numthreads)
+{
+	int numblocks = (n+CHANNEL_BLOCK-1)/CHANNEL_BLOCK;
+#ifdef _OPENMP
+	if(numthreads<=0)
+		numthreads = omp_get_max_threads();
+	if(numthreads>numblocks)
+		numthreads = numblocks;
+	#pragma omp parallel for schedule(static) num_threads(numthreads) if(numthreads>1)
+#endif
+	for(int block=0; block<numblocks; block++)
+	{
+		int j0 = block*CHANNEL_BLOCK;
+		int nj = n-j0<CHANNEL_BLOCK ? n-j0 : CHANNEL_BLOCK;
+		double buf[SAMPLE_CHUNK][CHANNEL_BLOCK];
+		for(int s0=0; s0<numsamples; s0+=SAMPLE_CHUNK)
+		{
+			int ns = numsamples-s0<SAMPLE_CHUNK ? numsamples-s0 : SAMPLE_CHUNK;
+			for(int s=0; s<ns; s++)
+				for(int j=0; j<nj; j++)
+					buf[s][j] = x[(s0+s)*n+j0+j];
+			for(int k=0; k<p; k++)
+			{
+				const double * __restrict__ B0 = b0+k*n*m+j0;
+				const double * __restrict__ A0 = a0+k*n*m+j0;
+				const double * __restrict__ B = b+k*n*m+j0;
+				const double * __restrict__ A = a+k*n*m+j0;
+				double * __restrict__ Z = zi+k*n*m+j0;
+				for(int s=0; s<ns; s++)
+				{
+					const double t = interpolate ? (double)(s0+s+1)/numsamples : 1.0;
+					#define COEF(P0, P, idx) (interpolate ? P0[idx]+t*(P[idx]-P0[idx]) : P[idx])
+					double * __restrict__ v = buf[s];
+					double w[CHANNEL_BLOCK];
+					for(int j=0; j<nj; j++)
+						w[j] = COEF(B0, B, j)*v[j]+Z[j];
+					for(int i=0; i<m-2; i++)
+						for(int j=0; j<nj; j++)
+							Z[i*n+j] = COEF(B0, B, (i+1)*n+j)*v[j]+Z[(i+1)*n+j]-COEF(A0, A, (i+1)*n+j)*w[j];
+					if(m>1)
+						for(int j=0; j<nj; j++)
+							Z[(m-2)*n+j] = COEF(B0, B, (m-1)*n+j)*v[j]-COEF(A0, A, (m-1)*n+j)*w[j];
+					#undef COEF
+					for(int j=0; j<nj; j++)
+						v[j] = w[j];
+				}
+			}
+			for(int s=0; s<ns; s++)
+				for(int j=0; j<nj; j++)
+					y[(s0+s)*n+j0+j] = buf[s][j];
+		}
+	}
+}
+
+void apply_linear_filterbank(double *b, int nb, double *a, int na,
+                             double *zi, int nzi, double *x, int nx,
+                             double *y, int ny, int n, int m, int p,
+                             int numthreads)
+{
+	if(n<=0 || m<=0 || p<=0 || nb!=n*m*p || na!=n*m*p || nzi!=n*m*p ||
+	   nx!=ny || nx%n!=0)
+		throw std::runtime_error("Data has wrong shape.");
+	linear_filterbank<false>(b, a, b, a, zi, x, y, n, m, p, nx/n, numthreads);
+}
+
+void apply_linear_filterbank_interpolated(double *b0, int nb0, double *a0, int na0,
+                                          double *b, int nb, double *a, int na,
+                                          double *zi, int nzi, double *x, int nx,
+                                          double *y, int ny, int n, int m, int p,
+                                          int numthreads)
+{
+	if(n<=0 || m<=0 || p<=0 || nb0!=n*m*p || na0!=n*m*p || nb!=n*m*p ||
+	   na!=n*m*p || nzi!=n*m*p || nx!=ny || nx%n!=0)
+		throw std::runtime_error("Data has wrong shape.");
+	linear_filterbank<true>(b0, a0, b, a, zi, x, y, n, m, p, nx/n, numthreads);
+}
+
+// Biquad cascade for SOSFilterbank, in single or double precision
+template<class T>
+void sos_filterbank(T *sos, int nsos, T *state, int nstate, T *x, int nx,
+                    T *y, int ny, int n, int p, int numthreads)
+{
+	if(n<=0 || p<=0 || nsos!=n*p*6 || nstate!=n*p*2 || nx!=ny || nx%n!=0)
+		throw std::runtime_error("Data has wrong shape.");
+	int numsamples = nx/n;
+	int numblocks = (n+CHANNEL_BLOCK-1)/CHANNEL_BLOCK;
+#ifdef _OPENMP
+	if(numthreads<=0)
+		numthreads = omp_get_max_threads();
+	if(numthreads>numblocks)
+		numthreads = numblocks;
+	#pragma omp parallel for schedule(static) num_threads(numthreads) if(numthreads>1)
+#endif
+	for(int block=0; block<numblocks; block++)
+	{
+		int j0 = block*CHANNEL_BLOCK;
+		int nj = n-j0<CHANNEL_BLOCK ? n-j0 : CHANNEL_BLOCK;
+		T buf[SAMPLE_CHUNK][CHANNEL_BLOCK];
+		T b0[CHANNEL_BLOCK], b1[CHANNEL_BLOCK], b2[CHANNEL_BLOCK];
+		T a1[CHANNEL_BLOCK], a2[CHANNEL_BLOCK];
+		T z0[CHANNEL_BLOCK], z1[CHANNEL_BLOCK];
+		for(int s0=0; s0<numsamples; s0+=SAMPLE_CHUNK)
+		{
+			int ns = numsamples-s0<SAMPLE_CHUNK ? numsamples-s0 : SAMPLE_CHUNK;
+			for(int s=0; s<ns; s++)
+				for(int j=0; j<nj; j++)
+					buf[s][j] = x[(s0+s)*n+j0+j];
+			for(int k=0; k<p; k++)
+			{
+				// coefficients and state of the biquads of the block
+				for(int j=0; j<nj; j++)
+				{
+					const T *c = sos+((j0+j)*p+k)*6;
+					b0[j] = c[0]; b1[j] = c[1]; b2[j] = c[2];
+					a1[j] = c[4]; a2[j] = c[5];
+					z0[j] = state[((j0+j)*p+k)*2];
+					z1[j] = state[((j0+j)*p+k)*2+1];
+				}
+				for(int s=0; s<ns; s++)
+					for(int j=0; j<nj; j++)
+					{
+						T v = buf[s][j];
+						T w = b0[j]*v+z0[j];
+						z0[j] = b1[j]*v+z1[j]-a1[j]*w;
+						z1[j] = b2[j]*v-a2[j]*w;
+						buf[s][j] = w;
+					}
+				for(int j=0; j<nj; j++)
+				{
+					state[((j0+j)*p+k)*2] = z0[j];
+					state[((j0+j)*p+k)*2+1] = z1[j];
+				}
+			}
+			for(int s=0; s<ns; s++)
+				for(int j=0; j<nj; j++)
+					y[(s0+s)*n+j0+j] = buf[s][j];
+		}
+	}
+}
+
+void apply_sos_filterbank(double *sos, int nsos, double *state, int nstate,
+                          double *x, int nx, double *y, int ny, int n, int p,
+                          int numthreads)
+{
+	sos_filterbank<double>(sos, nsos, state, nstate, x, nx, y, ny, n, p, numthreads);
+}
+
+void apply_sos_filterbank_float(float *sos, int nsos, float *state, int nstate,
+                                float *x, int nx, float *y, int ny, int n, int p,
+                                int numthreads)
+{
+	sos_filterbank<float>(sos, nsos, state, nstate, x, nx, y, ny, n, p, numthreads);
+}
@@ -0,0 +1,49 @@
+#ifndef _BRIAN_CLINEARFILTERBANK_H
+#define _BRIAN_CLINEARFILTERBANK_H
+
+/*
+ * Compiled kernel of LinearFilterbank (see
+ * brian/hears/filtering/linearfilterbank.py).
+ *
+ * Applies a cascade of p direct form II transposed filters of order m-1
+ * to each of n channels. b, a and zi are the flattened Fortran-ordered
+ * (n, m, p) arrays filt_b, filt_a and filt_state (a[:, 0, :] is assumed to
+ * be 1), x and y are the flattened C-ordered (numsamples, n) input and
+ * output. zi is updated in place.
+ *
+ * Blocks of channels are filtered in parallel with OpenMP (if the module
+ * was compiled with OpenMP), with numthreads threads (0 for the OpenMP
+ * default).
+ */
+void apply_linear_filterbank(double *b, int nb, double *a, int na,
+                             double *zi, int nzi, double *x, int nx,
+                             double *y, int ny, int n, int m, int p,
+                             int numthreads);
+
+/*
+ * Same as apply_linear_filterbank, with coefficients interpolated linearly
+ * from b0, a0 to b, a over the buffer (for TimeVaryingLinearFilterbank):
+ * the coefficients at sample s are b0+(s+1)/numsamples*(b-b0), so that b and
+ * a are used for the last sample.
+ */
+void apply_linear_filterbank_interpolated(double *b0, int nb0, double *a0, int na0,
+                                          double *b, int nb, double *a, int na,
+                                          double *zi, int nzi, double *x, int nx,
+                                          double *y, int ny, int n, int m, int p,
+                                          int numthreads);
+
+/*
+ * Compiled kernel of SOSFilterbank: applies a cascade of p biquads to each
+ * of n channels. sos and state are the flattened C-ordered (n, p, 6) and
+ * (n, p, 2) arrays of coefficients ([b0, b1, b2, a0, a1, a2], a0 is assumed
+ * to be 1) and states, x and y are the flattened C-ordered (numsamples, n)
+ * input and output. There is a single and a double precision version.
+ */
+void apply_sos_filterbank(double *sos, int nsos, double *state, int nstate,
+                          double *x, int nx, double *y, int ny, int n, int p,
+                          int numthreads);
+void apply_sos_filterbank_float(float *sos, int nsos, float *state, int nstate,
+                                float *x, int nx, float *y, int ny, int n, int p,
+                                int numthreads);
+
+#endif
@@ -0,0 +1,28 @@
+%module(threads="1") clinearfilterbank
+%include "exception.i"
+
+%exception {
+	try {
+		$action
+	} catch( std::runtime_error &e ) {
+		PyErr_SetString(PyExc_ValueError, const_cast<char *>(e.what()));
+		return NULL;
+	}
+}
+
+%{
+#define SWIG_FILE_WITH_INIT
+#include<stdexcept>
+#include "clinearfilterbank.h"
+%}
+
+%include "numpy.i"
+%init %{
+	import_array();
+%}
+
+%apply (double* INPLACE_ARRAY1, int DIM1) {(double *b, int nb), (double *a, int na), (double *zi, int nzi), (double *x, int nx), (double *y, int ny), (double *b0, int nb0), (double *a0, int na0)};
+%apply (double* INPLACE_ARRAY1, int DIM1) {(double *sos, int nsos), (double *state, int nstate)};
+%apply (float* INPLACE_ARRAY1, int DIM1) {(float *sos, int nsos), (float *state, int nstate), (float *x, int nx), (float *y, int ny)};
+
+%include "clinearfilterbank.h"
@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+
+"""
+setup.py file for the compiled kernel of LinearFilterbank
+"""
+
+from distutils.core import setup, Extension
+import os, sys, numpy
+numpy_base_dir = os.path.split(numpy.__file__)[0]
+numpy_include_dir = os.path.join(numpy_base_dir, 'core/include')
+
+if sys.platform.startswith('linux'):
+    openmp_args = ['-fopenmp']
+else:
+    openmp_args = []
+
+clinearfilterbank_module = Extension('_clinearfilterbank',
+                           sources=['clinearfilterbank_wrap.cxx',
+                                    'clinearfilterbank.cpp',
+                                    ],
+                           include_dirs=[numpy_include_dir],
+                           extra_compile_args=['-O3']+openmp_args,
+                           extra_link_args=openmp_args,
+                           )
+
+setup (name='clinearfilterbank',
+       version='0.1',
+       description="""Compiled kernel of LinearFilterbank""",
+       ext_modules=[clinearfilterbank_module],
+       py_modules=["clinearfilterbank"],
+       )
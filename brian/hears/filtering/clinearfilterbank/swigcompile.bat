@@ -0,0 +1,3 @@
+@echo off
+swig -python -c++ clinearfilterbank.i
+setup.py build_ext --inplace %*
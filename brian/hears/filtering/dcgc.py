@@ -75,7 +75,8 @@ class AsymCompUpdate:
          frat = self.frat0 + self.frat1*level_dB
          fr2 = self.fp1*frat
          self.iteration+=1
-         self.target.filt_b, self.target.filt_a=asymmetric_compensation_coeffs(self.samplerate,fr2,self.target.filt_b,self.target.filt_a,self.b,self.c,self.p0,self.p1,self.p2,self.p3,self.p4)
+         # the coefficients of the target are modified in place
+         asymmetric_compensation_coeffs(self.samplerate,fr2,self.target.filt_b,self.target.filt_a,self.b,self.c,self.p0,self.p1,self.p2,self.p3,self.p4)
  
 class DCGC(CombinedFilterbank):
     '''
@@ -115,6 +116,11 @@ class DCGC(CombinedFilterbank):
         Dictionary used to overwrite the default parameters given in the
         original paper.
     
+    ``interpolate``
+        If ``True``, the coefficients of the signal pathway are interpolated
+        linearly at each sample between two updates (see
+        :class:`TimeVaryingLinearFilterbank`).
+    
     The possible parameters to change and their default values (see Irino, T.
     and Patterson R., "A Dynamic Compressive Gammachirp 
     Auditory Filterbank", IEEE Trans Audio Speech Lang Processing) are::
@@ -138,7 +144,7 @@ class DCGC(CombinedFilterbank):
       param['ERBwidth']= 24.7*(4.37*cf/1000 + 1)
     '''
     
-    def __init__(self, source,cf,update_interval=1,param={}):
+    def __init__(self, source,cf,update_interval=1,param={},interpolate=False):
         
         CombinedFilterbank.__init__(self, source)
         source = self.get_modified_source()
@@ -163,7 +169,9 @@ class DCGC(CombinedFilterbank):
         
         #### Signal Path ####
         fr1=fp1*parameters['frat0']
-        signal_path= AsymmetricCompensation(pGc, fr1,b=parameters['b2'], c=parameters['c2'])
+        asym_comp= AsymmetricCompensation(pGc, fr1,b=parameters['b2'], c=parameters['c2'])
+        signal_path= TimeVaryingLinearFilterbank(pGc, asym_comp.filt_b, asym_comp.filt_a,
+                                                 interpolate=interpolate)
 #        self.asym_comp.filt_b=signal_path.filt_b
 #        self.asym_comp.filt_a=signal_path.filt_a
         #### Controler #### 
@@ -7,7 +7,7 @@ except ImportError:
     except ImportError:
         weave = None
 from scipy import signal, random
-from ..bufferable import Bufferable
+from ..bufferable import Bufferable, _accepts_out
 from operator import isSequenceType
 from __builtin__ import all
 
@@ -63,7 +63,11 @@ class Filterbank(Bufferable):
     that fetches the next input, and calls the ``buffer_apply(input)``
     method on it, which can be overridden by a derived class. This is typically
     the easiest way to implement a new filterbank. Filterbanks with multiple
-    sources will need to override this default implementation.
+    sources will need to override this default implementation. If
+    ``buffer_apply`` has an ``out`` argument, as in
+    ``buffer_apply(input, out=None)``, it can write its output directly into
+    the array ``out`` (of shape ``(samples, nchannels)``) and return it, so
+    that the output is not copied into the cache (see :class:`Bufferable`).
     
     There is a default ``__init__`` method that can be called by a derived class
     that sets the ``source``, ``nchannels`` and ``samplerate`` from that of the
@@ -215,7 +219,17 @@ class Filterbank(Bufferable):
         zendpoints = zip(endpoints[:-1], endpoints[1:])
         #sizes = diff(endpoints)
         if func is None:
-            return vstack(tuple(self.buffer_fetch(start, end) for start, end in zendpoints))
+            # the fetched arrays are only valid until the next fetch, so they
+            # are copied into the output
+            output = None
+            for start, end in zendpoints:
+                input = self.buffer_fetch(start, end)
+                if output is None:
+                    output = empty((duration, self.nchannels), dtype=input.dtype)
+                output[start:end, :] = input
+            if output is None:
+                output = zeros((0, self.nchannels))
+            return output
         else:
             if func.func_code.co_argcount==1:
                 for start, end in zendpoints:
@@ -238,12 +252,21 @@ class Filterbank(Bufferable):
     def buffer_apply(self, input):
         raise NotImplementedError
 
-    def buffer_fetch_next(self, samples):
+    def buffer_fetch_next(self, samples, out=None):
         start = self.next_sample
         self.next_sample += samples
         end = start+samples
         input = self.source.buffer_fetch(start, end)
+        if out is not None and _accepts_out(self.buffer_apply):
+            return self.buffer_apply(input, out=out)
         return self.buffer_apply(input)
+
+    def _buffer_writes_out(self):
+        # The default buffer_fetch_next only writes into out if buffer_apply
+        # does
+        if getattr(self.buffer_fetch_next, 'im_func', None) is Filterbank.buffer_fetch_next.im_func:
+            return _accepts_out(self.buffer_apply)
+        return Bufferable._buffer_writes_out(self)
     
     def __add__ (self, other):
         if isinstance(other, Bufferable):
@@ -710,6 +733,8 @@ class ControlFilterbank(Filterbank):
             
     def buffer_init(self):
         Filterbank.buffer_init(self)
+        for x in self.inputs:
+            x.buffer_init()
         if hasattr(self.updater, 'reinit'):
             self.updater.reinit()
     
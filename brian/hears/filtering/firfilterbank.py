@@ -6,10 +6,47 @@ previous inputs. For the moment, we implement it as a special case of
 LinearFilterbank but later this will change to using the FFT method.
 '''
 from brian import *
+from scipy.fftpack import rfft, irfft
 from filterbank import *
 from linearfilterbank import *
 
-__all__ = ['FIRFilterbank', 'LinearFIRFilterbank', 'FFTFIRFilterbank']
+__all__ = ['FIRFilterbank', 'LinearFIRFilterbank', 'FFTFIRFilterbank',
+           'PartitionedFIRFilterbank']
+
+def fast_fft_size(n):
+    '''
+    Returns the smallest even integer greater than or equal to ``n`` whose
+    prime factors are only 2, 3 and 5 (the FFT is fastest for these sizes).
+    '''
+    best = 2**int(ceil(log2(max(n, 2))))
+    p5 = 1
+    while p5<best:
+        p35 = p5
+        while p35<best:
+            p = 2*p35
+            while p<n:
+                p *= 2
+            best = min(best, p)
+            p35 *= 3
+        p5 *= 5
+    return best
+
+def multiply_packed_spectra(X, H):
+    '''
+    Multiplies in place the spectra ``X`` by the spectra ``H``, both C
+    contiguous arrays of shape ``(nchannels, n)`` for an even ``n``, in the
+    packed real format of ``scipy.fftpack.rfft``.
+    '''
+    # The format is [y(0),Re(y(1)),Im(y(1)),...,Re(y(n/2-1)),Im(y(n/2-1)),y(n/2)]
+    # so that the flattened arrays without their first and last elements
+    # can be seen as complex arrays, where the pairs (y(n/2),y(0)) between
+    # two channels are multiplied separately.
+    first = X[:, 0]*H[:, 0]
+    last = X[:, -1]*H[:, -1]
+    Xc = X.reshape(-1)[1:-1].view(complex)
+    Xc *= H.reshape(-1)[1:-1].view(complex)
+    X[:, 0] = first
+    X[:, -1] = last
 
 class LinearFIRFilterbank(LinearFilterbank):
     def __init__(self, source, impulse_response, minimum_buffer_size=None):
@@ -35,6 +72,8 @@ class LinearFIRFilterbank(LinearFilterbank):
             self.minimum_buffer_size = minimum_buffer_size
 
 class FFTFIRFilterbank(Filterbank):
+    # Blocks of input filtered with one FFT, in multiples of the IR length
+    fft_block_factor = 15
     def __init__(self, source, impulse_response, minimum_buffer_size=None):
         # if a 1D impulse response is given we apply it to every channel
         # Note that because we are using LinearFilterbank at the moment, this
@@ -54,6 +93,7 @@ class FFTFIRFilterbank(Filterbank):
         self.input_cache = zeros((impulse_response.shape[1], self.nchannels))
         self.impulse_response = impulse_response
         self.fftcache_nmax = -1
+        self._fft_sizes = {}
         if minimum_buffer_size is None:
             minimum_buffer_size = 3*impulse_response.shape[1]
         self.minimum_buffer_size = minimum_buffer_size
@@ -62,74 +102,222 @@ class FFTFIRFilterbank(Filterbank):
         Filterbank.buffer_init(self)
         self.input_cache[:] = 0
 
-    # This version uses a single FFT/IFFT call, using the axis keyword, but it
-    # doesn't appear to be any more efficient than looping, and uses much more
-    # memory, although my tests weren't exhaustive.
-#    def buffer_apply(self, input):
-#        nmax = max(self.input_cache.shape[0]+input.shape[0], self.impulse_response.shape[1])
-#        nmax = 2**int(ceil(log2(nmax)))
-#        if self.fftcache_nmax!=nmax:
-#            # impulse response: (nchannels, ir_length)
-#            ir = zeros((self.nchannels, nmax))
-#            ir[:, :self.impulse_response.shape[1]] = self.impulse_response
-#            # fftcache: (ir_length, nchannels)
-#            self.fftcache = fft(ir, n=nmax, axis=1).T
-#            self.fftcache_nmax = nmax
-#        fullinput = vstack((self.input_cache, input))
-#        fullinput = vstack((fullinput, zeros((nmax-fullinput.shape[1], self.nchannels))))
-#        # fullinput: (ir_length, nchannels)
-#        fullinput_fft = fft(fullinput, n=nmax, axis=0)
-#        fulloutput_fft = fullinput_fft*self.fftcache
-#        fulloutput = ifft(fulloutput_fft, n=nmax, axis=0).real
-#        output = fulloutput[self.input_cache.shape[0]:self.input_cache.shape[0]+input.shape[0]]
-#        # update input cache
-#        nic = self.input_cache.shape[0]
-#        ni = input.shape[0]
-#        #print ni, nic
-#        if ni>=nic:
-#            self.input_cache[:, :] = input[-nic:, :]
-#        else:
-#            self.input_cache[:-ni, :] = self.input_cache[ni:, :]
-#            self.input_cache[-ni:, :] = input
-#        return output
-    
+    def fft_size(self, samples):
+        '''
+        Returns the FFT size and the number of samples filtered per FFT to
+        filter buffers of the given number of samples. Large buffers are
+        split in blocks of ``fft_block_factor*ir_length`` samples.
+        '''
+        if samples not in self._fft_sizes:
+            nic = self.input_cache.shape[0]
+            blocksize = min(samples, max(self.fft_block_factor*nic, 4096))
+            nfft = fast_fft_size(nic+blocksize)
+            self._fft_sizes[samples] = (nfft, nfft-nic)
+        return self._fft_sizes[samples]
+
     def buffer_apply(self, input):
-        output = zeros_like(input)
-        nmax = max(self.input_cache.shape[0]+input.shape[0], self.impulse_response.shape[1])
-        nmax = 2**int(ceil(log2(nmax)))
-        if self.fftcache_nmax!=nmax:
-            self.fftcache = []
-        for i, (previnput, curinput, ir) in enumerate(zip(self.input_cache.T,
-                                                          input.T,
-                                                          self.impulse_response)):
-            fullinput = hstack((previnput, curinput))
-            # pad
-            fullinput = hstack((fullinput, zeros(nmax-len(fullinput))))
-            # apply fft
-            if self.fftcache_nmax!=nmax:
-                # recompute IR fft, first pad, then take fft, then store
-                ir = hstack((ir, zeros(nmax-len(ir))))
-                ir_fft = fft(ir, n=nmax)
-                self.fftcache.append(ir_fft)
-            else:
-                ir_fft = self.fftcache[i]
-            fullinput_fft = fft(fullinput, n=nmax)
-            curoutput_fft = fullinput_fft*ir_fft
-            curoutput = ifft(curoutput_fft)
-            # unpad
-            curoutput = curoutput[len(previnput):len(previnput)+len(curinput)]
-            output[:, i] = curoutput.real
-        if self.fftcache_nmax!=nmax:
-            self.fftcache_nmax = nmax
-        # update input cache
+        # Overlap-save: each block of input, preceded by the previous
+        # ir_length samples, is convolved with the impulse responses of all
+        # channels with one rfft/irfft call along the time axis, and the
+        # first ir_length samples of the result (circular convolution) are
+        # discarded.
         nic = self.input_cache.shape[0]
         ni = input.shape[0]
-        #print ni, nic
-        if ni>=nic:
-            self.input_cache[:, :] = input[-nic:, :]
-        else:
-            self.input_cache[:-ni, :] = self.input_cache[ni:, :]
-            self.input_cache[-ni:, :] = input
+        nfft, blocksize = self.fft_size(ni)
+        if self.fftcache_nmax!=nfft:
+            # IR spectra, shape (nchannels, nfft) (packed format)
+            self.fftcache = rfft(self.impulse_response, n=nfft, axis=1)
+            # work buffer: previous inputs, current block, zero padding
+            self.fftwork = zeros((self.nchannels, nfft))
+            self.fftcache_nmax = nfft
+        work = self.fftwork
+        output = empty(input.shape)
+        previnput = self.input_cache.T
+        for start in xrange(0, ni, blocksize):
+            n = min(blocksize, ni-start)
+            work[:, :nic] = previnput
+            work[:, nic:nic+n] = input[start:start+n].T
+            work[:, nic+n:] = 0
+            previnput = work[:, n:n+nic].copy()
+            spectrum = rfft(work, axis=1, overwrite_x=True)
+            multiply_packed_spectra(spectrum, self.fftcache)
+            output[start:start+n] = irfft(spectrum, axis=1, overwrite_x=True)[:, nic:nic+n].T
+        # update input cache
+        self.input_cache[:] = previnput.T
+        return output
+
+
+class FrequencyDomainDelayLine(object):
+    '''
+    Uniformly partitioned convolution of a multichannel input with impulse
+    responses of shape ``(nchannels, ir_length)``, split in partitions of
+    ``blocksize`` samples. The spectra of the last input blocks (each with
+    the previous block, as in overlap-save) are kept in a frequency-domain
+    delay line, so that the convolution of each block costs one FFT, one
+    inverse FFT and a product per partition.
+    '''
+    def __init__(self, impulse_response, blocksize):
+        nchannels, ir_length = impulse_response.shape
+        self.blocksize = blocksize
+        npartitions = max(int(ceil(ir_length*1.0/blocksize)), 1)
+        ir = zeros((nchannels, npartitions*blocksize))
+        ir[:, :ir_length] = impulse_response
+        # partition spectra, shape (npartitions, nchannels, 2*blocksize)
+        parts = ir.reshape((nchannels, npartitions, blocksize)).transpose((1, 0, 2))
+        self.partition_spectra = ascontiguousarray(rfft(parts, n=2*blocksize, axis=2))
+        self.spectra = zeros(self.partition_spectra.shape)
+        # previous and current (being filled) input blocks
+        self.window = zeros((nchannels, 2*blocksize))
+        self.reset()
+
+    def reset(self):
+        self.spectra[:] = 0
+        self.window[:] = 0
+        self.newest = 0
+        self.filled = 0
+
+    def push(self, spectrum):
+        '''
+        Inserts the spectrum of the current window in the delay line, and
+        starts a new block.
+        '''
+        B = self.blocksize
+        self.newest = (self.newest+1)%len(self.spectra)
+        self.spectra[self.newest] = spectrum
+        self.window[:, :B] = self.window[:, B:]
+        self.window[:, B:] = 0
+        self.filled = 0
+
+    def output(self, shift=0):
+        '''
+        Returns the output for the block ``shift`` blocks after the newest one
+        of the delay line, given by the partitions ``shift`` and above
+        (the contribution of the unknown inputs is not included), an array of
+        shape ``(nchannels, blocksize)``.
+        '''
+        P, nchannels, n = self.spectra.shape
+        if shift>=P:
+            return zeros((nchannels, self.blocksize))
+        indices = (self.newest+shift-arange(shift, P))%P
+        products = self.spectra[indices]
+        multiply_packed_spectra(products.reshape((-1, n)),
+                                self.partition_spectra[shift:].reshape((-1, n)))
+        return irfft(products.sum(axis=0), axis=1, overwrite_x=True)[:, self.blocksize:]
+
+
+class PartitionedFIRFilterbank(Filterbank):
+    '''
+    Finite impulse response filterbank using partitioned convolution
+
+    Unlike the default FFT implementation of :class:`FIRFilterbank` (which
+    needs buffers of at least ``3*ir_length`` samples), the computation for each buffer does not
+    depend on the length of the impulse response, so that it can be used with
+    long impulse responses (e.g. reverberation) and small buffers (e.g. with
+    :class:`OnlineSound`). The output is exact for any buffer size, but
+    buffers should be multiples of the (first) partition size for efficiency:
+    the spectrum of the current block is recomputed for each buffer.
+
+    ``partition_size``
+        Either the size of the partitions of the impulse response (uniform
+        partitioning), or an increasing list of sizes (non-uniform
+        partitioning). In the latter case, each size is used for as few
+        partitions as possible so that the next partition starts after at
+        least its own size, e.g. ``[256, 1024, 4096]`` gives 4 partitions of
+        256 samples, 3 of 1024 samples, and partitions of 4096 samples for the
+        rest of the impulse response. Only the partitions of the first size
+        are computed for each buffer, the larger ones are computed once every
+        block.
+    '''
+    def __init__(self, source, impulse_response, partition_size=512,
+                 minimum_buffer_size=None):
+        if len(impulse_response.shape)==1:
+            impulse_response = repeat(reshape(impulse_response, (1, len(impulse_response))), source.nchannels, axis=0)
+        # Automatically duplicate mono input to fit the desired output shape
+        if impulse_response.shape[0]!=source.nchannels:
+            if source.nchannels!=1:
+                raise ValueError('Can only automatically duplicate source channels for mono sources, use RestructureFilterbank.')
+            source = RestructureFilterbank(source, impulse_response.shape[0])
+        Filterbank.__init__(self, source)
+
+        self.impulse_response = impulse_response
+        if isinstance(partition_size, int):
+            partition_size = [partition_size]
+        partition_size = [int(size) for size in partition_size]
+        if sorted(partition_size)!=partition_size or partition_size[0]<1:
+            raise ValueError('Partition sizes should be positive and increasing.')
+        ir_length = impulse_response.shape[1]
+        # delay lines with the offset of their first partition
+        self.delaylines = []
+        offset = 0
+        for i, size in enumerate(partition_size):
+            if i>0 and offset>=ir_length:
+                break
+            if i+1<len(partition_size):
+                npartitions = max(int(ceil((partition_size[i+1]-offset)*1.0/size)), 1)
+                end = offset+npartitions*size
+            else:
+                end = ir_length
+            self.delaylines.append((offset,
+                FrequencyDomainDelayLine(impulse_response[:, offset:end], size)))
+            offset = end
+        # outputs of the delayed partitions (circular buffer)
+        self.output_cache = zeros((self.nchannels,
+                                   max([offset for offset, _ in self.delaylines])))
+        self.tail = zeros((self.nchannels, partition_size[0]))
+        self.time = 0
+        if minimum_buffer_size is not None:
+            self.minimum_buffer_size = minimum_buffer_size
+
+    def buffer_init(self):
+        Filterbank.buffer_init(self)
+        for _, delayline in self.delaylines:
+            delayline.reset()
+        self.tail[:] = 0
+        self.output_cache[:] = 0
+        self.time = 0
+
+    def buffer_apply(self, input):
+        output = empty(input.shape)
+        first = self.delaylines[0][1]
+        B = first.blocksize
+        ncache = self.output_cache.shape[1]
+        start = 0
+        while start<input.shape[0]:
+            # process up to the next block end of any delay line
+            n = min([input.shape[0]-start]+
+                    [delayline.blocksize-delayline.filled for _, delayline in self.delaylines])
+            for _, delayline in self.delaylines:
+                f = delayline.filled+delayline.blocksize
+                delayline.window[:, f:f+n] = input[start:start+n].T
+            # first partition with the (incomplete) current block, and the
+            # other partitions of the first delay line computed at the start
+            # of the block
+            f = first.filled
+            spectrum = rfft(first.window, axis=1)
+            first.filled += n
+            if first.filled==B:
+                first.push(spectrum)
+            multiply_packed_spectra(spectrum, first.partition_spectra[0])
+            out = irfft(spectrum, axis=1, overwrite_x=True)[:, B+f:B+f+n]+self.tail[:, f:f+n]
+            if first.filled==0:
+                self.tail = first.output(1)
+            # outputs of the delayed partitions
+            if ncache:
+                indices = arange(self.time, self.time+n)%ncache
+                out += self.output_cache[:, indices]
+                self.output_cache[:, indices] = 0
+            output[start:start+n] = out.T
+            self.time += n
+            start += n
+            # delayed partitions, added to the outputs at least one block
+            # later
+            for offset, delayline in self.delaylines[1:]:
+                delayline.filled += n
+                if delayline.filled==delayline.blocksize:
+                    delayline.push(rfft(delayline.window, axis=1))
+                    indices = arange(self.time+offset-delayline.blocksize,
+                                     self.time+offset)%ncache
+                    self.output_cache[:, indices] += delayline.output()
         return output
 
 
@@ -150,15 +338,28 @@ class FIRFilterbank(Filterbank):
     ``minimum_buffer_size=None``
         If specified, gives a minimum size to the buffer. By default, for the
         FFT convolution based implementation of ``FIRFilterbank``, the minimum
-        buffer size will be ``3*ir_length``. For maximum efficiency with FFTs,
-        ``buffer_size+ir_length`` should be a power of 2 (otherwise there will
-        be some zero padding), and ``buffer_size`` should be as large as
-        possible.
+        buffer size will be ``3*ir_length``. The FFT size is the smallest
+        product of powers of 2, 3 and 5 above ``buffer_size+ir_length`` (large
+        buffers are processed in blocks of about ``15*ir_length`` samples), so
+        ``buffer_size`` should be as large as possible.
+    ``partition_size=None``
+        If specified, partitioned convolution is used (see
+        :class:`PartitionedFIRFilterbank`): there is no minimum buffer size
+        and the computation time per buffer does not depend on the length of
+        the impulse response, which is useful for long impulse responses with
+        small buffers (e.g. online processing). Either a partition size or an
+        increasing list of partition sizes.
     '''
     def __init__(self, source, impulse_response, use_linearfilterbank=False,
-                 minimum_buffer_size=None):
+                 minimum_buffer_size=None, partition_size=None):
         if use_linearfilterbank:
             self.__class__ = LinearFIRFilterbank
+        elif partition_size is not None:
+            self.__class__ = PartitionedFIRFilterbank
+            self.__init__(source, impulse_response,
+                          partition_size=partition_size,
+                          minimum_buffer_size=minimum_buffer_size)
+            return
         else:
             self.__class__ = FFTFIRFilterbank
         self.__init__(source, impulse_response,
@@ -10,8 +10,15 @@ from scipy import signal, random
 from filterbank import Filterbank, RestructureFilterbank
 from ..bufferable import Bufferable
 from itertools import izip
+try:
+    ## Compiled kernel (brian/hears/filtering/clinearfilterbank), used by
+    ## default if the extension was built (it is built by setup.py)
+    from clinearfilterbank import clinearfilterbank as _clinearfilterbank
+    has_clinearfilterbank = True
+except ImportError:
+    has_clinearfilterbank = False
 
-__all__ = ['LinearFilterbank']
+__all__ = ['LinearFilterbank', 'TimeVaryingLinearFilterbank', 'SOSFilterbank']
 
 def _scipy_apply_linear_filterbank(b, a, x, zi):
     '''
@@ -117,6 +124,79 @@ def _weave_apply_linear_filterbank(b, a, x, zi,
     return y 
 
 
+def _c_output_array(x, out):
+    # Returns out if the compiled kernels can write the output into it
+    if out is not None and out.shape==x.shape and out.dtype==float and \
+       out.flags['C_CONTIGUOUS']:
+        return out
+    return empty_like(x)
+
+
+def _c_apply_linear_filterbank(b, a, x, zi, numthreads=1, out=None):
+    '''
+    Same as :func:`_weave_apply_linear_filterbank`, with the compiled kernel
+    (the channels are split in blocks filtered by ``numthreads`` threads, 0
+    for all processors, if it was compiled with OpenMP). The output is
+    written into ``out`` if it is a C-contiguous array of floats of the
+    shape of ``x``.
+    '''
+    x = ascontiguousarray(x, dtype=float)
+    y = _c_output_array(x, out)
+    n, m, p = b.shape
+    if a.shape!=(n, m, p) or zi.shape!=(n, m, p) or x.shape!=(x.shape[0], n):
+        raise ValueError('Data has wrong shape.')
+    if not b.flags['F_CONTIGUOUS'] or not a.flags['F_CONTIGUOUS'] or not zi.flags['F_CONTIGUOUS']:
+        raise ValueError('Filter parameters must be F_CONTIGUOUS')
+    # Fortran-ordered views, so that the state is updated in place
+    _clinearfilterbank.apply_linear_filterbank(b.ravel(order='F'),
+                                               a.ravel(order='F'),
+                                               zi.ravel(order='F'),
+                                               x.ravel(), y.ravel(),
+                                               n, m, p, numthreads)
+    return y
+
+
+def _c_apply_interpolated_linear_filterbank(b0, a0, b, a, x, zi, numthreads=1,
+                                            out=None):
+    '''
+    Same as :func:`_c_apply_linear_filterbank`, with the coefficients
+    interpolated linearly from ``b0``, ``a0`` to ``b``, ``a`` over the buffer
+    (see :class:`TimeVaryingLinearFilterbank`).
+    '''
+    x = ascontiguousarray(x, dtype=float)
+    y = _c_output_array(x, out)
+    n, m, p = b.shape
+    if b0.shape!=(n, m, p) or a0.shape!=(n, m, p) or a.shape!=(n, m, p) or \
+       zi.shape!=(n, m, p) or x.shape!=(x.shape[0], n):
+        raise ValueError('Data has wrong shape.')
+    for c in (b0, a0, b, a, zi):
+        if not c.flags['F_CONTIGUOUS']:
+            raise ValueError('Filter parameters must be F_CONTIGUOUS')
+    _clinearfilterbank.apply_linear_filterbank_interpolated(b0.ravel(order='F'),
+                                                            a0.ravel(order='F'),
+                                                            b.ravel(order='F'),
+                                                            a.ravel(order='F'),
+                                                            zi.ravel(order='F'),
+                                                            x.ravel(), y.ravel(),
+                                                            n, m, p, numthreads)
+    return y
+
+
+def _interpolated_apply_linear_filterbank(apply, b0, a0, b, a, x, zi):
+    '''
+    Same as :func:`_c_apply_interpolated_linear_filterbank`, one sample at a
+    time with ``apply(b, a, x, zi)`` (one of the functions above), used
+    without the compiled kernel.
+    '''
+    y = empty_like(x)
+    numsamples = x.shape[0]
+    for s in xrange(numsamples):
+        t = (s+1.0)/numsamples
+        y[s:s+1] = apply(array(b0+t*(b-b0), order='F'),
+                         array(a0+t*(a-a0), order='F'), x[s:s+1], zi)
+    return y
+
+
 class LinearFilterbank(Filterbank):
     '''
     Generalised linear filterbank
@@ -136,6 +216,11 @@ class LinearFilterbank(Filterbank):
     The filter parameters are stored in the modifiable attributes ``filt_b``,
     ``filt_a`` and ``filt_state`` (the variable ``z`` in the section below).
     
+    The filters are applied with a compiled kernel if it was built during
+    installation (see :ref:`compiled-code`), using several processors if the
+    global preference ``openmp`` is set. Otherwise, weave is used if the
+    ``useweave`` preference is set, or else a pure Python version.
+    
     Has one method:
     
     .. automethod:: decascade
@@ -185,7 +270,14 @@ class LinearFilterbank(Filterbank):
         self.filt_b = array(b, order='F')
         self.filt_a = array(a, order='F')
         self.filt_state = zeros((b.shape[0], b.shape[1], b.shape[2]), order='F')
-        self.use_weave = get_global_preference('useweave')
+        self.use_compiled = has_clinearfilterbank
+        if self.use_compiled:
+            log_info('brian.hears.filtering.linearfilterbank', 'Using compiled kernel')
+            if get_global_preference('openmp'):
+                self.numthreads = 0
+            else:
+                self.numthreads = 1
+        self.use_weave = get_global_preference('useweave') and not self.use_compiled
         if self.use_weave:
             log_info('brian.hears.filtering.linearfilterbank', 'Using weave')
             self.cpp_compiler = get_global_preference('weavecompiler')
@@ -201,9 +293,13 @@ class LinearFilterbank(Filterbank):
         Filterbank.buffer_init(self)
         self.filt_state[:] = 0
     
-    def buffer_apply(self, input):
+    def buffer_apply(self, input, out=None):
         
-        if self.use_weave:
+        if self.use_compiled:
+            return _c_apply_linear_filterbank(self.filt_b, self.filt_a, input,
+                                              self.filt_state, self.numthreads,
+                                              out)
+        elif self.use_weave:
             return _weave_apply_linear_filterbank(self.filt_b, self.filt_a, input,
                                                   self.filt_state, self.cpp_compiler,
                                                   self.extra_compile_args)
@@ -242,6 +338,237 @@ class LinearFilterbank(Filterbank):
         self.filt_b = array(b, order='F')
         self.filt_a = array(a, order='F')
         self.filt_state = zeros((b.shape[0], b.shape[1], b.shape[2]), order='F')
+
+    def to_sos(self, dtype=float):
+        '''
+        Returns an :class:`SOSFilterbank` with the same filters and source (the
+        state of the filters is not copied), in the precision ``dtype``
+        (``float`` or ``float32``). Filters of order 2 or less are used as
+        sections, higher order filters are split in sections (this requires
+        scipy 0.16 or later).
+        '''
+        n, m, p = self.filt_b.shape
+        if m<=3:
+            sos = zeros((n, p, 6))
+            sos[:, :, :m] = self.filt_b.transpose((0, 2, 1))
+            sos[:, :, 3:3+m] = self.filt_a.transpose((0, 2, 1))
+        else:
+            from scipy.signal import tf2sos
+            sos = array([vstack([tf2sos(self.filt_b[i, :, k], self.filt_a[i, :, k])
+                                 for k in xrange(p)]) for i in xrange(n)])
+        return SOSFilterbank(self.source, sos, dtype=dtype)
+
+
+class TimeVaryingLinearFilterbank(LinearFilterbank):
+    '''
+    Linear filterbank whose coefficients are changed at run time
+    
+    Initialisation arguments:
+    
+    ``source``, ``b``, ``a``
+        As for :class:`LinearFilterbank`.
+    ``interpolate=False``
+        Whether to interpolate the coefficients at each sample, see below.
+    
+    This is a :class:`LinearFilterbank` meant to be modified between buffers,
+    typically by the updater of a :class:`ControlFilterbank` (with the
+    ``max_interval`` of the controller, the buffers are the intervals between
+    two updates). The coefficients should be modified in place, with
+    :meth:`set_coefficients` or by writing into ``filt_b`` and ``filt_a``
+    (e.g. ``fb.filt_b[:, 0, :] = ...``), so that no array is allocated at each
+    update.
+    
+    With ``interpolate=True``, the coefficients are interpolated linearly over
+    each buffer, between their values at the end of the previous buffer and
+    their new values, which are reached at the last sample of the buffer. This
+    avoids the discontinuities of the output when the coefficients change,
+    and allows larger update intervals for the same accuracy. The
+    interpolation is done in the compiled kernel (see
+    :class:`LinearFilterbank`), without it the filters are applied one sample
+    at a time, which is slow. Note that a linear interpolation of stable
+    filters of order 2 (``b`` and ``a`` of shape ``(nchannels, 3, p)``) is
+    stable, but this is not true for higher orders.
+    
+    .. automethod:: set_coefficients
+    '''
+    def __init__(self, source, b, a, interpolate=False):
+        LinearFilterbank.__init__(self, source, b, a)
+        self.interpolate = interpolate
+        # coefficients at the end of the previous buffer
+        self.previous_b = array(self.filt_b, order='F')
+        self.previous_a = array(self.filt_a, order='F')
+
+    def set_coefficients(self, b, a):
+        '''
+        Copies ``b`` and ``a`` into ``filt_b`` and ``filt_a`` (any shape that
+        can be broadcast to their shape can be used).
+        '''
+        self.filt_b[:] = b
+        self.filt_a[:] = a
+
+    def buffer_init(self):
+        LinearFilterbank.buffer_init(self)
+        self.previous_b = array(self.filt_b, order='F')
+        self.previous_a = array(self.filt_a, order='F')
+
+    def buffer_apply(self, input, out=None):
+        b, a = self.filt_b, self.filt_a
+        b0, a0 = self.previous_b, self.previous_a
+        if not self.interpolate or b0.shape!=b.shape or a0.shape!=a.shape or \
+           ((b0==b).all() and (a0==a).all()):
+            output = LinearFilterbank.buffer_apply(self, input, out)
+        elif self.use_compiled:
+            output = _c_apply_interpolated_linear_filterbank(b0, a0, b, a, input,
+                                                             self.filt_state,
+                                                             self.numthreads,
+                                                             out)
+        elif self.use_weave:
+            apply = lambda b, a, x, zi: _weave_apply_linear_filterbank(b, a, x, zi,
+                                                self.cpp_compiler,
+                                                self.extra_compile_args)
+            output = _interpolated_apply_linear_filterbank(apply, b0, a0, b, a,
+                                                           input, self.filt_state)
+        else:
+            output = _interpolated_apply_linear_filterbank(
+                                                _scipy_apply_linear_filterbank,
+                                                b0, a0, b, a, input,
+                                                self.filt_state)
+        if self.interpolate:
+            if b0.shape==b.shape and a0.shape==a.shape:
+                b0[:] = b
+                a0[:] = a
+            else:
+                self.previous_b = array(b, order='F')
+                self.previous_a = array(a, order='F')
+        return output
+
+
+def _c_apply_sos_filterbank(sos, x, state, numthreads=1):
+    '''
+    Applies the cascades of biquads ``sos`` (shape ``(n, p, 6)``) to ``x``
+    (shape ``(s, n)``) with the compiled kernel, in the precision of ``sos``
+    (``float32`` or ``float64``). The state (shape ``(n, p, 2)``) is updated
+    in place.
+    '''
+    x = array(x, dtype=sos.dtype, order='C')
+    y = empty_like(x)
+    n, p, _ = sos.shape
+    if sos.dtype==float32:
+        apply = _clinearfilterbank.apply_sos_filterbank_float
+    else:
+        apply = _clinearfilterbank.apply_sos_filterbank
+    apply(sos.ravel(), state.ravel(), x.ravel(), y.ravel(), n, p, numthreads)
+    return y
+
+
+def _scipy_apply_sos_filterbank(sos, x, state):
+    '''
+    Same as :func:`_c_apply_sos_filterbank` with scipy's ``lfilter``, applied
+    to each channel and stage on the whole buffer.
+    '''
+    y = array(x, dtype=sos.dtype, order='F')
+    n, p, _ = sos.shape
+    for k in xrange(p):
+        for i in xrange(n):
+            y[:, i], state[i, k, :] = signal.lfilter(sos[i, k, :3], sos[i, k, 3:],
+                                                     y[:, i], zi=state[i, k, :])
+    return y
+
+
+class SOSFilterbank(Filterbank):
+    '''
+    Linear filterbank made of cascades of second-order sections (biquads)
+    
+    Initialisation arguments:
+    
+    ``source``
+        The input to the filterbank, must have the same number of channels or
+        just a single channel. In the latter case, the channels will be
+        replicated.
+    ``sos``
+        The coefficients, an array of shape ``(nchannels, nsections, 6)``
+        where each section is ``[b0, b1, b2, a0, a1, a2]`` (the format of
+        :func:`scipy.signal.sosfilt`). The sections of each channel are
+        applied in order.
+    ``dtype=float``
+        The precision of the computations, ``float`` (64 bit) or ``float32``.
+    
+    The coefficients and the state of the filters are stored in the attributes
+    ``sos`` and ``sos_state`` (shape ``(nchannels, nsections, 2)``), with
+    the coefficients of each section contiguous. Each section is applied to
+    a whole buffer before the next one. A :class:`LinearFilterbank` can be
+    converted with :meth:`LinearFilterbank.to_sos`.
+    
+    **Single precision**
+    
+    With ``dtype=float32``, the coefficients, state and buffers take half the
+    memory, and the compiled kernel (see :class:`LinearFilterbank`) processes
+    twice as many channels per instruction. The accuracy depends on the
+    filters: it decreases as the poles get closer to the unit circle, i.e.,
+    for narrow filters with low frequencies relative to the sample rate.
+    For example, for a :class:`Gammatone` filterbank at 44.1 kHz with a white
+    noise input, the relative error (rms) is about 3e-7 above 5 kHz, 3e-6 at
+    1 kHz, 5e-5 at 100 Hz and 3e-4 at 20 Hz. The error for a given input can
+    be checked with :meth:`float32_error`.
+    
+    .. automethod:: float32_error
+    '''
+    def __init__(self, source, sos, dtype=float):
+        sos = asarray(sos, dtype=float)
+        # Automatically duplicate mono input to fit the desired output shape
+        if sos.shape[0]!=source.nchannels:
+            if source.nchannels!=1:
+                raise ValueError('Can only automatically duplicate source channels for mono sources, use RestructureFilterbank.')
+            source = RestructureFilterbank(source, sos.shape[0])
+        Filterbank.__init__(self, source)
+        if len(sos.shape)!=3 or sos.shape[2]!=6:
+            raise ValueError('sos should have shape (nchannels, nsections, 6).')
+        # normalise by a0
+        sos = sos/sos[:, :, 3:4]
+        self.sos = array(sos, dtype=dtype, order='C')
+        self.sos_state = zeros(sos.shape[:2]+(2,), dtype=dtype)
+        self.use_compiled = has_clinearfilterbank
+        if get_global_preference('openmp'):
+            self.numthreads = 0
+        else:
+            self.numthreads = 1
+
+    def reset(self):
+        self.buffer_init()
+
+    def buffer_init(self):
+        Filterbank.buffer_init(self)
+        self.sos_state[:] = 0
+
+    def buffer_apply(self, input):
+        if self.use_compiled:
+            return _c_apply_sos_filterbank(self.sos, input, self.sos_state,
+                                           self.numthreads)
+        else:
+            return _scipy_apply_sos_filterbank(self.sos, input, self.sos_state)
+
+    def float32_error(self, sound, buffersize=4096):
+        '''
+        Returns the error of the single precision filterbank for the given
+        ``sound`` (or other source), relative to the double precision one: for
+        each channel, the rms of the difference divided by the rms of the
+        double precision output.
+        '''
+        fb = SOSFilterbank(sound, self.sos, dtype=float)
+        fb32 = SOSFilterbank(sound, self.sos, dtype=float32)
+        duration = int(fb.duration*fb.samplerate)
+        fb.buffer_init()
+        fb32.buffer_init()
+        power = zeros(self.nchannels)
+        error = zeros(self.nchannels)
+        for start in xrange(0, duration, buffersize):
+            end = min(start+buffersize, duration)
+            output = fb.buffer_fetch(start, end)
+            output32 = fb32.buffer_fetch(start, end)
+            power += sum(output**2, axis=0)
+            error += sum((output32-output)**2, axis=0)
+        return sqrt(error/power)
+
                 
 # Use the GPU version if available
 try:
@@ -0,0 +1,293 @@
+from brian import *
+from filterbank import Filterbank
+from ..bufferable import Bufferable
+from brian.utils.parallel import get_thread_pool
+from multiprocessing import cpu_count
+import threading
+import weakref
+import sys
+
+__all__ = ['PipelineFilterbank', 'ChannelParallelFilterbank']
+
+class PipelineFilterbank(Filterbank):
+    '''
+    Filterbank computing its source ahead of time in a separate thread
+
+    Initialised with arguments:
+
+    ``source``
+        The filterbank (or sound) computed by the worker thread.
+    ``buffersize=1024``
+        The number of samples computed at each step of the worker thread, as
+        a number of samples or a length of time.
+    ``nbuffers=4``
+        The number of blocks in the ring buffer, i.e., how many blocks the
+        worker thread can compute ahead of the filterbanks using this one.
+
+    The output is the output of the source. The source, and the chain of
+    filterbanks it depends on (up to the previous :class:`PipelineFilterbank`),
+    is computed by a worker thread in blocks of ``buffersize`` samples, which
+    are written into a ring buffer allocated once, and read from there by the
+    filterbanks using this one. Inserting a :class:`PipelineFilterbank`
+    between the stages of a chain runs the stages at the same time on
+    successive blocks, for example::
+
+        middleear = PipelineFilterbank(MiddleEar(sound))
+        cochlea = PipelineFilterbank(TanCarney(middleear, cf))
+        synapse = ZhangSynapseRate(cochlea, cf)
+        output = synapse.process()
+
+    Here the middle ear, the cochlear model and the synapse model (in the main
+    thread) are computed in parallel. The worker thread is started by the
+    first fetch after ``buffer_init()``. It stops once it has computed the
+    duration of the source (later blocks are computed on demand by the
+    filterbanks using this one), when the filterbank is garbage collected,
+    or with :meth:`stop`.
+
+    The stages only run in parallel when they release the GIL, as do the
+    compiled kernels of :class:`LinearFilterbank` and :class:`SOSFilterbank`
+    (see :ref:`compiled-code`) and numpy operations on large arrays, so that
+    stages doing a lot of work per block in Python do not benefit from it.
+    Filterbanks are not thread safe, so a filterbank (other than a
+    :class:`PipelineFilterbank`) should only be used in one stage.
+
+    .. automethod:: stop
+    '''
+    def __init__(self, source, buffersize=1024, nbuffers=4):
+        Filterbank.__init__(self, source)
+        if not isinstance(buffersize, int):
+            buffersize = int(buffersize*self.samplerate)
+        self.buffersize = buffersize
+        self.nbuffers = nbuffers
+        self.ring = zeros((nbuffers*buffersize, self.nchannels))
+        self.condition = threading.Condition()
+        self.thread = None
+
+    def stop(self):
+        '''
+        Stops the worker thread (it is started again by the next fetch).
+        '''
+        if self.thread is None:
+            return
+        with self.condition:
+            self.stopped = True
+            self.condition.notify_all()
+        self.thread.join()
+        self.thread = None
+        self.stopped = False
+
+    def buffer_init(self):
+        # the thread must be stopped before the chain it computes is reset
+        self.stop()
+        Filterbank.buffer_init(self)
+        self.produced = 0 # number of blocks written to the ring buffer
+        self.released = 0 # number of blocks the consumer no longer needs
+        self.error = None
+        self.stopped = False
+        # number of blocks computed by the worker thread, the blocks after
+        # the end of the source are computed by the consumer
+        try:
+            duration = self.source.duration
+        except KeyError:
+            self.nblocks = None
+        else:
+            if not isinstance(duration, int):
+                duration = int(duration*self.samplerate)
+            self.nblocks = (duration+self.buffersize-1)//self.buffersize
+
+    def source_finished(self):
+        '''
+        Whether the worker thread has computed all the blocks of the source.
+        '''
+        return self.nblocks is not None and self.produced>=self.nblocks
+
+    def compute_block(self, block):
+        size = self.buffersize
+        slot = (block%self.nbuffers)*size
+        self.ring[slot:slot+size, :] = self.source.buffer_fetch(block*size,
+                                                                (block+1)*size)
+
+    def buffer_fetch_next(self, samples):
+        if self.thread is None:
+            # the thread only has a weak reference to the filterbank, and is
+            # woken up when it is garbage collected
+            condition = self.condition
+            def wake_up(ref):
+                with condition:
+                    condition.notify_all()
+            self.thread = threading.Thread(target=run_pipeline,
+                                args=(weakref.ref(self, wake_up), condition))
+            self.thread.daemon = True
+            self.thread.start()
+        size = self.buffersize
+        start = self.next_sample
+        end = start+samples
+        self.next_sample = end
+        output = empty((samples, self.nchannels))
+        for block in xrange(start//size, (end+size-1)//size):
+            with self.condition:
+                while (self.produced<=block and self.error is None and
+                       not self.source_finished()):
+                    self.condition.wait()
+                if self.produced<=block and self.error is not None:
+                    exc_type, exc_value, traceback = self.error
+                    raise exc_type, exc_value, traceback
+            if self.produced<=block:
+                # after the end of the source, the worker thread has finished
+                self.compute_block(block)
+                self.produced = block+1
+            i, j = max(start, block*size), min(end, (block+1)*size)
+            slot = (block%self.nbuffers)*size-block*size
+            output[i-start:j-start, :] = self.ring[slot+i:slot+j, :]
+            # the block is released as soon as it is copied, so that the
+            # output can be longer than the ring buffer
+            with self.condition:
+                self.released = j//size
+                self.condition.notify_all()
+        return output
+
+
+def run_pipeline(ref, condition):
+    '''
+    Loop of the worker thread of the :class:`PipelineFilterbank` ``ref()``:
+    computes the blocks in order, each block is written once the consumer has
+    released the block which was in the same slot of the ring buffer. The
+    loop ends at the end of the source, or when the filterbank is stopped or
+    garbage collected (the thread does not hold a reference to it while it
+    waits).
+    '''
+    with condition:
+        pipeline = ref()
+        if pipeline is None:
+            return
+        block = pipeline.produced
+    while True:
+        with condition:
+            while True:
+                if (pipeline is None or pipeline.stopped or
+                        pipeline.source_finished()):
+                    return
+                if block<pipeline.released+pipeline.nbuffers:
+                    break
+                pipeline = None
+                # if the thread had the last reference, the filterbank has
+                # just been collected and the wake up notification is sent
+                if ref() is not None:
+                    condition.wait()
+                pipeline = ref()
+        try:
+            pipeline.compute_block(block)
+        except Exception:
+            with condition:
+                pipeline.error = sys.exc_info()
+                condition.notify_all()
+            return
+        block += 1
+        with condition:
+            pipeline.produced = block
+            condition.notify_all()
+
+
+class BlockSource(Bufferable):
+    '''
+    Source of a chunk of :class:`ChannelParallelFilterbank`, its output is
+    the current block of the source (the channels of the chunk).
+    '''
+    def __init__(self, nchannels, samplerate, duration):
+        self.nchannels = nchannels
+        self.samplerate = samplerate
+        self.duration = duration
+        self.buffer_init()
+
+    def buffer_init(self):
+        self.block = zeros((0, self.nchannels))
+        self.start = 0
+
+    def buffer_fetch(self, start, end):
+        if start<self.start or end>self.start+self.block.shape[0]:
+            raise IndexError('The filterbanks of ChannelParallelFilterbank can '
+                             'only fetch the current block of the source.')
+        return self.block[start-self.start:end-self.start, :]
+
+
+class ChannelParallelFilterbank(Filterbank):
+    '''
+    Filterbank computing chunks of channels in parallel threads
+
+    Initialised with arguments:
+
+    ``source``
+        The source of the filterbank.
+    ``make_filterbank``
+        A function ``make_filterbank(source, i, j)`` returning the filterbank
+        computing the output channels ``i:j``, from the given ``source``
+        (channels ``i:j`` of the source if it has ``nchannels`` channels, or
+        the mono source).
+    ``nchannels``
+        The number of output channels.
+    ``nchunks=None``
+        The number of chunks of channels (and of threads), by default the
+        number of processors.
+
+    For each buffer, the source is fetched, and the chunks are computed in a
+    pool of threads. For example, the following computes a
+    :class:`TanCarney` model in 4 threads, each with a quarter of the
+    channels::
+
+        cochlea = ChannelParallelFilterbank(sound,
+                        lambda source, i, j: TanCarney(source, cf[i:j]),
+                        len(cf), 4)
+
+    As with :class:`PipelineFilterbank`, the threads only run in parallel
+    when the filterbanks release the GIL. The filterbanks of a chunk can only
+    fetch the current buffer of their source (so that filterbanks with a
+    ``minimum_buffer_size``, such as :class:`FIRFilterbank`, cannot be used),
+    and they cannot use another :class:`ChannelParallelFilterbank`.
+    '''
+    def __init__(self, source, make_filterbank, nchannels, nchunks=None):
+        Filterbank.__init__(self, source)
+        if source.nchannels!=nchannels and source.nchannels!=1:
+            raise ValueError('The source must have nchannels channels or a single channel.')
+        self.nchannels = nchannels
+        if nchunks is None:
+            nchunks = cpu_count()
+        try:
+            duration = source.duration
+        except KeyError:
+            duration = None
+        bounds = linspace(0, nchannels, nchunks+1).astype(int)
+        self.chunks = []
+        for i, j in zip(bounds[:-1], bounds[1:]):
+            if j<=i:
+                continue
+            if source.nchannels==nchannels:
+                channels = slice(i, j)
+            else:
+                channels = slice(0, 1)
+            chunk_source = BlockSource(channels.stop-channels.start,
+                                       source.samplerate, duration)
+            fb = make_filterbank(chunk_source, i, j)
+            if fb.nchannels!=j-i:
+                raise ValueError('The filterbank of channels %d:%d has %d channels.'%(i, j, fb.nchannels))
+            self.chunks.append((i, j, channels, chunk_source, fb))
+        self.pool = get_thread_pool(len(self.chunks))
+
+    def buffer_init(self):
+        Filterbank.buffer_init(self)
+        for i, j, channels, chunk_source, fb in self.chunks:
+            fb.buffer_init()
+
+    def buffer_fetch_next(self, samples):
+        start = self.next_sample
+        self.next_sample += samples
+        end = start+samples
+        input = self.source.buffer_fetch(start, end)
+        output = empty((samples, self.nchannels))
+        for i, j, channels, chunk_source, fb in self.chunks:
+            chunk_source.block = input[:, channels]
+            chunk_source.start = start
+        def process(chunk):
+            i, j, channels, chunk_source, fb = chunk
+            output[:, i:j] = fb.buffer_fetch(start, end)
+        self.pool.map(process, self.chunks)
+        return output
@@ -2,6 +2,7 @@ import numpy as np
 from numpy import pi
 import scipy.signal as signal
 import warnings
+from collections import deque
 
 from brian.clock import Clock
 from brian.stdunits import Hz, ms
@@ -14,7 +15,8 @@ from brian.hears.filtering.filterbank import (FunctionFilterbank,
                                               ControlFilterbank,
                                               CombinedFilterbank,
                                               RestructureFilterbank)
-from brian.hears.filtering.linearfilterbank import LinearFilterbank
+from brian.hears.filtering.linearfilterbank import (LinearFilterbank,
+                                                    TimeVaryingLinearFilterbank)
 from brian.hears.filtering.filterbankgroup import FilterbankGroup
 
 
@@ -318,6 +320,15 @@ class Control_Coefficients:
         self.preal = np.zeros((self.nch,6))
         self.pimg = np.zeros((self.nch,6))
         self.preal,self.pimg = self.analog_poles()
+        # constant coefficients (the others are set by return_coefficients)
+        self.filt_a[:,0,0:3] = 1.
+        self.filt_a[:,0,3] = 1.
+        self.filt_a[:,1,3]= 1.      ## changed  from 1 to 0
+        self.filt_a[:,2,3] = 0.
+        self.filt_b[:,0,3] = self.fs_bilinear
+        self.filt_b[:,1,3] = -self.fs_bilinear
+        self.filt_b[:,2,3] = 0
+        self.filt_a[:,0,4] = 1.
         
     def return_coefficients(self,control_signal):
         self.wbw=-(self.preal[:,0] - control_signal)/self.PI2
@@ -332,23 +343,14 @@ class Control_Coefficients:
         
         temp=(self.fs_bilinear-(preal))**2 + self.pimg[:,iord]**2    
         
-        self.filt_a[:,0,0:3] = 1.
         self.filt_a[:,1,0:3]= -2*(self.fs_bilinear**2-(preal)**2-self.pimg[:,iord]**2)/temp            
         self.filt_a[:,2,0:3] = ((self.fs_bilinear+(preal))**2+self.pimg[:,iord]**2)/temp
         self.filt_b[:,0,0:3] = 1./temp
-        self.filt_b[:,1,0:3] = 2./temp  
-        self.filt_b[:,2,0:3] = 1./temp
-        
-        self.filt_a[:,0,3] = 1.
-        self.filt_a[:,1,3]= 1.      ## changed  from 1 to 0
-        self.filt_a[:,2,3] = 0.
-        self.filt_b[:,0,3] = self.fs_bilinear
-        self.filt_b[:,1,3] = -self.fs_bilinear
-        self.filt_b[:,2,3] = 0
+        self.filt_b[:,1,0:3] = 2.*self.filt_b[:,0,0:3]
+        self.filt_b[:,2,0:3] = self.filt_b[:,0,0:3]
         
 #        self.filt_b[:,:,3] = self.gain_norm_bp*self.filt_b[:,:,3]  
         
-        self.filt_a[:,0,4] = 1.
         self.filt_b[:,0,4] = self.gain_norm_bp
   
         
@@ -407,13 +409,16 @@ class Signal_Coefficients:
         self.gain_norm = np.sqrt(np.prod((2*pi*self.cfmat-self.pimg[:,0:20])**2+self.preal[:,0:20]**2,axis=1))
 
         self.gain_norm = self.gain_norm /(np.sqrt((2*pi*self.cf)**2+self.zeroa**2))**self.order_of_zero
+        # constant coefficients (the others are set by return_coefficients)
+        self.filt_a[:,0,:10] = 1
+        self.filt_a[:,0,10] = 1.
+        self.filt_b[:,0,10] = self.gain_norm/3.
         
     def return_coefficients(self,control_signal):
         self.preal,self.pimg = self.analog_poles(control_signal)
         
         iord = np.arange(2,22,2)-1
         temp=(self.fs_bilinear-self.preal[:,iord])**2 + self.pimg[:,iord]**2
-        self.filt_a[:,0,:10] = 1
         self.filt_a[:,1,:10] = -2*(self.fs_bilinear**2-self.preal[:,iord]**2-self.pimg[:,iord]**2)/temp            
         self.filt_a[:,2,:10] = ((self.fs_bilinear+self.preal[:,iord])**2+self.pimg[:,iord]**2)/temp
         
@@ -421,9 +426,7 @@ class Signal_Coefficients:
         self.filt_b[:,1,:10] = (-2*self.zeroamat)/temp
         self.filt_b[:,2,:10] = (-self.zeroamat-self.fs_bilinear)/temp 
         
-        self.filt_a[:,0,10] = 1.
-        self.filt_b[:,0,10] = self.gain_norm/3.
-        
+
         return self.filt_b,self.filt_a
 
     def analog_poles(self,control_signal):
@@ -458,14 +461,23 @@ class Signal_Coefficients:
 
 
 class Filter_Update: 
-    def __init__(self, target,coef):
+    '''
+    Updater of a band pass filter: the coefficients of the target
+    (a :class:`TimeVaryingLinearFilterbank`) are computed in place from the
+    last value of the control signal. The last ``history`` values of the
+    control signal are kept in ``param`` (none by default).
+    '''
+    def __init__(self, target,coef,history=0):
         self.coef = coef
         self.target = target
-        self.param = []
+        # the coefficients are written directly into the filterbank
+        self.coef.filt_b,self.coef.filt_a = target.filt_b,target.filt_a
+        self.param = deque(maxlen=history)
     def __call__(self, input):
-        reshaped_input = input[-1,:].reshape(1,-1)
-        self.target.filt_b,self.target.filt_a = self.coef.return_coefficients(reshaped_input) 
-        self.param.append(self.coef.control_signal)
+        control_signal = input[-1,:].reshape(1,-1)
+        self.coef.return_coefficients(control_signal)
+        if self.param.maxlen:
+            self.param.append(control_signal.copy())
 
 
 class LowPass_IHC(LinearFilterbank):
@@ -531,7 +543,8 @@ class TanCarneyIHC(CombinedFilterbank):
 
 
 class TanCarneyControl(CombinedFilterbank):
-    def __init__(self, source, cf, update_interval, param=None):
+    def __init__(self, source, cf, update_interval, param=None,
+                 interpolate=False):
         CombinedFilterbank.__init__(self, source)
         source = self.get_modified_source()       
         cf = np.atleast_1d(cf)
@@ -541,7 +554,8 @@ class TanCarneyControl(CombinedFilterbank):
         # band pass filter
         control_coef = Control_Coefficients(cf, samplerate)
         [filt_b,filt_a] = control_coef.return_coefficients(np.zeros((1,len(cf))))        
-        BP_control = LinearFilterbank(source,filt_b,filt_a)
+        BP_control = TimeVaryingLinearFilterbank(source,filt_b,filt_a,
+                                                 interpolate=interpolate)
                 
         # first non linearity of control path
         Acp,Bcp,Ccp=100.,2.5,0.60 
@@ -570,7 +584,8 @@ class TanCarneyControl(CombinedFilterbank):
 
 
 class TanCarneySignal(CombinedFilterbank):    
-    def __init__(self, source, cf, update_interval, param=None):
+    def __init__(self, source, cf, update_interval, param=None,
+                 interpolate=False):
 
         CombinedFilterbank.__init__(self, source)
         source = self.get_modified_source()       
@@ -584,9 +599,11 @@ class TanCarneySignal(CombinedFilterbank):
         # band pass filter
         signal_coef = Signal_Coefficients(cf, samplerate,parameters)
         [filt_b,filt_a] = signal_coef.return_coefficients(np.zeros((1,len(cf))))
-        BP_signal = LinearFilterbank(source,filt_b,filt_a)
+        BP_signal = TimeVaryingLinearFilterbank(source,filt_b,filt_a,
+                                                interpolate=interpolate)
         
-        control_output = TanCarneyControl(source, cf, update_interval, parameters)
+        control_output = TanCarneyControl(source, cf, update_interval,
+                                          parameters, interpolate)
         
         updater = Filter_Update(BP_signal, signal_coef) #instantiation of the updater for the signal path
         output = ControlFilterbank(BP_signal, control_output, BP_signal,
@@ -622,16 +639,24 @@ class TanCarney(CombinedFilterbank):
     ``param``
         Dictionary used to overwrite the default parameters given in the
         original paper. 
+        
+    ``interpolate``
+        If ``True``, the coefficients of the band pass filters are interpolated
+        linearly at each sample between two updates (see
+        :class:`TimeVaryingLinearFilterbank`), which gives more accurate
+        results for a given ``update_interval``.
     '''
         
-    def __init__(self, source, cf, update_interval=1, param=None):
+    def __init__(self, source, cf, update_interval=1, param=None,
+                 interpolate=False):
         CombinedFilterbank.__init__(self, source)
         source = self.get_modified_source()       
         cf = np.atleast_1d(cf)
 
         parameters=set_parameters(cf,param)        
         
-        signal = TanCarneySignal(source, cf, update_interval, parameters)
+        signal = TanCarneySignal(source, cf, update_interval, parameters,
+                                 interpolate)
         ihc = TanCarneyIHC(signal, cf)
         
         self.set_output(ihc)
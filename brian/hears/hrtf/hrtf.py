@@ -1,10 +1,20 @@
 from brian import *
 from ..sounds import Sound
-from ..filtering import FIRFilterbank
+from ..filtering import FIRFilterbank, Filterbank
+from ..filtering.firfilterbank import fast_fft_size, multiply_packed_spectra
+from scipy.fftpack import rfft, irfft
 from copy import copy
+import numpy
+import os
+import hashlib
+import warnings
 
-__all__ = ['HRTF', 'HRTFSet', 'HRTFDatabase',
-           'make_coordinates']
+__all__ = ['HRTF', 'HRTFSet', 'HRTFDatabase', 'HRTFFilterbank',
+           'make_coordinates', 'hrtf_spectra',
+           'save_hrtfset', 'load_hrtfset']
+
+# Default directory of the binary cache of HRTF databases
+default_hrtf_cache = os.path.join(os.path.expanduser('~'), '.brian', 'hrtf')
 
 class HRTF(object):
     '''
@@ -124,7 +134,9 @@ class HRTFSet(object):
     **Attributes**
     
     ``hrtf``
-        A list of ``HRTF`` objects for each index.
+        A list of ``HRTF`` objects for each index. The ``HRTF`` objects are
+        only created when they are accessed (``hrtfset[index]`` only creates
+        one of them).
     ``num_indices``
         The number of HRTF locations. You can also use ``len(hrtfset)``.
     ``num_samples``
@@ -149,6 +161,7 @@ class HRTFSet(object):
         An array of shape (2, num_indices, num_samples) where data[0,:,:] is
         the left ear and data[1,:,:] is the right ear, num_indices is the number
         of HRTFs for each ear, and num_samples is the length of the HRTF.
+        It can be a memory-mapped array (see :func:`load_hrtfset`).
     ``samplerate``
         The sample rate for the HRTFs (should have units of Hz).
     ``coordinates``
@@ -159,14 +172,21 @@ class HRTFSet(object):
         self.data = data
         self.samplerate = samplerate
         self.coordinates = coordinates
-        self.hrtf = []
-        for i in xrange(self.num_indices):
-            l = Sound(self.data[0, i, :], samplerate=self.samplerate)
-            r = Sound(self.data[1, i, :], samplerate=self.samplerate)
-            self.hrtf.append(HRTF(l, r))
-            
+        self._hrtf = [None]*self.num_indices
+
+    def get_hrtf(self, index):
+        if self._hrtf[index] is None:
+            l = Sound(array(self.data[0, index, :]), samplerate=self.samplerate)
+            r = Sound(array(self.data[1, index, :]), samplerate=self.samplerate)
+            self._hrtf[index] = HRTF(l, r)
+        return self._hrtf[index]
+
+    hrtf = property(fget=lambda self:[self.get_hrtf(i) for i in xrange(self.num_indices)])
+
     def __getitem__(self, key):
-        return self.hrtf[key]
+        if isinstance(key, slice):
+            return [self.get_hrtf(i) for i in xrange(*key.indices(self.num_indices))]
+        return self.get_hrtf(key)
     
     def get_index(self, **kwds):
         '''
@@ -183,7 +203,7 @@ class HRTFSet(object):
         return indices[0]
     
     def __call__(self, **kwds):
-        return self.hrtf[self.get_index(**kwds)]
+        return self.get_hrtf(self.get_index(**kwds))
 
     def subset(self, condition):
         '''
@@ -212,11 +232,11 @@ class HRTFSet(object):
                 I = condition.nonzero()[0]
             else:
                 I = condition
-        hrtf = [self.hrtf[i] for i in I]
+        hrtf = [self._hrtf[i] for i in I]
         coords = self.coordinates[I]
         data = self.data[:, I, :]
         obj = copy(self)
-        obj.hrtf = hrtf
+        obj._hrtf = hrtf
         obj.coordinates = coords
         obj.data = data
         return obj
@@ -249,6 +269,8 @@ class HRTFSet(object):
         in the set. If ``interleaved=False`` then
         the channels are arranged in the order LLLL...RRRR..., otherwise they
         are arranged in the order LRLRLR....
+        For a mono source, :class:`HRTFFilterbank` gives the same output more
+        efficiently.
         '''
         if interleaved:
             fir = self.fir_interleaved
@@ -257,6 +279,155 @@ class HRTFSet(object):
         return FIRFilterbank(source, fir, **kwds)
 
 
+def hrtf_spectra(fir, nfft, spectra_dir=None):
+    '''
+    Returns the spectra of the impulse responses ``fir`` (one per row) for
+    FFTs of size ``nfft``, in the packed format of ``scipy.fftpack.rfft``.
+    If ``spectra_dir`` is specified, the spectra are stored in this directory
+    (indexed by the content of ``fir``) and returned as a read-only memory-mapped
+    array, so that they are computed only once and shared between processes.
+    '''
+    if spectra_dir is None:
+        return rfft(fir, n=nfft, axis=1)
+    fir = ascontiguousarray(fir, dtype=float)
+    key = hashlib.sha1(str(nfft) + str(fir.shape) + fir.tostring()).hexdigest()
+    filename = os.path.join(spectra_dir, key + '.npy')
+    if os.path.exists(filename):
+        try:
+            return numpy.load(filename, mmap_mode='r')
+        except (IOError, ValueError): # corrupted file, the spectra are computed again
+            pass
+    spectra = rfft(fir, n=nfft, axis=1)
+    try:
+        if not os.path.exists(spectra_dir):
+            os.makedirs(spectra_dir)
+        # Written to a temporary file first, so that other processes never
+        # read an incomplete file
+        tmpfile = filename + '.' + str(os.getpid())
+        f = open(tmpfile, 'wb')
+        numpy.save(f, spectra)
+        f.close()
+        os.rename(tmpfile, filename)
+    except (IOError, OSError):
+        warnings.warn('Could not write the HRTF spectra in ' + spectra_dir)
+        return spectra
+    return numpy.load(filename, mmap_mode='r')
+
+class HRTFFilterbank(Filterbank):
+    '''
+    Filterbank applying all the HRTFs of an :class:`HRTFSet` to a mono source
+    
+    The output is the same as that of ``hrtfset.filterbank(source)``, but the
+    spectrum of the source is computed only once per block of samples (instead
+    of once per channel) and multiplied with the precomputed spectra of all
+    the HRTFs. This is much faster for large numbers of HRTFs.
+    
+    Initialisation parameters:
+    
+    ``source``
+        The mono source sound or filterbank.
+    ``hrtfset``
+        The :class:`HRTFSet`.
+    ``interleaved=False``
+        Whether the channels are in the order LLLL...RRRR... or LRLRLR... (as
+        in :meth:`HRTFSet.filterbank`).
+    ``blocksize=None``
+        The number of samples filtered with one FFT, by default 3 times the
+        length of the HRTFs. This is also the minimum buffer size. Larger
+        blocks are more efficient, but the HRTF spectra take more memory.
+    ``spectra_dir=None``
+        If specified, the HRTF spectra are stored in this directory and
+        memory-mapped, so that they are only computed once (see
+        :func:`hrtf_spectra`).
+    '''
+    def __init__(self, source, hrtfset, interleaved=False, blocksize=None,
+                 spectra_dir=None):
+        if source.nchannels!=1:
+            raise ValueError('HRTFFilterbank can only be applied to mono sources.')
+        Filterbank.__init__(self, source)
+        if interleaved:
+            fir = hrtfset.fir_interleaved
+        else:
+            fir = hrtfset.fir_serial
+        self.nchannels = fir.shape[0]
+        self.ir_length = fir.shape[1]
+        if blocksize is None:
+            blocksize = 3*self.ir_length
+        self.nfft = fast_fft_size(self.ir_length+blocksize)
+        self.blocksize = self.nfft-self.ir_length
+        self.minimum_buffer_size = self.blocksize
+        self.spectra = hrtf_spectra(fir, self.nfft, spectra_dir)
+        self.input_cache = zeros(self.ir_length)
+        self.fftwork = zeros((self.nchannels, self.nfft))
+
+    def buffer_init(self):
+        Filterbank.buffer_init(self)
+        self.input_cache[:] = 0
+
+    def buffer_apply(self, input):
+        # Overlap-save, as in FFTFIRFilterbank, with one FFT of the source
+        # per block
+        nic = self.ir_length
+        ni = input.shape[0]
+        input = input[:, 0]
+        output = empty((ni, self.nchannels))
+        window = zeros(self.nfft)
+        work = self.fftwork
+        for start in xrange(0, ni, self.blocksize):
+            n = min(self.blocksize, ni-start)
+            window[:nic] = self.input_cache
+            window[nic:nic+n] = input[start:start+n]
+            window[nic+n:] = 0
+            self.input_cache[:] = window[n:n+nic]
+            work[:] = rfft(window)
+            multiply_packed_spectra(work, self.spectra)
+            output[start:start+n] = irfft(work, axis=1, overwrite_x=True)[:, nic:nic+n].T
+        return output
+
+
+def save_hrtfset(hrtfset, filename):
+    '''
+    Saves an :class:`HRTFSet` in binary format, so that it can be loaded
+    with :func:`load_hrtfset`. The impulse responses are saved in
+    ``filename.npy`` and the coordinates and samplerate in
+    ``filename.index.npz``.
+    '''
+    # Written to temporary files first, so that other processes never read
+    # incomplete files, and the index last, so that it only exists when
+    # the data is complete
+    tmp = '.' + str(os.getpid())
+    f = open(filename + '.npy' + tmp, 'wb')
+    numpy.save(f, ascontiguousarray(hrtfset.data, dtype=float))
+    f.close()
+    os.rename(filename + '.npy' + tmp, filename + '.npy')
+    f = open(filename + '.index.npz' + tmp, 'wb')
+    numpy.savez(f, coordinates=hrtfset.coordinates,
+                samplerate=float(hrtfset.samplerate),
+                name=getattr(hrtfset, 'name', ''))
+    f.close()
+    os.rename(filename + '.index.npz' + tmp, filename + '.index.npz')
+
+def load_hrtfset(filename, mmap=True):
+    '''
+    Loads an :class:`HRTFSet` saved with :func:`save_hrtfset`. If ``mmap=True``
+    the impulse responses are memory-mapped (read-only), so that they are only
+    read from the disk when they are used.
+    '''
+    index = numpy.load(filename + '.index.npz')
+    coordinates = index['coordinates']
+    samplerate = float(index['samplerate'])*Hz
+    name = str(index['name'])
+    index.close()
+    if mmap:
+        data = numpy.load(filename + '.npy', mmap_mode='r')
+    else:
+        data = numpy.load(filename + '.npy')
+    hrtfset = HRTFSet(data, samplerate, coordinates)
+    if name:
+        hrtfset.name = name
+    return hrtfset
+
+
 class HRTFDatabase(object):
     '''
     Base class for databases of HRTFs
@@ -270,9 +441,59 @@ class HRTFDatabase(object):
     ``samplerate``
         The intended samplerate (resampling will be used if it is wrong). If
         left unset, the natural samplerate of the data set will be used.    
+    
+    Databases can keep a binary cache of their subjects (see
+    :func:`save_hrtfset`), in the directory given by the ``cache`` attribute
+    (``True`` for the default directory ``~/.brian/hrtf``, ``False`` for no
+    cache). Subjects are then loaded from the cache as memory-mapped arrays,
+    using the method ``load_cached_subject``. The cache can be filled in
+    advance with :meth:`cache_subjects`.
+    
+    .. automethod:: cache_subjects
     '''
+    cache = False
+    
     def __init__(self, samplerate=None):
         raise NotImplementedError
 
     def load_subject(self, subject):
         raise NotImplementedError
+
+    def load_cached_subject(self, name, load, sources=()):
+        '''
+        Returns the :class:`HRTFSet` ``name`` from the cache, or from
+        ``load()`` (which is then saved in the cache). The cached version is
+        only used if it is more recent than the files ``sources``.
+        '''
+        if not self.cache:
+            return load()
+        cache = self.cache
+        if cache is True:
+            cache = default_hrtf_cache
+        filename = os.path.join(cache, name)
+        if os.path.exists(filename + '.index.npz'):
+            mtime = os.path.getmtime(filename + '.index.npz')
+            if max([os.path.getmtime(source) for source in sources]+[0])<=mtime:
+                try:
+                    return load_hrtfset(filename)
+                except Exception: # corrupted cache file, the subject is loaded again
+                    pass
+        hrtfset = load()
+        try:
+            if not os.path.exists(cache):
+                os.makedirs(cache)
+            save_hrtfset(hrtfset, filename)
+        except (IOError, OSError):
+            warnings.warn('Could not write the HRTF cache in ' + cache)
+            return hrtfset
+        return load_hrtfset(filename)
+
+    def cache_subjects(self, subjects=None):
+        '''
+        Converts the given subjects (by default, all of them) to the binary
+        cache, if they are not already there.
+        '''
+        if subjects is None:
+            subjects = self.subjects
+        for subject in subjects:
+            self.load_subject(subject)
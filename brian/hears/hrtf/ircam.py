@@ -25,6 +25,11 @@ class IRCAM_LISTEN(HRTFDatabase):
     ``samplerate=None``
         If specified, you can resample the impulse responses to a different
         samplerate, otherwise uses the default 44.1 kHz.
+    ``cache=False``
+        The directory of the binary cache of the subjects (``True`` for the
+        default directory ``~/.brian/hrtf``). If specified, each subject is
+        converted the first time it is loaded, and then loaded from the cache
+        as a memory-mapped array (see :class:`HRTFDatabase`).
     
     The coordinates are pairs ``(azim, elev)`` where ``azim`` ranges from 0
     to 345 degrees in steps of 15 degrees, and elev ranges from -45 to 90 in
@@ -37,11 +42,13 @@ class IRCAM_LISTEN(HRTFDatabase):
     Each subject archive should be extracted to a folder (e.g. IRCAM) with the
     names of the subject, e.g. IRCAM/IRC_1002, etc.
     '''
-    def __init__(self, basedir, compensated=False, samplerate=None):
+    def __init__(self, basedir, compensated=False, samplerate=None,
+                 cache=False):
         if not isinstance(basedir, (list, tuple)):
             basedir = [basedir]
         self.basedir = basedir
         self.compensated = compensated
+        self.cache = cache
         names = []
         for basedir in self.basedir:
             names += glob(os.path.join(basedir, 'IRC_*'))
@@ -58,28 +65,33 @@ class IRCAM_LISTEN(HRTFDatabase):
 
 
         subject = str(subject)
+        filename = None
+        for basedir in self.basedir:
+            name = os.path.join(basedir, 'IRC_' + subject)
+            if self.compensated:
+                name = os.path.join(name, 'COMPENSATED/MAT/HRIR/IRC_' + subject + '_C_HRIR.mat')
+            else:
+                name = os.path.join(name, 'RAW/MAT/HRIR/IRC_' + subject + '_R_HRIR.mat')
+            if os.path.exists(name):
+                filename = name
+                break
+        if filename is None:
+            raise IOError("Couldn't find the HRTF files for subject "+str(subject))
+        name = 'IRCAM_' + subject + ('_C' if self.compensated else '_R')
+        if rounddot5:
+            name += '_rounded'
+        return self.load_cached_subject(name,
+                    lambda: self.load_subject_file(filename, subject, rounddot5),
+                    sources=[filename])
+
+    def load_subject_file(self, filename, subject, rounddot5=False):
         if subject[0] == '3':
             # this is the case only for stuffed animals recordings
             # IRC_30..
             samplerate = 192*kHz
         else:
             samplerate = 44.1*kHz
-        ok = False
-        k = 0
-        while k < len(self.basedir) and not ok:
-            try:
-                filename = os.path.join(self.basedir[k], 'IRC_' + subject)
-                if self.compensated:
-                    filename = os.path.join(filename, 'COMPENSATED/MAT/HRIR/IRC_' + subject + '_C_HRIR.mat')
-                else:
-                    filename = os.path.join(filename, 'RAW/MAT/HRIR/IRC_' + subject + '_R_HRIR.mat')
-                m = loadmat(filename, struct_as_record=True)
-                ok = True
-            except IOError:
-                ok = False
-            k += 1
-        if not ok:
-            raise IOError("Couldn't find the HRTF files for subject "+str(subject))
+        m = loadmat(filename, struct_as_record=True)
 
         if 'l_hrir_S' in m.keys(): # RAW DATA
             affix = '_hrir_S'
@@ -46,7 +46,8 @@ from connections import Connection, SparseConnectionVector
 from numpy import array, zeros, mean, histogram, linspace, tile, digitize,     \
         copy, ones, rint, exp, arange, convolve, argsort, mod, floor, asarray, \
         maximum, Inf, amin, amax, sort, nonzero, setdiff1d, diag, hstack, resize,\
-         inf, var, tril, empty, float64, array, sum, int32, ceil
+         inf, var, tril, empty, float64, array, sum, int32, int64, ceil, memmap, \
+         ascontiguousarray, searchsorted
 from scipy.spatial.distance import sqeuclidean
 from itertools import repeat, izip
 from clock import guess_clock, EventClock, Clock
@@ -56,11 +57,17 @@ from collections import defaultdict
 import types
 from operator import isSequenceType
 from tools.statistics import firing_rate
+from utils.dynamicarray import DynamicArray, DynamicArray1D
 from neurongroup import NeuronGroup
 import bisect
 from base import *
 from time import time
 import datetime
+import threading
+import Queue
+import atexit
+import weakref
+import os
 try:
     import pylab, matplotlib
 except:
@@ -108,7 +115,9 @@ class SpikeMonitor(Connection, Monitor):
         The number of recorded spikes
     ``spikes``
         A time ordered list of pairs ``(i,t)`` where neuron ``i`` fired
-        at time ``t``.
+        at time ``t``. The list is built from the recorded arrays on the
+        first access after new spikes were recorded, use ``it`` for faster
+        access.
     ``spiketimes``
         A dictionary with keys the indices of the neurons, and values an
         array of the spike times of that neuron. For example,
@@ -128,6 +137,12 @@ class SpikeMonitor(Connection, Monitor):
     To define a custom monitor, either define a subclass and
     rewrite the ``propagate`` method, or pass the monitoring function
     as an argument (``function=myfunction``, with ``def myfunction(spikes):...``)
+
+    The spikes are stored in two arrays (neuron indices and time steps of
+    the clock of the source group, so that the spike times are exactly
+    ``step*dt``), which grow as needed. The spike times of each neuron are
+    obtained by sorting these arrays by neuron index, which is done once
+    when ``spiketimes`` is accessed after new spikes were recorded.
     '''
     # isn't there a units problem here for delay?
     def __init__(self, source, record=True, delay=0, function=None):
@@ -135,7 +150,9 @@ class SpikeMonitor(Connection, Monitor):
         self.source = source # pointer to source group
         self.target = None
         self.nspikes = 0
-        self.spikes = []
+        self._i = DynamicArray1D(0, dtype=int32) # neuron indices
+        self._step = DynamicArray1D(0, dtype=int64) # time steps of the spikes
+        self._spikes = None # list of spikes, built on access
         self.record = record
         self.W = None # should we just remove this variable?
         source.set_max_delay(delay)
@@ -150,7 +167,9 @@ class SpikeMonitor(Connection, Monitor):
         Clears all monitored spikes
         """
         self.nspikes = 0
-        self.spikes = []
+        self._i = DynamicArray1D(0, dtype=int32)
+        self._step = DynamicArray1D(0, dtype=int64)
+        self._spikes = None
         self._newspikes = True #recreate self._spiketimes on next access
 
     def propagate(self, spikes):
@@ -161,9 +180,15 @@ class SpikeMonitor(Connection, Monitor):
         '''
         if len(spikes):
             self._newspikes = True
+            self._spikes = None
             self.nspikes += len(spikes)
             if self.record:
-                self.spikes += zip(spikes, repeat(self.source.clock.t))
+                n = len(self._i)
+                self._i.resize(n + len(spikes))
+                self._step.resize(n + len(spikes))
+                self._i.data[n:] = spikes
+                clock = self.source.clock
+                self._step.data[n:] = int(round(clock._t / clock._dt))
 
     def origin(self, P, Q):
         '''
@@ -181,22 +206,34 @@ class SpikeMonitor(Connection, Monitor):
     def getspiketimes(self):
         if self._newspikes:
             self._newspikes = False
+            # Sort the spikes by neuron (the sort is stable so spike times
+            # remain sorted), rowind[i] is the position of the first spike
+            # of neuron i
+            order = argsort(self._i.data, kind='mergesort')
+            rowind = searchsorted(self._i.data[order], arange(len(self.source) + 1))
+            t = self._times()[order]
             self._spiketimes = {}
             for i in xrange(len(self.source)):
-                self._spiketimes[i] = []
-            for i, t in self.spikes:
-                self._spiketimes[i].append(float(t))
-            for i in xrange(len(self.source)):
-                self._spiketimes[i] = array(self._spiketimes[i])
+                self._spiketimes[i] = t[rowind[i]:rowind[i + 1]]
         return self._spiketimes
     spiketimes = property(fget=getspiketimes)
+
+    def _times(self):
+        '''
+        Returns the array of spike times (in second), from the time steps.
+        '''
+        return self._step.data * self.source.clock._dt
+
+    def getspikes(self):
+        if self._spikes is None:
+            self._spikes = zip(self._i.data.tolist(),
+                               [t * second for t in self._times().tolist()])
+        return self._spikes
+    spikes = property(fget=getspikes)
     
     @property
     def it(self):
-        if len(self.spikes)==0:
-            return array([], dtype=int), array([], dtype=float)
-        i, t = zip(*self.spikes)
-        return array(i, dtype=int), array(t, dtype=float)
+        return array(self._i.data, dtype=int), self._times()
 
     def __repr__(self):
         repr_str = 'SpikeMonitor(%s, record=%s' % (repr(self.source),
@@ -384,16 +421,31 @@ class StateSpikeMonitor(SpikeMonitor):
         self._vars = [source.state_(v) for v in var]
         self._varindex = dict((v, i + 2) for i, v in enumerate(var))
         self._units = [source.unit(v) for v in var]
+        self._values = [DynamicArray1D(0, dtype=float64) for _ in var]
+
+    def reinit(self):
+        SpikeMonitor.reinit(self)
+        self._values = [DynamicArray1D(0, dtype=float64) for _ in self._varnames]
 
     def propagate(self, spikes):
         if len(spikes):
-            self.nspikes += len(spikes)
-            recordedstate = [ [ x * u for x in self.source.state_(varname)[spikes]] for varname, u in izip(self._varnames, self._units)]
-            # the above line used to be this one:
-            # recordedstate = [ [x * u for x in v[spikes]] for v, u in izip(self._vars, self._units) ]
-            # which didn't take the values of the variables if they were defined by a static eqn
-            # a = b + c : 1
-            self.spikes += zip(spikes, repeat(self.source.clock.t), *recordedstate)
+            n = len(self._i)
+            SpikeMonitor.propagate(self, spikes)
+            # the values are taken with state_ rather than from self._vars
+            # so that variables defined by a static eqn (a = b + c : 1) work
+            for varname, values in izip(self._varnames, self._values):
+                values.resize(n + len(spikes))
+                values.data[n:] = self.source.state_(varname)[spikes]
+
+    def getspikes(self):
+        if self._spikes is None:
+            recordedstate = [[x * u for x in values.data.tolist()]
+                             for values, u in izip(self._values, self._units)]
+            self._spikes = zip(self._i.data.tolist(),
+                               [t * second for t in self._times().tolist()],
+                               *recordedstate)
+        return self._spikes
+    spikes = property(fget=getspikes)
 
     def __getitem__(self, i):
         return NotImplemented # don't use the version from SpikeMonitor
@@ -401,17 +453,17 @@ class StateSpikeMonitor(SpikeMonitor):
     def times(self, i=None):
         '''Returns the spike times (of neuron ``i`` if specified)'''
         if i is not None:
-            return array([x[1] for x in self.spikes if x[0] == i])
+            return self._times()[self._i.data == i]
         else:
-            return array([x[1] for x in self.spikes])
+            return self._times()
 
     def values(self, var, i=None):
         '''Returns the recorded values of ``var`` (for spikes from neuron ``i`` if specified)'''
-        v = self._varindex[var]
+        values = self._values[self._varindex[var] - 2].data
         if i is not None:
-            return array([x[v] for x in self.spikes if x[0] == i])
+            return values[self._i.data == i]
         else:
-            return array([x[v] for x in self.spikes])
+            return array(values)
 
     def __repr__(self):
         return 'StateSpikeMonitor(%s, var=%s)' % (repr(self.source),
@@ -497,6 +549,138 @@ class ISIHistogramMonitor(HistogramMonitorBase):
         
         return description
 
+# Size of the file buffer of FileSpikeMonitor and AERSpikeMonitor (bytes)
+SPIKE_FILE_BUFFER_SIZE = 2 ** 20
+# Maximum number of timesteps waiting to be written to the file, the
+# simulation blocks when it is reached
+SPIKE_FILE_QUEUE_SIZE = 10000
+
+# The background writers which are not closed yet
+_background_writers = weakref.WeakSet()
+
+def _close_background_writers():
+    '''
+    Closes the background writers when the program ends. All of them are
+    closed before the first error is raised.
+    '''
+    error = None
+    for writer in list(_background_writers):
+        try:
+            writer.close()
+        except Exception, e:
+            if error is None:
+                error = e
+    if error is not None:
+        raise error
+
+atexit.register(_close_background_writers)
+
+def _write_from_queue(queue, f, format, errors):
+    '''
+    Loop of the thread of a :class:`BackgroundWriter`. It only uses the queue,
+    the file and the format function (not the writer), so that the writer and
+    the objects using it can be garbage collected while the thread runs. The
+    file is closed when ``None`` is read from the queue, the exceptions are
+    appended to ``errors``.
+    '''
+    while True:
+        items = [queue.get()]
+        # write everything that is already waiting at once
+        try:
+            while True:
+                items.append(queue.get_nowait())
+        except Queue.Empty:
+            pass
+        try:
+            if not errors:
+                f.write(''.join([format(*args) for args in items
+                                 if args is not None]))
+        except Exception, e:
+            errors.append(e)
+        if items[-1] is None:
+            try:
+                f.close()
+            except Exception, e:
+                errors.append(e)
+        for args in items:
+            queue.task_done()
+        if items[-1] is None:
+            return
+
+class BackgroundWriter(object):
+    '''
+    Writes to a file from a background thread
+    
+    Initialised with an open file ``f`` and a function ``format`` which
+    converts the arguments passed to :meth:`write` to a string. The
+    conversion and the write are done by the background thread, so that
+    :meth:`write` only blocks if ``maxsize`` writes are waiting. The writer
+    is closed automatically when it is garbage collected or when the program
+    ends. ``format`` should not refer to the object using the writer (e.g.
+    a static method), otherwise this object is kept alive by the thread
+    until the writer is closed.
+    
+    **Methods**
+    
+    .. method:: write(*args)
+    
+        Writes ``format(*args)`` to the file. Raises ``ValueError`` if the
+        writer is closed.
+        
+    .. method:: flush()
+    
+        Waits until all the data has been written to the file. Exceptions
+        raised by the background thread are raised here, and ``ValueError``
+        if the writer is closed.
+        
+    .. method:: close()
+    
+        Flushes and closes the file.
+    '''
+    def __init__(self, f, format, maxsize=SPIKE_FILE_QUEUE_SIZE):
+        self.f = f
+        self.errors = []
+        self.closed = False
+        self.queue = Queue.Queue(maxsize)
+        self.thread = threading.Thread(target=_write_from_queue,
+                                       args=(self.queue, f, format, self.errors))
+        self.thread.daemon = True
+        self.thread.start()
+        _background_writers.add(self)
+
+    def write(self, *args):
+        if self.closed:
+            raise ValueError('I/O operation on closed file')
+        self.queue.put(args)
+
+    def flush(self):
+        if self.closed:
+            raise ValueError('I/O operation on closed file')
+        self.queue.join()
+        self.f.flush()
+        self._raise_error()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        _background_writers.discard(self)
+        self.queue.put(None)
+        self.thread.join()
+        self._raise_error()
+
+    def _raise_error(self):
+        if self.errors:
+            error = self.errors.pop(0)
+            del self.errors[:]
+            raise error
+
+    def __del__(self):
+        # the thread writes the remaining data and closes the file
+        if not self.closed:
+            self.queue.put(None)
+
+
 class FileSpikeMonitor(SpikeMonitor):
     """Records spikes to a file
 
@@ -512,8 +696,15 @@ class FileSpikeMonitor(SpikeMonitor):
     
     Where ``i`` is the neuron that fired, and ``t`` is the time in seconds.
     
-    Has one additional method:
+    The spikes are written to the file by a background thread (see
+    :class:`BackgroundWriter`), the file is complete at the end of each
+    run.
     
+    Has two additional methods:
+    
+    ``flush()``
+        Waits until all the spikes have been written to the file (this
+        is done automatically at the end of each run).
     ``close()``
         Closes the file manually (will happen automatically when
         the program ends).
@@ -521,20 +712,37 @@ class FileSpikeMonitor(SpikeMonitor):
     def __init__(self, source, filename, record=False, delay=0):
         super(FileSpikeMonitor, self).__init__(source, record, delay)
         self.filename = filename
-        self.f = open(filename, 'w')
+        self.open()
+
+    def open(self):
+        '''
+        Opens the file (erasing it) and starts the background writer.
+        '''
+        self.f = open(self.filename, 'w', SPIKE_FILE_BUFFER_SIZE)
+        self._writer = BackgroundWriter(self.f, self.format)
 
     def reinit(self):
-        self.close_file()
-        self.f = open(self.filename, 'w')
+        self.close()
+        self.open()
 
     def propagate(self, spikes):
         if len(spikes):
             super(FileSpikeMonitor, self).propagate(spikes)
-            for i in spikes:
-                self.f.write(str(i) + ", " + str(float(self.source.clock.t)) + "\n")
+            self._writer.write(array(spikes), float(self.source.clock.t))
+
+    @staticmethod
+    def format(spikes, t):
+        '''
+        Returns the lines written to the file for spikes at time ``t``.
+        '''
+        end = ", " + str(t) + "\n"
+        return ''.join([str(i) + end for i in spikes])
+
+    def flush(self):
+        self._writer.flush()
 
     def close(self):
-        self.f.close()
+        self._writer.close()
 
 
 # The default header for AER files (see AERSpikeMonitor init):
@@ -560,31 +768,39 @@ class AERSpikeMonitor(FileSpikeMonitor):
     creates  smaller files. On the other hand those files are not
     human-readable because they are in binary format. 
 
+    As for :class:`FileSpikeMonitor`, the spikes are written by a
+    background thread.
     
-    Has one additional method:
+    Has two additional methods:
     
+    ``flush()``
+        Waits until all the spikes have been written to the file (this
+        is done automatically at the end of each run).
     ``close()``
         Closes the file manually (will happen automatically when
         the program ends).
 
     
     """
-    def __init__(self, source, filename, record=False, delay=0):
-        super(FileSpikeMonitor, self).__init__(source, record, delay)
-        self.filename = filename
-        self.f = open(filename, 'wb')
+    def open(self):
+        self.f = open(self.filename, 'wb', SPIKE_FILE_BUFFER_SIZE)
         header = AER_HEADER % self.source.clock.dt.__repr__()
         header += str(datetime.datetime.now()) + '\n'
         self.f.write(header)
+        self._writer = BackgroundWriter(self.f, self.format)
 
     def propagate(self, spikes):
 #        super(AERSpikeMonitor, self).propagate(spikes)
-        addr = array(spikes, dtype = int32)
+        if len(spikes):
+            self._writer.write(array(spikes, dtype = int32),
+                               int(ceil(float(self.source.clock.t/self.source.clock.dt))))
+
+    @staticmethod
+    def format(addr, timestamp):
         x = zeros(2*len(addr), dtype = int32)
         x[1::2] = addr[::-1]
-        x[::2] = int(ceil(float(self.source.clock.t/self.source.clock.dt)))
-        s = x.tostring()[::-1]
-        self.f.write(s)
+        x[::2] = timestamp
+        return x.tostring()[::-1]
 
 
 class PopulationRateMonitor(SpikeMonitor):
@@ -718,6 +934,14 @@ class StateMonitor(NetworkOperation, Monitor):
         be taken into account, as network updates are done clock by clock.
         Use the ``timestep`` parameter if you need recordings to be made at a
         precise point in the network update step.
+    ``spill_file``
+        If specified, the recorded values are written to this file every
+        ``spill_block`` recordings, so that long recordings only use a
+        bounded amount of memory. The ``values`` are then memory-mapped from
+        the file (see ``numpy.memmap``).
+    ``spill_block``
+        The number of recordings kept in memory before they are written to
+        ``spill_file``.
 
     The :class:`StateMonitor` object has the following properties:
 
@@ -732,7 +956,11 @@ class StateMonitor(NetworkOperation, Monitor):
         The square root of ``var``, as in ``mean``
     ``values``
         A 2D array of the values of all the recorded neurons, each row is a
-        single neuron's values.
+        single neuron's values. This is a read-only view on the recorded
+        data (the recordings are stored in a preallocated array which grows
+        as needed), use ``values.copy()`` to modify them. If ``spill_file``
+        is specified, it is a memory map of the file instead, which is only
+        valid until the monitor is reinitialised.
         
     In addition, if :class:`M`` is a :class:`StateMonitor` object, you write::
     
@@ -780,12 +1008,13 @@ class StateMonitor(NetworkOperation, Monitor):
     var_ = var
     std = property(fget=lambda self:self.var ** .5)
     std_ = std
-    times = property(fget=lambda self:array(self._times))
+    times = property(fget=lambda self:array(self._times.data))
     times_ = times
     values = property(fget=lambda self:self.getvalues())
     values_ = values
 
-    def __init__(self, P, varname, clock=None, record=False, timestep=1, when='end'):
+    def __init__(self, P, varname, clock=None, record=False, timestep=1, when='end',
+                 spill_file=None, spill_block=1000):
         '''
         -- P is the neuron group
         -- varname is the variable name
@@ -801,6 +1030,8 @@ class StateMonitor(NetworkOperation, Monitor):
         -- timestep defines how often a recording is made (e.g. if you have a very
            small dt, you might not want to record every value of the variable), it
            is an integer (multiple of the clock dt)
+        -- spill_file is a file where the recorded values are written every
+           spill_block recordings
         '''
         NetworkOperation.__init__(self, None, clock=clock, when=when)
         self.record = record
@@ -813,6 +1044,8 @@ class StateMonitor(NetworkOperation, Monitor):
         self._values = None
         self.P = P
         self.varname = varname
+        self.spill_file = spill_file
+        self.spill_block = spill_block
         self.N = 0 # number of steps
         self._recordstep = 0
         if record is False:
@@ -830,12 +1063,19 @@ class StateMonitor(NetworkOperation, Monitor):
             self._mu += V
             self._sqr += V * V
         elif self.curtimestep == self.timestep:
-            i = self._recordstep
-            if not isinstance(self.record, bool):
-                self._values.append(V[self.record])
-            elif self.record is True:
-                self._values.append(V.copy())
-            self._times.append(self.clock._t)
+            i = self._recordstep - self._nspilled # row in the buffer
+            if i == self._values.shape[0]: # the buffer is full
+                if self.spill_file is None:
+                    self._values.resize((2 * i + 1, self._values.shape[1]))
+                else:
+                    self._spill()
+                    i = 0
+            if self.record is True:
+                self._values.data[i] = V
+            else:
+                self._values.data[i] = V[self.record]
+            self._times.resize(self._recordstep + 1)
+            self._times.data[self._recordstep] = self.clock._t
             self._recordstep += 1
         self.curtimestep -= 1
         if self.curtimestep == 0: self.curtimestep = self.timestep
@@ -850,35 +1090,67 @@ class StateMonitor(NetworkOperation, Monitor):
             if isinstance(self.record, int) and self.record != i or (not isinstance(self.record, int) and i not in self.record):
                 raise IndexError('Neuron ' + str(i) + ' was not recorded.')
             try:
-                return self.values[self.recordindex[i]]
+                return array(self._getvalues()[self.recordindex[i]])
             except:
                 if i == self.record:
-                    return self.values[0]
+                    return array(self._getvalues()[0])
                 else:
                     raise
         elif self.record is True:
-            return self.values[i]
+            return array(self._getvalues()[i])
 
     def getvalues(self):
-        if len(self._values):
-            newvalues = array(self._values)
-            if len(newvalues.shape)==1:
-                newvalues.shape = (1, newvalues.size)
-            else:
-                newvalues = newvalues.T
-            values = hstack((self._values_cache, newvalues))
-            self._values_cache = values
-            self._values = []
-        else:
-            values = self._values_cache    
+        values = self._getvalues().view()
+        values.flags.writeable = False
         return values
     getvalues_ = getvalues
 
+    def _getvalues(self):
+        '''
+        Returns the recorded values without copying them: a view on the
+        buffer, or the memory map of the spill file.
+        '''
+        if self.spill_file is None:
+            return self._values.data[:self._recordstep].T
+        self._spill()
+        nrecorded = self._values.shape[1]
+        if self._nspilled == 0:
+            return zeros((nrecorded, 0))
+        if self._spillmap is None or self._spillmap.shape[0] != self._nspilled:
+            self._spillmap = memmap(self.spill_file, dtype=float64, mode='r+',
+                                    shape=(self._nspilled, nrecorded))
+        return self._spillmap.T
+
+    def _spill(self):
+        '''
+        Writes the values in the buffer to the spill file.
+        '''
+        n = self._recordstep - self._nspilled
+        if n:
+            self._spillfile.seek(0, 2)
+            self._values.data[:n].tofile(self._spillfile)
+            self._spillfile.flush()
+            self._nspilled += n
+
     def reinit(self):
-        self._values = []
-        self._times = []
         ri = self.get_record_indices()
-        self._values_cache = zeros((len(ri), 0))
+        if self.spill_file is None:
+            # the buffer is resized by __call__ (doubling its size)
+            self._values = DynamicArray((0, len(ri)), dtype=float64, factor=1)
+        else:
+            self._values = DynamicArray((self.spill_block, len(ri)), dtype=float64)
+            if getattr(self, '_spillfile', None) is not None:
+                self._spillfile.close()
+            self._spillmap = None
+            # A new file is created rather than truncating the old one, so
+            # that memory maps returned by getvalues remain readable
+            try:
+                os.remove(self.spill_file)
+            except OSError:
+                pass
+            self._spillfile = open(self.spill_file, 'w+b')
+        self._times = DynamicArray1D(0)
+        self._nspilled = 0
         self.N = 0
         self._recordstep = 0
         self._mu = zeros(len(self.P))
@@ -963,7 +1235,7 @@ class StateMonitor(NetworkOperation, Monitor):
         at spike times are replaced with the given value (peak value of spike).
         """
         dt = self.clock.dt
-        values = self.values
+        values = self._getvalues()
         for i, neuron in enumerate(self.get_record_indices()):
             values[i,array(spikemonitor[neuron]/dt, dtype=int)] = value
         #self._values = values # or converted back to a list?
@@ -1436,7 +1708,7 @@ class VanRossumMetric(StateMonitor):
             distance_matrix=zeros((nbr_neurons,nbr_neurons),dtype=float64)
             nbr_time_step=int(len(self[0]))
             dt=float(self.dt)
-            traces=self.values
+            traces=ascontiguousarray(self.values)
             tau=float(self.tau)
             
             code='''
@@ -1465,7 +1737,7 @@ class VanRossumMetric(StateMonitor):
         else:
             nbr_time_step=int(len(self[0]))
             self.distance_matrix=zeros((self.nbr_neurons,self.nbr_neurons))
-            values = self.values
+            values = ascontiguousarray(self.values)
             memsize_mb = float(self.nbr_neurons*nbr_time_step*8)/1024**2
            # tt=time()
             if memsize_mb>200:
@@ -34,10 +34,12 @@
 #
 import copy
 import gc
+import heapq
 import magic
 import time
 from collections import defaultdict
 from itertools import chain
+from multiprocessing.pool import ThreadPool
 from operator import isSequenceType
 from inspect import *
  
@@ -46,8 +48,19 @@ from brian.clock import guess_clock, Clock
 from brian.connections import *
 from brian.globalprefs import *
 from brian.neurongroup import NeuronGroup
+from brian.stateupdater import LinearStateUpdater, NonlinearStateUpdater, \
+     RK2StateUpdater, ExponentialEulerStateUpdater, LazyStateUpdater, \
+     SynapticNoise, ParallelStateUpdater
+from brian.threshold import Threshold, VariableThreshold, EmpiricalThreshold, \
+     NoThreshold, PoissonThreshold, HomogeneousPoissonThreshold, \
+     ParallelThreshold
+from brian.reset import Reset, VariableReset, Refractoriness, NoReset, \
+     ParallelReset
+from brian.directcontrol import FastSpikeGeneratorThreshold
+from numpy import ndarray, may_share_memory
 from brian.units import second
 from brian.utils.progressreporting import *
+from brian.utils.profiling import NetworkProfile
 
 '''
 Network class
@@ -57,6 +70,7 @@ __all__ = ['Network', 'MagicNetwork', 'NetworkOperation', 'network_operation', '
 
 
 globally_stopped = False
+network_thread_pools = {}
 
 
 class Network(object):
@@ -96,10 +110,11 @@ class Network(object):
         as initialisation.
     ``remove(...)``
         Remove objects from the Network.
-    ``run(duration[, report[, report_period]])``
+    ``run(duration[, threads[, report[, report_period]]])``
         Runs the network for the given duration. See below for details about
         what happens when you do this. See documentation for :func:`run` for
-        an explanation of the ``report`` and ``report_period`` keywords.
+        an explanation of the ``threads``, ``report`` and ``report_period``
+        keywords.
     ``reinit(states=True)``
         Reinitialises the network, runs each object's ``reinit()`` and each
         clock's ``reinit()`` method (resetting them to 0). If ``states=False``
@@ -203,6 +218,7 @@ class Network(object):
         self.update_schedule_standard()
         self.prepared = False
         self._added_objects = []
+        self._thread_pool = None
         for o in chain(args, kwds.itervalues()):
             self.add(o)
 
@@ -457,15 +473,35 @@ class Network(object):
         is active. This is generic and works for single or multiple
         clocks.
         
+        For running with several threads, self._threaded_schedule[id(clock)]
+        is the same schedule as a list of batches of functions, where the
+        functions of a batch can be called concurrently: the group updates
+        and resets which don't use the same group (see group_resources), and
+        the connections which don't modify the same target variable (see
+        connection_targets and conflict_free_batches).
+        
+        In addition, self._fused_update[id(clock)] is a function that runs
+        the schedule of that clock for a given number of steps (see
+        make_fused_update), it is not defined for clocks whose schedule
+        contains objects which can do anything at any step, e.g. user defined
+        network operations (see can_fuse).
+        
+        Finally, self._profile_schedule[id(clock)] is the same schedule as
+        a list of tuples (f, item, obj, objfun), used to build the profiled
+        schedule (see run(profile=True)).
+        
         See documentation for set_update_schedule for an explanation of
         the self._schedule object. 
         '''
         self._update_schedule = defaultdict(list)
+        self._threaded_schedule = defaultdict(list)
+        self._profile_schedule = defaultdict(list)
         if hasattr(self, 'clocks'):
             clocks = self.clocks
         else:
             clocks = [self.clock]
         clockset = clocks
+        stepwise = set()
         for item in self._schedule:
             # we define some simple names for common schedule items
             if isinstance(item, str):
@@ -501,6 +537,10 @@ class Network(object):
             else:
                 # we allow the more general form of usage as well
                 objset, objfun, allclocks = item
+            if isinstance(item, str):
+                kind = item
+            else:
+                kind = 'custom'
             for obj in objset:
                 if objfun is None:
                     f = obj
@@ -512,36 +552,74 @@ class Network(object):
                     useclockset = clockset
                 for clock in useclockset:
                     self._update_schedule[id(clock)].append(f)
+                    self._profile_schedule[id(clock)].append((f, kind, obj, objfun))
+                    if not can_fuse(obj):
+                        stepwise.add(id(clock))
+            # Build the schedule used with several threads, a list of
+            # batches of functions which can be called concurrently
+            if item in ('groups', 'resets'):
+                batches = conflict_free_batches(objset,
+                    lambda G: group_resources(G, objfun, self.groups))
+            elif item == 'connections':
+                batches = conflict_free_batches(objset)
+            else:
+                batches = [[obj] for obj in objset]
+            for batch in batches:
+                batch_schedule = defaultdict(list)
+                for obj in batch:
+                    if objfun is None:
+                        f = obj
+                    else:
+                        f = getattr(obj, objfun)
+                    if not allclocks:
+                        useclockset = [obj.clock]
+                    else:
+                        useclockset = clockset
+                    for clock in useclockset:
+                        batch_schedule[id(clock)].append(f)
+                for clockid, functions in batch_schedule.iteritems():
+                    self._threaded_schedule[clockid].append(functions)
+        self._fused_update = {}
+        for clock in clockset:
+            if clock is not None and id(clock) not in stepwise:
+                self._fused_update[id(clock)] = make_fused_update(
+                                        self._update_schedule[id(clock)], clock)
 
     def update(self):
         for f in self._update_schedule[id(self.clock)]:
             f()
 
-    """
-    def update_threaded(self,queue):
+    def update_threaded(self):
         '''
-        EXPERIMENTAL (not useful for the moment)
-        Parallel update of the network (using threads).
+        Same as update(), but the functions of each batch of the threaded
+        schedule are called concurrently in the thread pool.
         '''
-        # Update groups: one group = one thread
-        for P in self.groups:
-            queue.put(P)
-        queue.join() # Wait until job is done
-
-        # The following is done serially
-        # Propagate spikes
-        for C in self.connections:
-            C.propagate(C.source.get_spikes(C.delay))
-            
-        # Miscellanous operations
-        for op in self.operations:
-            op()
-    """
+        for batch in self._threaded_schedule[id(self.clock)]:
+            if len(batch) == 1:
+                batch[0]()
+            else:
+                self._thread_pool.map(apply, batch, chunksize=1)
 
-    def run(self, duration, threads=1, report=None, report_period=10 * second):
+    def run(self, duration, threads=1, report=None, report_period=10 * second,
+            profile=False):
         '''
         Runs the simulation for the given duration.
+        
+        With ``threads`` greater than 1, the groups are updated concurrently
+        on this number of threads (as are the resets) if they don't use the
+        same group, and the connections are propagated concurrently if they
+        don't modify the same target variable. Groups with user defined
+        functions (state updaters, thresholds or resets), which could use any
+        group, are updated on their own.
+        
+        With ``profile=True``, each function of the update schedule is timed
+        and the run returns a :class:`~brian.utils.profiling.NetworkProfile`
+        giving the time spent in each object, the number of calls and the
+        number of events (spikes or synaptic events) processed. The
+        schedule is then run step by step on a single thread.
         '''
+        if profile:
+            return self._profiled_run(duration, report, report_period)
         global globally_stopped
         self.stopped = False
         globally_stopped = False
@@ -563,28 +641,82 @@ class Network(object):
                 next_report_time = report.next_report_time
 
         if self.clock.still_running() and not self.stopped and not globally_stopped:
-            not_same_clocks = not self.same_clocks()
-            clk = self.clock
+            # The clocks that are not currently being updated are kept in a
+            # heap ordered by (t, order), see Clock.__lt__. The current clock
+            # is advanced until the clock at the top of the heap is due, so
+            # that with a fast and a slow clock we only touch the heap when
+            # we actually switch between them.
+            fusedsteps = get_global_preference('fusedsteps')
+            if threads > 1:
+                update = self.update_threaded
+                # not the pools of brian.utils.parallel, the group updates
+                # can use those from inside these threads
+                if threads not in network_thread_pools:
+                    network_thread_pools[threads] = ThreadPool(threads)
+                self._thread_pool = network_thread_pools[threads]
+                fusedsteps = 0
+            else:
+                update = self.update
+            if self.same_clocks():
+                waiting = []
+                clk = self.clock
+            else:
+                waiting = list(self.clocks)
+                heapq.heapify(waiting)
+                clk = self.clock = heapq.heappop(waiting)
             while clk.still_running() and not self.stopped and not globally_stopped:
                 if report is not None:
                     cur_time = time.time()
                     if cur_time > next_report_time:
                         next_report_time = cur_time + float(report_period)
                         report.update((self.clock.t - self.clock.start) / duration)
-                self.update()
+                if fusedsteps and id(clk) in self._fused_update:
+                    # Run as many steps as we can without having to check
+                    # for another clock or the end of the run, leaving at
+                    # least one step for the standard update below
+                    limit = clk._end
+                    if waiting:
+                        limit = min(limit, waiting[0]._t)
+                    n = min(int((limit - clk._t) / clk._dt) - 1, fusedsteps)
+                    if n > 0:
+                        self._fused_update[id(clk)](n)
+                update()
                 clk.tick()
-                if not_same_clocks:
-                    # Find the next clock to update
-                    #self.clock = min([(clock.t, id(clock), clock) for clock in self.clocks])[2]
-                    clk = self.clock = min(self.clocks)
-                    #heapq.heappush(self.clocks, self.clock)
-                    #clk = self.clock = heapq.heappop(self.clocks)
-                    #clk = self.clock = heapq.heappushpop(self.clocks, self.clock)
-                    #if not clk<self.clocks[0]:
-                    #    clk = self.clock = heapq.heapreplace(self.clocks, self.clock)
+                if waiting and not clk < waiting[0]:
+                    # Another clock is due, swap it with the current one
+                    clk = self.clock = heapq.heapreplace(waiting, clk)
+        # Wait for the monitors writing in the background (FileSpikeMonitor)
+        for C in self.connections:
+            for monitor in getattr(C, 'connections', [C]): # MultiConnection
+                if hasattr(monitor, 'flush'):
+                    monitor.flush()
         if report is not None:
             report.update(1.0)
 
+    def _profiled_run(self, duration, report, report_period):
+        '''
+        Runs the network with the profiled schedule, see run().
+        '''
+        if not self.prepared:
+            self.prepare()
+        profiling = NetworkProfile()
+        update_schedule = self._update_schedule
+        fused_update = self._fused_update
+        self._update_schedule = defaultdict(list)
+        for clockid, schedule in self._profile_schedule.iteritems():
+            self._update_schedule[clockid] = profiling.wrap(schedule)
+        self._fused_update = {}
+        start = time.time()
+        try:
+            self.run(duration, report=report, report_period=report_period)
+        finally:
+            profiling.time = time.time() - start
+            self._update_schedule = update_schedule
+            self._fused_update = fused_update
+        profiling.duration = duration
+        profiling.sort()
+        return profiling
+
     def stop(self):
         '''
         Stops the network from running, this is reset the next time ``run()`` is called.
@@ -621,11 +753,7 @@ class Network(object):
         self.clock points to the current clock between considered.
         '''
         self.clocks = list(set([obj.clock for obj in self.groups + self.operations]))
-        #self.clocks.sort(key=lambda c:-c._dt)
-        #heapq.heapify(self.clocks)
-        #self.clock = min([(clock.t, clock) for clock in self.clocks])[1]
         self.clock = min(self.clocks)
-        #self.clock = heapq.heappop(self.clocks)
 
     def __len__(self):
         '''
@@ -676,6 +804,10 @@ class Network(object):
         net = copy.copy(self) # we make a copy because after returning from this function we can't restore the class
         self.__class__ = oldclass # restore the class of the original, which is now back in its original state
         net._update_schedule = None # remove the problematic element from the copy
+        net._fused_update = None
+        net._threaded_schedule = None
+        net._profile_schedule = None
+        net._thread_pool = None
         return (unpickle_network, (oldclass, net)) # the unpickle_network function called with arguments oldclass, net restores it as it was
 
 # This class just used as a general 'heap' class - has no methods but can have attributes
@@ -691,6 +823,162 @@ def unpickle_network(oldclass, net):
     return net
 
 
+def connection_targets(C):
+    '''
+    Returns the set of (group, state variable) pairs that connection ``C``
+    modifies when it propagates spikes, identified by ids. Connections
+    without a target (e.g. :class:`SpikeMonitor`) only modify themselves.
+    '''
+    if isinstance(C, MultiConnection):
+        return set.union(*[connection_targets(c) for c in C.connections])
+    target = getattr(C, 'target', None)
+    if target is None:
+        return set([id(C)])
+    owner = id(getattr(target, '_owner', target))
+    if not hasattr(C, 'nstate'):
+        # we don't know which variable is modified, assume it can be any
+        return set([(owner, i) for i in range(target._S.shape[0])])
+    return set([(owner, C.nstate)])
+
+
+def group_resources(G, objfun, groups):
+    '''
+    Returns the set of resources that the method ``objfun`` (``'update'``
+    or ``'reset'``) of group ``G`` uses: the groups whose state it reads or
+    modifies, identified by the ids of their owners (subgroups share the
+    state of their owner), and ``'random'`` if it draws random numbers
+    (which must be drawn in the same order as in a serial run). Equations
+    referring to the state of other groups in ``groups`` are detected.
+    
+    Returns None if the resources cannot be known: groups which are not a
+    :class:`NeuronGroup` or override its methods, and state updaters,
+    thresholds and resets defined by user functions or code, which could
+    use any group.
+    '''
+    if (not isinstance(G, NeuronGroup) or getattr(G.__class__, objfun).im_func
+                                    is not getattr(NeuronGroup, objfun).im_func):
+        return None
+    owner = getattr(G, '_owner', G)
+    resources = set([id(owner)])
+    if objfun == 'reset':
+        reset = G._resetfun
+        if isinstance(reset, ParallelReset):
+            reset = reset.basereset
+        if reset.__class__ not in (Reset, VariableReset, Refractoriness,
+                                   NoReset):
+            return None
+        return resources
+    updater = G._state_updater
+    if isinstance(updater, ParallelStateUpdater):
+        updater = updater.baseupdater
+    while isinstance(updater, SynapticNoise):
+        resources.add('random')
+        updater = updater.baseupdater
+    if updater.__class__ not in (LinearStateUpdater, NonlinearStateUpdater,
+                                 RK2StateUpdater, ExponentialEulerStateUpdater,
+                                 LazyStateUpdater):
+        return None
+    if G._spiking:
+        threshold = G._threshold
+        if isinstance(threshold, ParallelThreshold):
+            threshold = threshold.basethreshold
+        if threshold.__class__ in (PoissonThreshold,
+                                   HomogeneousPoissonThreshold):
+            resources.add('random')
+        elif threshold.__class__ not in (Threshold, VariableThreshold,
+                                         EmpiricalThreshold, NoThreshold,
+                                         FastSpikeGeneratorThreshold):
+            return None
+    # arrays of the namespace of the equations which are views on the state
+    # of another group
+    eqs = getattr(G, '_eqs', None)
+    if eqs is not None:
+        for namespace in eqs._namespace.itervalues():
+            for value in namespace.itervalues():
+                if isinstance(value, ndarray):
+                    for H in groups:
+                        S = getattr(H, '_S', None)
+                        if S is not None and may_share_memory(value, S):
+                            resources.add(id(getattr(H, '_owner', H)))
+    return resources
+
+
+def conflict_free_batches(objects, resources=connection_targets):
+    '''
+    Splits the list ``objects`` into a list of batches such that two
+    objects in the same batch never use the same resource, where
+    ``resources(obj)`` is the set of resources of an object, by default
+    the target variables that a connection modifies. The objects using a
+    given resource are in successive batches in their original order, so
+    that running the batches in turn gives exactly the same result as
+    running the objects in turn.
+    
+    Objects whose resources are None (unknown) are in a batch of their own,
+    after the batches of all previous objects and before those of all
+    following objects.
+    '''
+    batches = []
+    last_batch = {} # index of the last batch using a given resource
+    barrier = -1 # index of the last batch of an object with unknown resources
+    for obj in objects:
+        used = resources(obj)
+        if used is None:
+            batches.append([obj])
+            barrier = len(batches) - 1
+            continue
+        i = max([barrier] + [last_batch.get(r, -1) for r in used]) + 1
+        if i == len(batches):
+            batches.append([])
+        batches[i].append(obj)
+        for r in used:
+            last_batch[r] = i
+    return batches
+
+
+def can_fuse(obj):
+    '''
+    Whether the update of the schedule item ``obj`` can be run in blocks of
+    steps (see make_fused_update): groups, connections and monitors, and
+    the Brian objects which only contain these. Any other item, e.g. a
+    network operation or a plain function in a custom schedule, can do
+    anything at any step (for example call stop()), so the clocks of these
+    items are updated step by step.
+    '''
+    # imported here because these modules import this one
+    from brian.monitor import Monitor, SpikeMonitor, MultiStateMonitor
+    from brian.stdp import STDP
+    from brian.stp import STP
+    from brian.timedarray import TimedArraySetter
+    if isinstance(obj, SpikeMonitor) and obj.custom_function:
+        return False
+    return isinstance(obj, (NeuronGroup, Connection, Monitor, MultiStateMonitor,
+                            STDP, STP, TimedArraySetter))
+
+
+def make_fused_update(schedule, clock):
+    '''
+    Returns a function ``f(n)`` that runs the update ``schedule`` (a list of
+    functions) of ``clock`` for ``n`` time steps, ticking the clock after each
+    step.
+    
+    The function is generated with the schedule unrolled and every function
+    bound to a local name, so that there is no iteration over the schedule
+    and no clock check at each time step. It does not check whether the
+    clock is still running or whether the network was stopped, the caller
+    is responsible for choosing ``n``.
+    '''
+    names = ['_f%d' % i for i in range(len(schedule))]
+    ns = dict(zip(names, schedule))
+    ns['_tick'] = clock.tick
+    code = 'def fused_update(_n):\n'
+    code += '    for _i in xrange(_n):\n'
+    for name in names:
+        code += '        %s()\n' % name
+    code += '        _tick()\n'
+    exec code in ns
+    return ns['fused_update']
+
+
 class NetworkOperation(magic.InstanceTracker, ObjectContainer):
     """Callable class for operations that should be called every update step
     
@@ -898,7 +1186,8 @@ class MagicNetwork(Network):
         Network.__init__(self, list(set(groups)), list(set(connections)), list(set(operations)))
 
 
-def run(duration, threads=1, report=None, report_period=10 * second):
+def run(duration, threads=1, report=None, report_period=10 * second,
+        profile=False):
     '''
     Run a network created from any suitable objects that can be found
     
@@ -928,14 +1217,24 @@ def run(duration, threads=1, report=None, report_period=10 * second):
         reporting that the computation is finished.
     ``report_period``
         How often the progress is reported (by default, every 10s).
+    ``threads``
+        The number of threads used to update independent groups and
+        connections concurrently (by default, 1, i.e. no threads). This only
+        pays off if the groups are large. Groups with user defined functions
+        are updated on their own (see :meth:`Network.run`).
+    ``profile``
+        If ``True``, the time spent in each object is measured and returned
+        as a :class:`~brian.utils.profiling.NetworkProfile` (see
+        :meth:`Network.run`).
     
     Works by constructing a :class:`MagicNetwork` object from all the suitable
     objects that could be found (:class:`NeuronGroup`, :class:`Connection`, etc.) and
     then running that network. Not suitable for repeated runs or situations
     in which you need precise control.
     '''
-    MagicNetwork(verbose=False, level=2).run(duration, threads=threads,
-                                            report=report, report_period=report_period)
+    return MagicNetwork(verbose=False, level=2).run(duration, threads=threads,
+                                            report=report, report_period=report_period,
+                                            profile=profile)
 
 
 def reinit(states=True):
@@ -203,6 +203,13 @@ class NeuronGroup(magic.InstanceTracker, ObjectContainer, Group):
         keywords).
     ``unit_checking=True``
         Set to ``False`` to bypass unit-checking.
+    ``threads=1``
+        If greater than 1, the state variables are updated in parallel on
+        this number of threads, each thread updating a contiguous chunk of
+        neurons (see :class:`ParallelStateUpdater`). Thresholds and resets
+        are also applied in parallel if they support it (see
+        :class:`ParallelThreshold` and :class:`ParallelReset`). This is only
+        useful for large groups.
     
     **Methods**
     
@@ -259,7 +266,7 @@ class NeuronGroup(magic.InstanceTracker, ObjectContainer, Group):
                  init=None, refractory=0 * msecond, level=0,
                  clock=None, order=1, implicit=False, unit_checking=True,
                  max_delay=0 * msecond, compile=False, freeze=False, method=None,
-                 max_refractory=None,
+                 max_refractory=None, threads=1,
                  ):#**args): # any reason why **args was included here?
         '''
         Initializes the group.
@@ -333,6 +340,9 @@ class NeuronGroup(magic.InstanceTracker, ObjectContainer, Group):
                     self._S0[i] = S0[var]
         else:
             raise TypeError, "StateUpdater must be specified at initialization."
+        if threads > 1:
+            self._state_updater = ParallelStateUpdater(self._state_updater,
+                                                       threads=threads)
         # TODO: remove temporary unit hack, this makes all state variables dimensionless if no units are specified
         # What is this??
         if self._S0 is None:
@@ -414,6 +424,13 @@ class NeuronGroup(magic.InstanceTracker, ObjectContainer, Group):
             self._resetfun = reset
         if hasattr(threshold, 'refractory'): # A threshold with refractoriness
             period_max = max(period_max, threshold.refractory + 1)
+        if threads > 1:
+            # thresholds and resets that don't support it are applied serially
+            if ParallelThreshold.supports(self._threshold):
+                self._threshold = ParallelThreshold(self._threshold,
+                                                    threads=threads)
+            if ParallelReset.supports(self._resetfun):
+                self._resetfun = ParallelReset(self._resetfun, threads=threads)
         if max_refractory is None:
             max_refractory = refractory
         if max_delay < period_max * clock.dt:
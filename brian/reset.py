@@ -38,9 +38,9 @@ Reset mechanisms
 
 __all__ = ['Reset', 'VariableReset', 'Refractoriness', 'NoReset', 'FunReset',
          'CustomRefractoriness', 'SimpleCustomRefractoriness', 'StringReset',
-         'select_reset']
+         'select_reset', 'ParallelReset']
 
-from numpy import where, zeros
+from numpy import where, zeros, searchsorted
 from units import *
 from clock import *
 import inspect
@@ -48,6 +48,7 @@ import re
 import numpy
 from inspection import *
 from utils.documentation import flattened_docstring
+from utils.parallel import make_group_chunks, get_thread_pool, GroupChunk
 from globalprefs import *
 from log import *
 CReset = PythonReset = None
@@ -112,6 +113,22 @@ def select_reset(expr, eqs, level=0):
     return Reset(val, A)
 
 
+def get_state_vector(cache, P, state):
+    '''
+    Returns the vector of state variable ``state`` of group ``P``, cached in
+    the dictionary ``cache`` by id of the group. The chunks of a group (see
+    :class:`ParallelReset`) are rebuilt when its state matrix changes, so
+    their ids can be reused: their vectors are cached on the chunks instead.
+    '''
+    if isinstance(P, GroupChunk):
+        return P.state_(state)
+    V = cache.get(id(P), None)
+    if V is None:
+        V = P.state_(state)
+        cache[id(P)] = V
+    return V
+
+
 class Reset(object):
     '''
     Resets specified state variable to a fixed value
@@ -140,10 +157,7 @@ class Reset(object):
         '''
         Clamps membrane potential at reset value.
         '''
-        V = self.statevectors.get(id(P), None)
-        if V is None:
-            V = P.state_(self.state)
-            self.statevectors[id(P)] = V
+        V = get_state_vector(self.statevectors, P, self.state)
         V[P.LS.lastspikes()] = self.resetvalue
 
     def __repr__(self):
@@ -242,14 +256,8 @@ class VariableReset(Reset):
         '''
         Clamps membrane potential at reset value.
         '''
-        V = self.statevectors.get(id(P), None)
-        if V is None:
-            V = P.state_(self.state)
-            self.statevectors[id(P)] = V
-        Vr = self.resetstatevectors.get(id(P), None)
-        if Vr is None:
-            Vr = P.state_(self.resetvaluestate)
-            self.resetstatevectors[id(P)] = Vr
+        V = get_state_vector(self.statevectors, P, self.state)
+        Vr = get_state_vector(self.resetstatevectors, P, self.resetvaluestate)
         lastspikes = P.LS.lastspikes()
         V[lastspikes] = Vr[lastspikes]
 
@@ -319,10 +327,7 @@ class Refractoriness(Reset):
         else:
             period = int(self.period / P.clock.dt) + 1
             self._periods[id(P)] = period
-        V = self.statevectors.get(id(P), None)
-        if V is None:
-            V = P.state_(self.state)
-            self.statevectors[id(P)] = V
+        V = get_state_vector(self.statevectors, P, self.state)
         neuronindices = P.LS[0:period]
         if P._variable_refractory_time:
             neuronindices = neuronindices[P._next_allowed_spiketime[neuronindices] > (P.clock._t - P.clock._dt * 0.25)]
@@ -475,3 +480,77 @@ class NoReset(Reset):
 
     def __str__(self):
         return 'No reset'
+
+
+class ParallelReset(Reset):
+    '''
+    Applies another reset in parallel on chunks of neurons.
+    
+    **Initialised as:** ::
+    
+        ParallelReset(basereset[, threads=2[, chunks=None]])
+    
+    with arguments:
+    
+    ``basereset``
+        The reset to apply, see :meth:`supports` for which ones can be used.
+    ``threads``
+        The number of threads to use.
+    ``chunks``
+        The number of contiguous chunks of neurons, by default the number of
+        threads.
+    
+    The sorted array of neurons that spiked is split at the chunk
+    boundaries, and each chunk resets its own neurons.
+    '''
+    def __init__(self, basereset, threads=2, chunks=None):
+        if not ParallelReset.supports(basereset):
+            raise TypeError('Parallel resets are not supported for ' +
+                            basereset.__class__.__name__)
+        self.basereset = basereset
+        self.threads = threads
+        if chunks is None:
+            chunks = threads
+        self.nchunks = chunks
+        self._chunks = None
+        self._chunked_S = None
+
+    @staticmethod
+    def supports(reset):
+        '''
+        Whether ``reset`` can be applied to chunks of neurons independently,
+        i.e. if it only depends on the spikes of the current time step.
+        Resets with refractoriness (which need the spikes of previous time
+        steps) and string resets (which share their namespace between calls)
+        are not supported.
+        '''
+        return reset.__class__ in (Reset, VariableReset)
+
+    def _chunk_reset(self, chunk):
+        if len(chunk.LS.spikes):
+            self.basereset(chunk)
+
+    def __call__(self, P):
+        if self._chunked_S is not P._S:
+            self._chunks = make_group_chunks(P, self.nchunks)
+            self._chunked_S = P._S
+        spikes = P.LS.lastspikes()
+        if not len(spikes):
+            return
+        bounds = searchsorted(spikes, [chunk.i for chunk in self._chunks] +
+                                      [self._chunks[-1].j])
+        for chunk, start, end in zip(self._chunks, bounds[:-1], bounds[1:]):
+            chunk.LS.spikes = spikes[start:end] - chunk.i
+        get_thread_pool(self.threads).map(self._chunk_reset, self._chunks,
+                                          chunksize=1)
+
+    def __getstate__(self):
+        # views on the group are rebuilt on demand
+        pickle_dict = self.__dict__.copy()
+        pickle_dict['_chunks'] = None
+        pickle_dict['_chunked_S'] = None
+        return pickle_dict
+
+    def __repr__(self):
+        return '%s(%r, threads=%d)' % (self.__class__.__name__,
+                                       self.basereset, self.threads)
@@ -38,7 +38,7 @@ Neuron StateUpdaters
 
 __all__ = ['StateUpdater', 'LinearStateUpdater', 'NonlinearStateUpdater',
            'SynapticNoise', 'LazyStateUpdater', 'magic_state_updater',
-           'FunStateUpdater', 'get_linear_equations']
+           'FunStateUpdater', 'get_linear_equations', 'ParallelStateUpdater']
 
 #from scipy.weave import blitz
 from numpy import *
@@ -65,6 +65,7 @@ import warnings
 from log import *
 from globalprefs import *
 from experimental.codegen import *
+from utils.parallel import GroupChunk, make_group_chunks, get_thread_pool
 CStateUpdater = PythonStateUpdater = None
 
 def magic_state_updater(model, clock=None, order=1, implicit=False, compile=False, freeze=False, \
@@ -502,7 +503,6 @@ class NonlinearStateUpdater(StateUpdater):
         # TODO: global pref?
         self.eqs = eqs
         self.optimized = compile
-        self._first_time = True
         if freeze:
             self.eqs.compile_functions(freeze=freeze)
         self._frozen=freeze
@@ -530,8 +530,9 @@ class NonlinearStateUpdater(StateUpdater):
         #states=dict.fromkeys(self.eqs.dynamicvars)
         # store that in the neurongroup?
         if self.optimized:
-            if self._first_time:
-                self._first_time = False
+            # allocated for each group (or chunk of a group, see
+            # ParallelStateUpdater), the first time it is updated
+            if getattr(P, '_dS', None) is None:
                 P._dS = 0 * P._S
             dt = P.clock._dt
             t = P.clock.t
@@ -601,7 +602,6 @@ class ExponentialEulerStateUpdater(NonlinearStateUpdater):
         # TODO: global pref?
         self.eqs = eqs
         self.optimized = compile
-        self._first_time = True
         if freeze:
             self.eqs.compile_functions(freeze=freeze)
         self._frozen=freeze
@@ -615,8 +615,9 @@ class ExponentialEulerStateUpdater(NonlinearStateUpdater):
         P is the neuron group.
         '''
         if self.optimized:
-            if self._first_time:
-                self._first_time = False
+            # allocated for each group (or chunk of a group, see
+            # ParallelStateUpdater), the first time it is updated
+            if getattr(P, '_dS', None) is None:
                 P._dS = P._S.copy()
             dt = P.clock._dt
             t = P.clock.t
@@ -665,7 +666,11 @@ class SynapticNoise(StateUpdater):
         P is the neuron group.
         '''
         self.baseupdater(P) # update the underlying model
-        P._S[self.nstate, :] += self.mu + random.randn(P._S.shape[1]) * self.sigma
+        if isinstance(P, GroupChunk):
+            rng = P.random_state # each chunk has its own random stream
+        else:
+            rng = random
+        P._S[self.nstate, :] += self.mu + rng.randn(P._S.shape[1]) * self.sigma
 
     def __repr__(self):
         return self.baseupdater.__repr__() + ' with synaptic noise on variable ' + str(self.nstate)
@@ -743,3 +748,90 @@ class FunStateUpdater(StateUpdater):
 
     def __len__(self):
         return self.numstates
+
+
+class ParallelStateUpdater(StateUpdater):
+    '''
+    Runs another state updater in parallel on chunks of neurons.
+    
+    **Initialised as:** ::
+    
+        ParallelStateUpdater(baseupdater[, threads=2[, chunks=None]])
+    
+    with arguments:
+    
+    ``baseupdater``
+        The state updater to run, one of :class:`LinearStateUpdater`,
+        the Euler, Runge-Kutta and exponential Euler nonlinear updaters,
+        possibly with :class:`SynapticNoise`.
+    ``threads``
+        The number of threads to use.
+    ``chunks``
+        The number of contiguous chunks of neurons the state matrix is
+        split into, by default the number of threads.
+    
+    The state matrix ``P._S`` is split column-wise into contiguous chunks,
+    each of which is updated by the base updater in a pool of threads.
+    The numerical work is done by numpy (and BLAS for linear updates), which
+    releases the GIL, so this only pays off for large groups. Noise terms
+    are drawn from one random stream per chunk, seeded from the numpy
+    random number generator when the chunks are created, so that results
+    are reproducible for a given seed and number of chunks (but differ
+    from a serial run).
+    
+    Note that the equations must not refer to external arrays with one
+    value per neuron, since each chunk only sees its own neurons.
+    
+    Typically, you would use the ``threads`` keyword of :class:`NeuronGroup`
+    rather than this class directly.
+    '''
+    def __init__(self, baseupdater, threads=2, chunks=None):
+        updater = baseupdater
+        while isinstance(updater, SynapticNoise):
+            updater = updater.baseupdater
+        if not isinstance(updater, (LinearStateUpdater, NonlinearStateUpdater,
+                                    LazyStateUpdater)):
+            raise TypeError('Parallel state updates are not supported for ' +
+                            updater.__class__.__name__)
+        self.baseupdater = baseupdater
+        self.threads = threads
+        if chunks is None:
+            chunks = threads
+        self.nchunks = chunks
+        self._chunks = None
+        self._chunked_S = None
+
+    def get_chunks(self, P):
+        '''
+        Returns the list of :class:`GroupChunk` objects for group ``P``
+        '''
+        if self._chunked_S is not P._S:
+            self._chunks = make_group_chunks(P, self.nchunks, seeds=True)
+            self._chunked_S = P._S
+        return self._chunks
+
+    def rest(self, P):
+        self.baseupdater.rest(P)
+
+    def __call__(self, P):
+        '''
+        Updates the state variables.
+        '''
+        get_thread_pool(self.threads).map(self.baseupdater, self.get_chunks(P),
+                                          chunksize=1)
+
+    def __getstate__(self):
+        # views on the group are rebuilt on demand
+        pickle_dict = self.__dict__.copy()
+        pickle_dict['_chunks'] = None
+        pickle_dict['_chunked_S'] = None
+        return pickle_dict
+
+    def __repr__(self):
+        return '%s with %d threads' % (repr(self.baseupdater), self.threads)
+
+    def __len__(self):
+        '''
+        Number of state variables
+        '''
+        return len(self.baseupdater)
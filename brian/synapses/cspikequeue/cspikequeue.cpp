@@ -0,0 +1,215 @@
+#include "cspikequeue.h"
+#include<string.h>
+
+// Sets the counts of new events back to zero when it goes out of scope, so
+// that they are also reset if an exception is thrown while counting
+class CountsReset
+{
+public:
+	CountsReset(int *counts, int n) : counts(counts), n(n) {}
+	~CountsReset() { memset(this->counts, 0, this->n*sizeof(int)); }
+private:
+	int *counts;
+	int n;
+};
+
+CSpikeQueue::CSpikeQueue(int n_delays, int n_maxevents)
+{
+	this->X = NULL;
+	this->n = NULL;
+	this->counts = NULL;
+	this->rowind = NULL;
+	this->synapses = NULL;
+	this->delays = NULL;
+	this->n_rowind = 0;
+	this->n_synapses = 0;
+	this->n_delays_synapses = 0;
+	if(n_delays<1) n_delays = 1;
+	if(n_maxevents<1) n_maxevents = 1;
+	this->allocate(n_delays, n_maxevents);
+}
+
+CSpikeQueue::~CSpikeQueue()
+{
+	this->deallocate();
+	if(this->rowind) delete [] this->rowind;
+	if(this->synapses) delete [] this->synapses;
+	if(this->delays) delete [] this->delays;
+}
+
+void CSpikeQueue::allocate(int n_delays, int n_maxevents)
+{
+	this->n_delays = n_delays;
+	this->n_maxevents = n_maxevents;
+	this->currenttime = 0;
+	this->X = new long[n_delays*n_maxevents];
+	this->n = new int[n_delays];
+	this->counts = new int[n_delays];
+	for(int d=0; d<n_delays; d++)
+	{
+		this->n[d] = 0;
+		this->counts[d] = 0;
+	}
+}
+
+void CSpikeQueue::deallocate()
+{
+	if(this->X) delete [] this->X;
+	if(this->n) delete [] this->n;
+	if(this->counts) delete [] this->counts;
+	this->X = NULL;
+	this->n = NULL;
+	this->counts = NULL;
+}
+
+// Makes room for at least maxevents events per timestep (rounded to the next
+// power of 2), keeping the stored events
+void CSpikeQueue::expand(int maxevents)
+{
+	if(maxevents<=this->n_maxevents) return;
+	int new_maxevents = this->n_maxevents;
+	while(new_maxevents<maxevents) new_maxevents *= 2;
+	long *newX = new long[this->n_delays*new_maxevents];
+	for(int d=0; d<this->n_delays; d++)
+		memcpy(newX+d*new_maxevents, this->X+d*this->n_maxevents, this->n[d]*sizeof(long));
+	delete [] this->X;
+	this->X = newX;
+	this->n_maxevents = new_maxevents;
+}
+
+// Increases the number of timesteps (maximum delay), keeping the stored
+// events. The current timestep becomes row 0.
+void CSpikeQueue::expand_delays(int n_delays)
+{
+	if(n_delays<=this->n_delays) return;
+	long *oldX = this->X;
+	int *oldn = this->n;
+	int old_n_delays = this->n_delays;
+	int old_currenttime = this->currenttime;
+	delete [] this->counts;
+	this->allocate(n_delays, this->n_maxevents);
+	for(int d=0; d<old_n_delays; d++)
+	{
+		int row = (old_currenttime+d)%old_n_delays;
+		memcpy(this->X+d*this->n_maxevents, oldX+row*this->n_maxevents, oldn[row]*sizeof(long));
+		this->n[d] = oldn[row];
+	}
+	delete [] oldX;
+	delete [] oldn;
+}
+
+void CSpikeQueue::next()
+{
+	this->n[this->currenttime] = 0;
+	this->currenttime = (this->currenttime+1)%this->n_delays;
+}
+
+void CSpikeQueue::peek(long **ret, int *ret_n)
+{
+	this->get_events(0, ret, ret_n);
+}
+
+void CSpikeQueue::get_events(int delay, long **ret, int *ret_n)
+{
+	if(delay<0 || delay>=this->n_delays)
+		throw BrianException("Delay out of range in SpikeQueue.");
+	int row = (this->currenttime+delay)%this->n_delays;
+	*ret = this->X+row*this->n_maxevents;
+	*ret_n = this->n[row];
+}
+
+void CSpikeQueue::set_synapses(int len1, long *vec1, int len2, long *vec2)
+{
+	if(len1<1 || vec1[len1-1]!=len2)
+		throw BrianException("Inconsistent synapse arrays in SpikeQueue.");
+	if(this->rowind) delete [] this->rowind;
+	if(this->synapses) delete [] this->synapses;
+	this->rowind = new long[len1];
+	this->synapses = new long[len2>0 ? len2 : 1];
+	memcpy(this->rowind, vec1, len1*sizeof(long));
+	memcpy(this->synapses, vec2, len2*sizeof(long));
+	this->n_rowind = len1;
+	this->n_synapses = len2;
+}
+
+void CSpikeQueue::set_delays(int len3, long *vec3)
+{
+	if(this->delays) delete [] this->delays;
+	this->delays = new long[len3>0 ? len3 : 1];
+	memcpy(this->delays, vec3, len3*sizeof(long));
+	this->n_delays_synapses = len3;
+}
+
+// Inserts the events targets (vec1) with delays (vec2, in timesteps)
+void CSpikeQueue::insert(int len1, long *vec1, int len2, long *vec2)
+{
+	if(len1!=len2)
+		throw BrianException("Targets and delays must have the same length in SpikeQueue.");
+	int maxevents = 0;
+	{
+		CountsReset reset(this->counts, this->n_delays);
+		for(int k=0; k<len2; k++)
+		{
+			if(vec2[k]<0 || vec2[k]>=this->n_delays)
+				throw BrianException("Synaptic delays exceed maximum delay in SpikeQueue.");
+			int row = (this->currenttime+vec2[k])%this->n_delays;
+			this->counts[row]++;
+			if(this->n[row]+this->counts[row]>maxevents)
+				maxevents = this->n[row]+this->counts[row];
+		}
+	}
+	this->expand(maxevents);
+	for(int k=0; k<len1; k++)
+	{
+		int row = (this->currenttime+vec2[k])%this->n_delays;
+		this->X[row*this->n_maxevents+this->n[row]++] = vec1[k];
+	}
+}
+
+// Inserts the events produced by the presynaptic spikes vec3, using the
+// synapses and delays set with set_synapses() and set_delays()
+void CSpikeQueue::propagate(int len3, long *vec3)
+{
+	int maxevents = 0;
+	{
+		CountsReset reset(this->counts, this->n_delays);
+		for(int k=0; k<len3; k++)
+		{
+			long i = vec3[k];
+			if(i<0 || i>=this->n_rowind-1)
+				throw BrianException("Spike from an unknown neuron in SpikeQueue.");
+			for(long j=this->rowind[i]; j<this->rowind[i+1]; j++)
+			{
+				long s = this->synapses[j];
+				if(s<0 || s>=this->n_delays_synapses)
+					throw BrianException("Synapse without delay in SpikeQueue.");
+				long delay = this->delays[s];
+				if(delay<0 || delay>=this->n_delays)
+					throw BrianException("Synaptic delays exceed maximum delay in SpikeQueue.");
+				int row = (this->currenttime+delay)%this->n_delays;
+				this->counts[row]++;
+				if(this->n[row]+this->counts[row]>maxevents)
+					maxevents = this->n[row]+this->counts[row];
+			}
+		}
+	}
+	this->expand(maxevents);
+	for(int k=0; k<len3; k++)
+	{
+		long i = vec3[k];
+		for(long j=this->rowind[i]; j<this->rowind[i+1]; j++)
+		{
+			long s = this->synapses[j];
+			int row = (this->currenttime+this->delays[s])%this->n_delays;
+			this->X[row*this->n_maxevents+this->n[row]++] = s;
+		}
+	}
+}
+
+int CSpikeQueue::nevents()
+{
+	int total = 0;
+	for(int d=0; d<this->n_delays; d++)
+		total += this->n[d];
+	return total;
+}
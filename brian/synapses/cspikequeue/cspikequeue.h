@@ -0,0 +1,53 @@
+#ifndef _BRIAN_CSPIKEQUEUE_H
+#define _BRIAN_CSPIKEQUEUE_H
+
+#include<string>
+#include<exception>
+#include<stdexcept>
+
+using namespace std;
+
+#define BrianException std::runtime_error
+
+/*
+ * Spike queue for the Synapses object (see brian/synapses/spikequeue.py).
+ *
+ * X is a contiguous n_delays x n_maxevents array, circular in the time
+ * direction (rows), n[d] is the number of events stored in row d. The
+ * synapses of each presynaptic neuron are stored in compressed row format
+ * (synapses[rowind[i]:rowind[i+1]] are the synapses of neuron i), and the
+ * delays (in timesteps) are indexed by synapse, so that all the spikes of a
+ * timestep are inserted with a single call to propagate().
+ *
+ * peek() and get_events() return views on X, which are only valid until the
+ * next call to next(), insert(), propagate() or expand().
+ */
+class CSpikeQueue
+{
+private:
+	int *counts; // number of new events per row, used by propagate()
+	void allocate(int n_delays, int n_maxevents);
+	void deallocate();
+public:
+	long *X;
+	int *n;
+	int n_delays, n_maxevents, currenttime;
+	long *rowind, *synapses, *delays;
+	int n_rowind, n_synapses, n_delays_synapses;
+
+	CSpikeQueue(int n_delays, int n_maxevents);
+	~CSpikeQueue();
+
+	void expand(int maxevents);
+	void expand_delays(int n_delays);
+	void next();
+	void peek(long **ret, int *ret_n);
+	void get_events(int delay, long **ret, int *ret_n);
+	void set_synapses(int len1, long *vec1, int len2, long *vec2);
+	void set_delays(int len3, long *vec3);
+	void insert(int len1, long *vec1, int len2, long *vec2);
+	void propagate(int len3, long *vec3);
+	int nevents();
+};
+
+#endif
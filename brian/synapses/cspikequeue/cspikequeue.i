@@ -0,0 +1,35 @@
+%module cspikequeue
+%include "exception.i"
+%include "std_string.i"
+
+%exception {
+	try {
+		$action
+	} catch( std::runtime_error &e ) {
+		PyErr_SetString(PyExc_RuntimeError, const_cast<char *>(e.what()));
+		return NULL;
+	}
+}
+
+%allowexception;
+
+%{
+#define SWIG_FILE_WITH_INIT
+#include "cspikequeue.h"
+%}
+
+%include "numpy.i"
+%init %{
+	import_array();
+%}
+
+%apply (int DIM1, long* IN_ARRAY1) {(int len1, long* vec1), (int len2, long* vec2), (int len3, long* vec3)};
+%apply (long** ARGOUTVIEW_ARRAY1, int* DIM1) {(long **ret, int *ret_n)};
+
+%ignore CSpikeQueue::X;
+%ignore CSpikeQueue::n;
+%ignore CSpikeQueue::rowind;
+%ignore CSpikeQueue::synapses;
+%ignore CSpikeQueue::delays;
+
+%include "cspikequeue.h"
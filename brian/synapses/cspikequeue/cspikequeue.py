@@ -0,0 +1,112 @@
+# This file was automatically generated by SWIG (http://www.swig.org).
+# Version 4.0.2
+#
+# Do not make changes to this file unless you know what you are doing--modify
+# the SWIG interface file instead.
+
+from sys import version_info as _swig_python_version_info
+if _swig_python_version_info < (2, 7, 0):
+    raise RuntimeError("Python 2.7 or later required")
+
+# Import the low-level C/C++ module
+if __package__ or "." in __name__:
+    from . import _cspikequeue
+else:
+    import _cspikequeue
+
+try:
+    import builtins as __builtin__
+except ImportError:
+    import __builtin__
+
+def _swig_repr(self):
+    try:
+        strthis = "proxy of " + self.this.__repr__()
+    except __builtin__.Exception:
+        strthis = ""
+    return "<%s.%s; %s >" % (self.__class__.__module__, self.__class__.__name__, strthis,)
+
+
+def _swig_setattr_nondynamic_instance_variable(set):
+    def set_instance_attr(self, name, value):
+        if name == "thisown":
+            self.this.own(value)
+        elif name == "this":
+            set(self, name, value)
+        elif hasattr(self, name) and isinstance(getattr(type(self), name), property):
+            set(self, name, value)
+        else:
+            raise AttributeError("You cannot add instance attributes to %s" % self)
+    return set_instance_attr
+
+
+def _swig_setattr_nondynamic_class_variable(set):
+    def set_class_attr(cls, name, value):
+        if hasattr(cls, name) and not isinstance(getattr(cls, name), property):
+            set(cls, name, value)
+        else:
+            raise AttributeError("You cannot add class attributes to %s" % cls)
+    return set_class_attr
+
+
+def _swig_add_metaclass(metaclass):
+    """Class decorator for adding a metaclass to a SWIG wrapped class - a slimmed down version of six.add_metaclass"""
+    def wrapper(cls):
+        return metaclass(cls.__name__, cls.__bases__, cls.__dict__.copy())
+    return wrapper
+
+
+class _SwigNonDynamicMeta(type):
+    """Meta class to enforce nondynamic attributes (no new attributes) for a class"""
+    __setattr__ = _swig_setattr_nondynamic_class_variable(type.__setattr__)
+
+
+class CSpikeQueue(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    n_delays = property(_cspikequeue.CSpikeQueue_n_delays_get, _cspikequeue.CSpikeQueue_n_delays_set)
+    n_maxevents = property(_cspikequeue.CSpikeQueue_n_maxevents_get, _cspikequeue.CSpikeQueue_n_maxevents_set)
+    currenttime = property(_cspikequeue.CSpikeQueue_currenttime_get, _cspikequeue.CSpikeQueue_currenttime_set)
+    n_rowind = property(_cspikequeue.CSpikeQueue_n_rowind_get, _cspikequeue.CSpikeQueue_n_rowind_set)
+    n_synapses = property(_cspikequeue.CSpikeQueue_n_synapses_get, _cspikequeue.CSpikeQueue_n_synapses_set)
+    n_delays_synapses = property(_cspikequeue.CSpikeQueue_n_delays_synapses_get, _cspikequeue.CSpikeQueue_n_delays_synapses_set)
+
+    def __init__(self, n_delays, n_maxevents):
+        _cspikequeue.CSpikeQueue_swiginit(self, _cspikequeue.new_CSpikeQueue(n_delays, n_maxevents))
+    __swig_destroy__ = _cspikequeue.delete_CSpikeQueue
+
+    def expand(self, maxevents):
+        return _cspikequeue.CSpikeQueue_expand(self, maxevents)
+
+    def expand_delays(self, n_delays):
+        return _cspikequeue.CSpikeQueue_expand_delays(self, n_delays)
+
+    def next(self):
+        return _cspikequeue.CSpikeQueue_next(self)
+
+    def peek(self):
+        return _cspikequeue.CSpikeQueue_peek(self)
+
+    def get_events(self, delay):
+        return _cspikequeue.CSpikeQueue_get_events(self, delay)
+
+    def set_synapses(self, len1, len2):
+        return _cspikequeue.CSpikeQueue_set_synapses(self, len1, len2)
+
+    def set_delays(self, len3):
+        return _cspikequeue.CSpikeQueue_set_delays(self, len3)
+
+    def insert(self, len1, len2):
+        return _cspikequeue.CSpikeQueue_insert(self, len1, len2)
+
+    def propagate(self, len3):
+        return _cspikequeue.CSpikeQueue_propagate(self, len3)
+
+    def nevents(self):
+        return _cspikequeue.CSpikeQueue_nevents(self)
+
+# Register CSpikeQueue in _cspikequeue:
+_cspikequeue.CSpikeQueue_swigregister(CSpikeQueue)
+
+
+
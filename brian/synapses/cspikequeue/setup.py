@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+
+"""
+setup.py file for C++ version of the spike queue of Synapses
+"""
+
+from distutils.core import setup, Extension
+import os, numpy
+numpy_base_dir = os.path.split(numpy.__file__)[0]
+numpy_include_dir = os.path.join(numpy_base_dir, 'core/include')
+
+cspikequeue_module = Extension('_cspikequeue',
+                           sources=['cspikequeue_wrap.cxx',
+                                    'cspikequeue.cpp',
+                                    ],
+                           include_dirs=[numpy_include_dir],
+                           )
+
+setup (name='cspikequeue',
+       version='0.1',
+       description="""C++ version of the spike queue of Synapses""",
+       ext_modules=[cspikequeue_module],
+       py_modules=["cspikequeue"],
+       )
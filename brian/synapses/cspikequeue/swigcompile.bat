@@ -0,0 +1,3 @@
+@echo off
+swig -python -c++ cspikequeue.i
+setup.py build_ext --inplace %*
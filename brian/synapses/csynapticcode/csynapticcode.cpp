@@ -0,0 +1,194 @@
+#include "csynapticcode.h"
+#include<math.h>
+#include<vector>
+
+#define BrianException std::runtime_error
+
+static inline double clip(double x, double low, double high)
+{
+	if(x<low) return low;
+	if(x>high) return high;
+	return x;
+}
+
+static inline double function1(int f, double x)
+{
+	switch(f)
+	{
+	case F_EXP: return exp(x);
+	case F_LOG: return log(x);
+	case F_LOG10: return log10(x);
+	case F_SQRT: return sqrt(x);
+	case F_SIN: return sin(x);
+	case F_COS: return cos(x);
+	case F_TAN: return tan(x);
+	case F_ASIN: return asin(x);
+	case F_ACOS: return acos(x);
+	case F_ATAN: return atan(x);
+	case F_SINH: return sinh(x);
+	case F_COSH: return cosh(x);
+	case F_TANH: return tanh(x);
+	case F_FABS: return fabs(x);
+	case F_FLOOR: return floor(x);
+	default: return ceil(x);
+	}
+}
+
+static inline double function2(int f, double x, double y)
+{
+	switch(f)
+	{
+	case F_POW: return pow(x, y);
+	case F_FMIN: return fmin(x, y);
+	default: return fmax(x, y);
+	}
+}
+
+static inline bool has_operand(int op)
+{
+	return op==OP_CONST || op==OP_LOAD_SYN || op==OP_LOAD_PRE ||
+		   op==OP_LOAD_POST || op==OP_STORE_SYN || op==OP_STORE_POST ||
+		   op==OP_CALL1 || op==OP_CALL2 || op==OP_CALL3;
+}
+
+// Checks the operands of the program and that the stack never underflows,
+// returns the maximum depth of the stack
+static int check_program(int *program, int nprogram, int nconstants, int narrays)
+{
+	int depth = 0, maxdepth = 0;
+	for(int pc=0; pc<nprogram; pc++)
+	{
+		int op = program[pc];
+		if(op<0 || op>=OP_COUNT)
+			throw BrianException("Unknown instruction in synaptic program.");
+		int operand = 0;
+		if(has_operand(op))
+		{
+			if(++pc>=nprogram)
+				throw BrianException("Missing operand in synaptic program.");
+			operand = program[pc];
+		}
+		int pops = 0, pushes = 1;
+		switch(op)
+		{
+		case OP_CONST:
+			if(operand<0 || operand>=nconstants)
+				throw BrianException("Constant out of range in synaptic program.");
+			break;
+		case OP_LOAD_SYN: case OP_LOAD_PRE: case OP_LOAD_POST:
+			if(operand<0 || operand>=narrays)
+				throw BrianException("Array out of range in synaptic program.");
+			break;
+		case OP_LOAD_T:
+			break;
+		case OP_STORE_SYN: case OP_STORE_POST:
+			if(operand<0 || operand>=narrays)
+				throw BrianException("Array out of range in synaptic program.");
+			pops = 1; pushes = 0;
+			break;
+		case OP_NEG: case OP_NOT:
+			pops = 1;
+			break;
+		case OP_CALL1:
+			if(operand<0 || operand>=F_COUNT1)
+				throw BrianException("Unknown function in synaptic program.");
+			pops = 1;
+			break;
+		case OP_CALL2:
+			if(operand<0 || operand>=F_COUNT2)
+				throw BrianException("Unknown function in synaptic program.");
+			pops = 2;
+			break;
+		case OP_CALL3:
+			if(operand<0 || operand>=F_COUNT3)
+				throw BrianException("Unknown function in synaptic program.");
+			pops = 3;
+			break;
+		default: // binary operators
+			pops = 2;
+		}
+		if(depth<pops)
+			throw BrianException("Stack underflow in synaptic program.");
+		depth += pushes-pops;
+		if(depth>maxdepth) maxdepth = depth;
+	}
+	return maxdepth;
+}
+
+void run_synaptic_program(int *program, int nprogram,
+						  double *constants, int nconstants,
+						  double **arrays, long *sizes, int narrays,
+						  long *synapses, int nsynapses,
+						  long *presynaptic, int npresynaptic,
+						  long *postsynaptic, int npostsynaptic,
+						  double t)
+{
+	if(npresynaptic!=npostsynaptic)
+		throw BrianException("Presynaptic and postsynaptic arrays must have the same length.");
+	std::vector<double> stackvector(check_program(program, nprogram, nconstants, narrays)+1);
+	double *stack = &stackvector[0];
+	for(int k=0; k<nsynapses; k++)
+	{
+		long s = synapses[k];
+		if(s<0 || s>=npresynaptic)
+			throw std::out_of_range("Synapse index out of range.");
+		long i = presynaptic[s], j = postsynaptic[s];
+		int sp = 0; // number of values on the stack
+		for(int pc=0; pc<nprogram; pc++)
+		{
+			long index;
+			switch(program[pc])
+			{
+			case OP_CONST:
+				stack[sp++] = constants[program[++pc]];
+				break;
+			case OP_LOAD_SYN: case OP_STORE_SYN:
+			case OP_LOAD_PRE:
+			case OP_LOAD_POST: case OP_STORE_POST:
+			{
+				int op = program[pc], a = program[++pc];
+				if(op==OP_LOAD_SYN || op==OP_STORE_SYN) index = s;
+				else if(op==OP_LOAD_PRE) index = i;
+				else index = j;
+				if(index<0 || index>=sizes[a])
+					throw std::out_of_range("Index out of range in synaptic code.");
+				if(op==OP_STORE_SYN || op==OP_STORE_POST)
+					arrays[a][index] = stack[--sp];
+				else
+					stack[sp++] = arrays[a][index];
+				break;
+			}
+			case OP_LOAD_T:
+				stack[sp++] = t;
+				break;
+			case OP_ADD: sp--; stack[sp-1] = stack[sp-1]+stack[sp]; break;
+			case OP_SUB: sp--; stack[sp-1] = stack[sp-1]-stack[sp]; break;
+			case OP_MUL: sp--; stack[sp-1] = stack[sp-1]*stack[sp]; break;
+			case OP_DIV: sp--; stack[sp-1] = stack[sp-1]/stack[sp]; break;
+			case OP_POW: sp--; stack[sp-1] = pow(stack[sp-1], stack[sp]); break;
+			case OP_NEG: stack[sp-1] = -stack[sp-1]; break;
+			case OP_NOT: stack[sp-1] = !stack[sp-1]; break;
+			case OP_LT: sp--; stack[sp-1] = stack[sp-1]<stack[sp]; break;
+			case OP_LE: sp--; stack[sp-1] = stack[sp-1]<=stack[sp]; break;
+			case OP_GT: sp--; stack[sp-1] = stack[sp-1]>stack[sp]; break;
+			case OP_GE: sp--; stack[sp-1] = stack[sp-1]>=stack[sp]; break;
+			case OP_EQ: sp--; stack[sp-1] = stack[sp-1]==stack[sp]; break;
+			case OP_NE: sp--; stack[sp-1] = stack[sp-1]!=stack[sp]; break;
+			case OP_AND: sp--; stack[sp-1] = stack[sp-1] && stack[sp]; break;
+			case OP_OR: sp--; stack[sp-1] = stack[sp-1] || stack[sp]; break;
+			case OP_CALL1:
+				stack[sp-1] = function1(program[++pc], stack[sp-1]);
+				break;
+			case OP_CALL2:
+				sp--;
+				stack[sp-1] = function2(program[++pc], stack[sp-1], stack[sp]);
+				break;
+			case OP_CALL3:
+				pc++; // clip is the only function of three arguments
+				sp -= 2;
+				stack[sp-1] = clip(stack[sp-1], stack[sp], stack[sp+1]);
+				break;
+			}
+		}
+	}
+}
@@ -0,0 +1,58 @@
+#ifndef _BRIAN_CSYNAPTICCODE_H
+#define _BRIAN_CSYNAPTICCODE_H
+
+#include<exception>
+#include<stdexcept>
+
+using namespace std;
+
+/*
+ * Loop over the synaptic events of the Synapses object (see
+ * brian/synapses/synapticcode.py), running the pre or post code of a pathway
+ * translated into a program for a small stack machine.
+ *
+ * A program is a sequence of instructions, some of which are followed by an
+ * operand (the index of a constant, of an array or of a function). Arrays
+ * are indexed by the synapse (SYN), the presynaptic neuron (PRE) or the
+ * postsynaptic neuron (POST) of the current event. The events are processed
+ * one after the other, so that the synapses of a postsynaptic neuron see the
+ * updates made by the previous ones.
+ */
+enum SynapticOpcode {
+	OP_CONST,      // operand: constant index
+	OP_LOAD_SYN,   // operand: array index
+	OP_LOAD_PRE,   // operand: array index
+	OP_LOAD_POST,  // operand: array index
+	OP_LOAD_T,
+	OP_STORE_SYN,  // operand: array index
+	OP_STORE_POST, // operand: array index
+	OP_ADD, OP_SUB, OP_MUL, OP_DIV, OP_POW, OP_NEG, OP_NOT,
+	OP_LT, OP_LE, OP_GT, OP_GE, OP_EQ, OP_NE, OP_AND, OP_OR,
+	OP_CALL1,      // operand: function of one argument
+	OP_CALL2,      // operand: function of two arguments
+	OP_CALL3,      // operand: function of three arguments
+	OP_COUNT
+};
+
+enum SynapticFunction1 {
+	F_EXP, F_LOG, F_LOG10, F_SQRT, F_SIN, F_COS, F_TAN, F_ASIN, F_ACOS,
+	F_ATAN, F_SINH, F_COSH, F_TANH, F_FABS, F_FLOOR, F_CEIL, F_COUNT1
+};
+
+enum SynapticFunction2 {
+	F_POW, F_FMIN, F_FMAX, F_COUNT2
+};
+
+enum SynapticFunction3 {
+	F_CLIP, F_COUNT3
+};
+
+void run_synaptic_program(int *program, int nprogram,
+						  double *constants, int nconstants,
+						  double **arrays, long *sizes, int narrays,
+						  long *synapses, int nsynapses,
+						  long *presynaptic, int npresynaptic,
+						  long *postsynaptic, int npostsynaptic,
+						  double t);
+
+#endif
@@ -0,0 +1,63 @@
+%module csynapticcode
+%include "exception.i"
+
+%exception {
+	try {
+		$action
+	} catch( std::out_of_range &e ) {
+		PyErr_SetString(PyExc_IndexError, const_cast<char *>(e.what()));
+		return NULL;
+	} catch( std::runtime_error &e ) {
+		PyErr_SetString(PyExc_ValueError, const_cast<char *>(e.what()));
+		return NULL;
+	}
+}
+
+%{
+#define SWIG_FILE_WITH_INIT
+#include "csynapticcode.h"
+%}
+
+%include "numpy.i"
+%init %{
+	import_array();
+%}
+
+%apply (int* IN_ARRAY1, int DIM1) {(int *program, int nprogram)};
+%apply (double* IN_ARRAY1, int DIM1) {(double *constants, int nconstants)};
+%apply (long* IN_ARRAY1, int DIM1) {(long *synapses, int nsynapses), (long *presynaptic, int npresynaptic), (long *postsynaptic, int npostsynaptic)};
+
+// A sequence of 1D arrays of doubles, which are modified in place
+%typemap(in) (double **arrays, long *sizes, int narrays) {
+	if(!PySequence_Check($input))
+	{
+		PyErr_SetString(PyExc_TypeError, "Expected a sequence of arrays.");
+		SWIG_fail;
+	}
+	$3 = (int)PySequence_Size($input);
+	$1 = new double*[$3>0 ? $3 : 1];
+	$2 = new long[$3>0 ? $3 : 1];
+	for(int k=0; k<$3; k++)
+	{
+		PyObject *item = PySequence_GetItem($input, k);
+		if(!item || !PyArray_Check(item) ||
+		   PyArray_TYPE((PyArrayObject *)item)!=NPY_DOUBLE ||
+		   PyArray_NDIM((PyArrayObject *)item)!=1 ||
+		   !PyArray_ISCARRAY((PyArrayObject *)item))
+		{
+			Py_XDECREF(item);
+			PyErr_SetString(PyExc_TypeError, "Expected contiguous and writeable 1D arrays of doubles.");
+			SWIG_fail;
+		}
+		// the sequence keeps a reference to the array
+		$1[k] = (double *)PyArray_DATA((PyArrayObject *)item);
+		$2[k] = (long)PyArray_DIM((PyArrayObject *)item, 0);
+		Py_DECREF(item);
+	}
+}
+%typemap(freearg) (double **arrays, long *sizes, int narrays) {
+	delete [] $1;
+	delete [] $2;
+}
+
+%include "csynapticcode.h"
@@ -0,0 +1,117 @@
+# This file was automatically generated by SWIG (http://www.swig.org).
+# Version 4.0.2
+#
+# Do not make changes to this file unless you know what you are doing--modify
+# the SWIG interface file instead.
+
+from sys import version_info as _swig_python_version_info
+if _swig_python_version_info < (2, 7, 0):
+    raise RuntimeError("Python 2.7 or later required")
+
+# Import the low-level C/C++ module
+if __package__ or "." in __name__:
+    from . import _csynapticcode
+else:
+    import _csynapticcode
+
+try:
+    import builtins as __builtin__
+except ImportError:
+    import __builtin__
+
+def _swig_repr(self):
+    try:
+        strthis = "proxy of " + self.this.__repr__()
+    except __builtin__.Exception:
+        strthis = ""
+    return "<%s.%s; %s >" % (self.__class__.__module__, self.__class__.__name__, strthis,)
+
+
+def _swig_setattr_nondynamic_instance_variable(set):
+    def set_instance_attr(self, name, value):
+        if name == "thisown":
+            self.this.own(value)
+        elif name == "this":
+            set(self, name, value)
+        elif hasattr(self, name) and isinstance(getattr(type(self), name), property):
+            set(self, name, value)
+        else:
+            raise AttributeError("You cannot add instance attributes to %s" % self)
+    return set_instance_attr
+
+
+def _swig_setattr_nondynamic_class_variable(set):
+    def set_class_attr(cls, name, value):
+        if hasattr(cls, name) and not isinstance(getattr(cls, name), property):
+            set(cls, name, value)
+        else:
+            raise AttributeError("You cannot add class attributes to %s" % cls)
+    return set_class_attr
+
+
+def _swig_add_metaclass(metaclass):
+    """Class decorator for adding a metaclass to a SWIG wrapped class - a slimmed down version of six.add_metaclass"""
+    def wrapper(cls):
+        return metaclass(cls.__name__, cls.__bases__, cls.__dict__.copy())
+    return wrapper
+
+
+class _SwigNonDynamicMeta(type):
+    """Meta class to enforce nondynamic attributes (no new attributes) for a class"""
+    __setattr__ = _swig_setattr_nondynamic_class_variable(type.__setattr__)
+
+
+OP_CONST = _csynapticcode.OP_CONST
+OP_LOAD_SYN = _csynapticcode.OP_LOAD_SYN
+OP_LOAD_PRE = _csynapticcode.OP_LOAD_PRE
+OP_LOAD_POST = _csynapticcode.OP_LOAD_POST
+OP_LOAD_T = _csynapticcode.OP_LOAD_T
+OP_STORE_SYN = _csynapticcode.OP_STORE_SYN
+OP_STORE_POST = _csynapticcode.OP_STORE_POST
+OP_ADD = _csynapticcode.OP_ADD
+OP_SUB = _csynapticcode.OP_SUB
+OP_MUL = _csynapticcode.OP_MUL
+OP_DIV = _csynapticcode.OP_DIV
+OP_POW = _csynapticcode.OP_POW
+OP_NEG = _csynapticcode.OP_NEG
+OP_NOT = _csynapticcode.OP_NOT
+OP_LT = _csynapticcode.OP_LT
+OP_LE = _csynapticcode.OP_LE
+OP_GT = _csynapticcode.OP_GT
+OP_GE = _csynapticcode.OP_GE
+OP_EQ = _csynapticcode.OP_EQ
+OP_NE = _csynapticcode.OP_NE
+OP_AND = _csynapticcode.OP_AND
+OP_OR = _csynapticcode.OP_OR
+OP_CALL1 = _csynapticcode.OP_CALL1
+OP_CALL2 = _csynapticcode.OP_CALL2
+OP_CALL3 = _csynapticcode.OP_CALL3
+OP_COUNT = _csynapticcode.OP_COUNT
+F_EXP = _csynapticcode.F_EXP
+F_LOG = _csynapticcode.F_LOG
+F_LOG10 = _csynapticcode.F_LOG10
+F_SQRT = _csynapticcode.F_SQRT
+F_SIN = _csynapticcode.F_SIN
+F_COS = _csynapticcode.F_COS
+F_TAN = _csynapticcode.F_TAN
+F_ASIN = _csynapticcode.F_ASIN
+F_ACOS = _csynapticcode.F_ACOS
+F_ATAN = _csynapticcode.F_ATAN
+F_SINH = _csynapticcode.F_SINH
+F_COSH = _csynapticcode.F_COSH
+F_TANH = _csynapticcode.F_TANH
+F_FABS = _csynapticcode.F_FABS
+F_FLOOR = _csynapticcode.F_FLOOR
+F_CEIL = _csynapticcode.F_CEIL
+F_COUNT1 = _csynapticcode.F_COUNT1
+F_POW = _csynapticcode.F_POW
+F_FMIN = _csynapticcode.F_FMIN
+F_FMAX = _csynapticcode.F_FMAX
+F_COUNT2 = _csynapticcode.F_COUNT2
+F_CLIP = _csynapticcode.F_CLIP
+F_COUNT3 = _csynapticcode.F_COUNT3
+
+def run_synaptic_program(program, constants, arrays, synapses, presynaptic, postsynaptic, t):
+    return _csynapticcode.run_synaptic_program(program, constants, arrays, synapses, presynaptic, postsynaptic, t)
+
+
@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+
+"""
+setup.py file for C++ version of the pre/post codes of Synapses
+"""
+
+from distutils.core import setup, Extension
+import os, numpy
+numpy_base_dir = os.path.split(numpy.__file__)[0]
+numpy_include_dir = os.path.join(numpy_base_dir, 'core/include')
+
+csynapticcode_module = Extension('_csynapticcode',
+                           sources=['csynapticcode_wrap.cxx',
+                                    'csynapticcode.cpp',
+                                    ],
+                           include_dirs=[numpy_include_dir],
+                           )
+
+setup (name='csynapticcode',
+       version='0.1',
+       description="""C++ version of the pre/post codes of Synapses""",
+       ext_modules=[csynapticcode_module],
+       py_modules=["csynapticcode"],
+       )
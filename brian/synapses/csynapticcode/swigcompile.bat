@@ -0,0 +1,3 @@
+@echo off
+swig -python -c++ csynapticcode.i
+setup.py build_ext --inplace %*
@@ -43,6 +43,10 @@ Main methods:
     The function executes different codes (different strategies) depending on whether
     offsets are precomputed or not, and on whether delays are heterogeneous or
     homogeneous.
+
+If the C++ version (brian/synapses/cspikequeue) is compiled, SpikeQueue is
+replaced by CSpikeQueue, which has the same interface. The Python version is
+still available as PythonSpikeQueue.
 """
 import numpy as np
 try:
@@ -163,8 +167,7 @@ class SpikeQueue(SpikeMonitor):
         if self._useweave: # no need to precompute offsets if weave is used
             self._precompute_offsets=False
 
-        super(SpikeQueue, self).__init__(source, 
-                                         record = False)
+        SpikeMonitor.__init__(self, source, record = False)
         
         #useweave=get_global_preference('useweave')
         #compiler=get_global_preference('weavecompiler')
@@ -433,65 +436,134 @@ class SpikeQueue(SpikeMonitor):
         if display:
             pylab.show()
 
-try:
-    ## CSpikeQueue support!
-    # replaces the SpikeQueue object by a wrapper for the C++ version
-    # this is only if the import statement below doesn't fail (i.e. the c version is compiled)
+PythonSpikeQueue = SpikeQueue
 
-    ## try to import the CSpikeQueue
-    import brian.experimental.cspikequeue.cspikequeue as _cspikequeue
+try:
+    ## Compiled spike queue (brian/synapses/cspikequeue), used by default if
+    ## the extension was built (it is built by setup.py)
+    from brian.synapses.cspikequeue import cspikequeue as _cspikequeue
     has_cspikequeue = True
 
-    ## OK, now replace SpikeQueue by a wrapper to the C version
-    # this adds compatibility easily to all usual the arguments of SpikeQueue
-    # hence the arguments should match those of the class above
-    class SpikeQueue(_cspikequeue.SpikeQueue, SpikeMonitor):
+    class CSpikeQueue(_cspikequeue.CSpikeQueue, SpikeMonitor):
+        '''
+        Spike queue implemented in C++, with the same arguments as
+        :class:`SpikeQueue` (``precompute_offsets`` is ignored).
+
+        The synapses of all presynaptic neurons are stored in compressed row
+        format and the delays are stored in the C++ object, so that all the
+        spikes of a timestep are inserted with a single call. The data
+        structure grows automatically. :meth:`peek` returns a view on the
+        data structure (no copy), which is only valid until the next call to
+        :meth:`next` or :meth:`propagate`.
+        '''
         def __init__(self, source, synapses, delays,
-                     max_delay = 60*ms, maxevents = INITIAL_MAXSPIKESPER_DT,
+                     max_delay = 0*ms, maxevents = INITIAL_MAXSPIKESPER_DT,
                      precompute_offsets = True):
+            self.source = source
+            self.synapses = synapses
+            self.delays = delays
             self._precompute_offsets = precompute_offsets
-            SpikeMonitor.__init__(self, source, record = False)
-
-            nsteps = int(np.floor(max_delay/self.source.clock.dt))+1
-
             self._max_delay = max_delay
-
-            self.synapses = synapses
-            self.delays = delays # Delay handling should also be in C
-
-            _cspikequeue.SpikeQueue.__init__(self, nsteps, int(maxevents))
-
-#            self._spikequeue = _cspikequeue.SpikeQueue(nsteps, int(maxevents))
+            nsteps = int(np.floor((max_delay)/(self.source.clock.dt)))+1
+            _cspikequeue.CSpikeQueue.__init__(self, nsteps, int(maxevents))
+            SpikeMonitor.__init__(self, source, record = False)
+            self._outdated = True # synapses and delays must be copied
 
         def compress(self):
-            nsteps=max(self.delays)+1
-
-            # Check whether some delays are too long
-            if (nsteps>self.n_delays):
-                desired_max_delay = nsteps * self.source.clock.dt
-                raise ValueError,"Synaptic delays exceed maximum delay, set max_delay to %.1f ms" % (desired_max_delay/ms)
-
+            '''
+            This is called the first time the network is run. The synapses
+            and delays are copied to the C++ object, and the number of rows
+            is adjusted to fit the maximum delay if necessary.
+            '''
+            self._update()
             if hasattr(self, '_iscompressed') and self._iscompressed:
                 return
-
             self._iscompressed = True
+            # Adjust the number of events per timestep
+            maxevents=max([INITIAL_MAXSPIKESPER_DT]+[len(targets) for targets in self.synapses])
+            self.expand(int(maxevents))
 
-            # Adjust the maximum delay and number of events per timestep if necessary
-            maxevents=self.n_maxevents
-            if maxevents==INITIAL_MAXSPIKESPER_DT: # automatic resize
-                maxevents=max(INITIAL_MAXSPIKESPER_DT, max([len(targets) for targets in self.synapses]))
+        def _update(self):
+            '''
+            Copies the synapses and delays to the C++ object. This is done
+            when ``_outdated`` is set, i.e., when synapses were created or
+            delays modified (see ``Synapses._update_queues``).
+            '''
+            self._set_synapses()
+            self._set_delays(self.delays)
+            self._outdated = False
+
+        def _set_synapses(self):
+            counts = np.array([len(targets) for targets in self.synapses], dtype = int)
+            rowind = np.hstack((0, np.cumsum(counts))).astype(int)
+            if rowind[-1]:
+                allsynapses = np.hstack([targets[:] for targets in self.synapses]).astype(int)
+            else:
+                allsynapses = np.zeros(0, dtype = int)
+            self.set_synapses(rowind, allsynapses)
+
+        def _set_delays(self, delays):
+            delays = np.asarray(delays, dtype = int)
+            nsteps = max(delays)+1 if len(delays) else 1
+            if nsteps>self.n_delays:
+                if self._max_delay>0:
+                    raise ValueError,"Synaptic delays exceed maximum delay"
+                self.expand_delays(int(nsteps))
+            self.set_delays(delays)
+
+        def _update_delays(self, delays):
+            '''
+            Internal method to update the delays, used by the Synapses class
+            when the delays are dynamically varied (in second).
+            '''
+            self.delays = np.array(np.floor(delays/self.source.clock.dt), dtype = int)+1
+            self._set_delays(self.delays)
 
-            # Resize
+        def peek(self):
+            '''
+            Returns the all the synaptic events corresponding to the current
+            time, as an array of synapse indexes (view on the data structure).
+            '''
+            return self.get_events(0)
 
-            self.expand(int(maxevents))
         def propagate(self, spikes):
             '''
             Called by the network object at every timestep.
-            Spikes produce synaptic events that are inserted in the queue. 
+            Spikes produce synaptic events that are inserted in the queue.
             '''
+            if self._outdated:
+                self._update()
             if len(spikes):
-                synaptic_events=np.hstack([self.synapses[i].data for i in spikes]) # could be not efficient
-                self.insert(synaptic_events, self.delays[synaptic_events])   
-        warnings.warn('Using C++ SpikeQueue')
+                _cspikequeue.CSpikeQueue.propagate(self, np.asarray(spikes, dtype = int))
+
+        def insert(self, delay, target):
+            '''
+            Inserts events ``target`` (synapse indexes) with delays ``delay``
+            (in timesteps).
+            '''
+            _cspikequeue.CSpikeQueue.insert(self, np.asarray(target, dtype = int),
+                                            np.asarray(delay, dtype = int))
+
+        def __getstate__(self):
+            state = self.__dict__.copy()
+            state.pop('this', None)
+            state['_queue_state'] = (self.n_delays, self.n_maxevents,
+                                     [self.get_events(d).copy() for d in range(self.n_delays)])
+            return state
+
+        def __setstate__(self, state):
+            n_delays, n_maxevents, events = state.pop('_queue_state')
+            _cspikequeue.CSpikeQueue.__init__(self, n_delays, n_maxevents)
+            self.__dict__.update(state)
+            for d, targets in enumerate(events):
+                self.insert(d*np.ones(len(targets), dtype = int), targets)
+            self._outdated = True
+
+        def __repr__(self):
+            res = 'CSpikeQueue(shape = (%d, %d), ' % (self.n_delays, self.n_maxevents)
+            res += 'max_delay = %.1f ms)' % (self._max_delay/ms)
+            return res
+
+    SpikeQueue = CSpikeQueue
 except ImportError:
     has_cspikequeue = False
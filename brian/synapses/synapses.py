@@ -11,6 +11,7 @@ from numpy.random import binomial
 from random import sample
 from scipy import rand, randn
 
+from brian.globalprefs import get_global_preference
 from brian.inspection import get_identifiers, namespace
 from brian.log import log_debug, log_warn
 from brian.neurongroup import NeuronGroup
@@ -18,11 +19,24 @@ from brian.optimiser import AffineFunction, symbolic_eval
 from brian.stdunits import ms
 from brian.synapses.spikequeue import SpikeQueue
 from brian.synapses.synaptic_equations import SynapticEquations
+from brian.synapses.synapticcode import (c_functions, python_to_c_statements,
+                                         synaptic_c_support_code,
+                                         python_to_program, has_csynapticcode)
+if has_csynapticcode:
+    from brian.synapses.csynapticcode.csynapticcode import run_synaptic_program
 from brian.synapses.synapticvariable import (SynapticDelayVariable, 
                                              SynapticVariable, slice_to_array)
 from brian.utils.documentation import flattened_docstring
 from brian.utils.dynamicarray import DynamicArray, DynamicArray1D 
 
+try:
+    import weave
+except ImportError:
+    try:
+        from scipy import weave
+    except ImportError:
+        weave = None
+
 try:
     import sympy
     use_sympy = True
@@ -145,6 +159,15 @@ class Synapses(NeuronGroup): # This way we inherit a lot of useful stuff
         The compiled codes to be executed on pre and postsynaptic spikes.
     ``namespaces``
         The namespaces for the pre and postsynaptic codes.
+    
+    If the compiled extension ``brian/synapses/csynapticcode`` is built (it
+    is built by ``setup.py``), the pre and postsynaptic codes are translated
+    when the object is compressed into programs run by a compiled loop over
+    the synaptic events (see :meth:`generate_program`). Otherwise, if the
+    ``useweave`` global preference is set, they are translated to C++ loops
+    (see :meth:`generate_c_code`), compiled with weave the first time they
+    are run. Codes that cannot be translated (for example because they use
+    random numbers) run as Python code.
     '''
     def __init__(self, source, target = None, model = None, pre = None, post = None,
              max_delay = 0*ms,
@@ -320,6 +343,15 @@ class Synapses(NeuronGroup): # This way we inherit a lot of useful stuff
 
         # Code generation
         self._binomial = _binomial_wrapper
+        self._use_compiled = has_csynapticcode
+        self._useweave = get_global_preference('useweave') and weave is not None \
+                         and not self._use_compiled
+        self._cpp_compiler = get_global_preference('weavecompiler')
+        self._extra_compile_args = ['-O3']
+        if self._cpp_compiler == 'gcc':
+            self._extra_compile_args += get_global_preference('gcc_options')
+        self._c_codes = []
+        self._programs = []
 
         self.contained_objects = []
         self.codes=[]
@@ -542,9 +574,193 @@ class Synapses(NeuronGroup): # This way we inherit a lot of useful stuff
         compiled_code = compile(code_str, "Synaptic code", "exec")
         
         _namespace['_original_code_string'] = code_str
+        # used by generate_c_code
+        _namespace['_synaptic_code'] = code
+        _namespace['_direct'] = direct
         
         return compiled_code,_namespace
 
+    def generate_c_code(self, code, _namespace, direct=False):
+        '''
+        Generates C++ code running the pre or post ``code`` in a loop over the
+        synaptic events ``_synapses``, for use with weave.
+        
+        The events are processed one after the other, so that synapses with
+        the same postsynaptic neuron see the updates made by the previous
+        ones, as with the repeated-index handling of the Python code. With
+        ``direct=True``, the postsynaptic variables must not be modified
+        (they are only modified once per neuron by the Python code).
+        
+        Returns the code and a dictionary giving, for each array used by the
+        code, its name in ``_namespace``. Raises ``NotImplementedError`` if
+        the code cannot be written in C (e.g. if it uses random numbers or
+        other functions than the usual mathematical ones).
+        '''
+        arrays = {}
+        indices = {'syn': '_s', 'pre': '_i', 'post': '_j'}
+        def resolve_variable(name, assigned=False):
+            kind, value = self._resolve_synaptic_name(name, _namespace,
+                                                      direct, assigned)
+            if kind == 't':
+                return 't'
+            if kind == 'const':
+                if isinstance(value, float):
+                    return '(' + repr(value) + ')'
+                return '(' + str(value) + ')'
+            arrays['_' + kind + '_' + value] = self._synaptic_array_name(kind, value)
+            return '_' + kind + '_' + value + '[' + indices[kind] + ']'
+        def resolve_target(name):
+            return resolve_variable(name, assigned=True)
+        def resolve_function(name):
+            return self._resolve_synaptic_function(name, _namespace)[0]
+        statements = python_to_c_statements(code, resolve_target,
+                                            resolve_variable, resolve_function)
+        # pre and postsynaptic neuron indices, if used
+        indices = ''
+        if '[_i]' in statements:
+            indices += 'long _i = _presynaptic[_s];\n'
+        if '[_j]' in statements:
+            indices += 'long _j = _postsynaptic[_s];\n'
+        c_code = '''
+        for(int _k=0;_k<_nevents;_k++)
+        {
+            long _s = _synapses[_k];
+        %(statements)s
+        }
+        '''
+        c_code = flattened_docstring(c_code) % {'statements': indent(indices + statements)}
+        log_debug('brian.synapses', '\nC CODE:\n' + c_code)
+        return c_code, arrays
+
+    def generate_program(self, code, _namespace, direct=False):
+        '''
+        Translates the pre or post ``code`` into a program run by the compiled
+        loop over the synaptic events of ``brian/synapses/csynapticcode``.
+        
+        The events are processed one after the other, as with
+        :meth:`generate_c_code` (and with the same restrictions). Constant
+        expressions are evaluated in Python, so that the program only
+        computes the expressions which depend on the variables.
+        
+        Returns the program (an array of instructions), the constants (an
+        array), and the list of the names in ``_namespace`` of the arrays used
+        by the program. Raises ``NotImplementedError`` if the code cannot be
+        translated.
+        '''
+        resolve_variable = lambda name: self._resolve_synaptic_name(name, _namespace,
+                                                                    direct)
+        resolve_target = lambda name: self._resolve_synaptic_name(name, _namespace,
+                                                                  direct, True)
+        resolve_function = lambda name: self._resolve_synaptic_function(name,
+                                                                        _namespace)
+        program, constants, arrays = python_to_program(code, resolve_target,
+                                                       resolve_variable,
+                                                       resolve_function)
+        arrays = [self._synaptic_array_name(kind, name) for kind, name in arrays]
+        for name in arrays:
+            value = _namespace[name]
+            if value.dtype != np.float64 or not value.flags['C_CONTIGUOUS']:
+                raise NotImplementedError('Variable ' + name + ' is not a contiguous array of floats')
+        log_debug('brian.synapses', '\nPROGRAM:\n' + str(program))
+        return program, constants, arrays
+
+    def _resolve_synaptic_name(self, name, _namespace, direct=False,
+                               assigned=False):
+        '''
+        Returns what a name of the pre or post code refers to, as a tuple
+        ``(kind, value)``: ``('syn', var)``, ``('pre', var)`` and
+        ``('post', var)`` for the synaptic, presynaptic and postsynaptic
+        variable ``var``, ``('t', None)`` for the time and ``('const', value)``
+        for a number of ``_namespace``. Raises ``NotImplementedError`` if the
+        name cannot be used in compiled code (or cannot be ``assigned``).
+        '''
+        source_vars = [var for var in self.source.var_index if isinstance(var, str)]
+        target_vars = [var for var in self.target.var_index if isinstance(var, str)]
+        if name == 'n':
+            raise NotImplementedError('n not supported in C code')
+        if name in self.var_index and isinstance(name, str):
+            if name in target_vars:
+                raise NotImplementedError('Ambiguous variable ' + name)
+            return 'syn', name
+        if name == 't':
+            if assigned:
+                raise NotImplementedError('t cannot be modified')
+            return 't', None
+        if name.endswith('_post') and name[:-5] in target_vars:
+            name = name[:-5]
+        if name in target_vars:
+            if direct and assigned:
+                raise NotImplementedError('Postsynaptic variables cannot be modified by direct code')
+            return 'post', name
+        if not assigned and name.endswith('_pre') and name[:-4] in source_vars:
+            return 'pre', name[:-4]
+        if assigned:
+            raise NotImplementedError(name + ' cannot be modified in C code')
+        value = _namespace.get(name, None)
+        if isinstance(value, float):
+            return 'const', float(value)
+        if isinstance(value, (int, long)) and not isinstance(value, bool):
+            return 'const', int(value)
+        raise NotImplementedError('Unknown variable ' + name)
+
+    def _resolve_synaptic_function(self, name, _namespace):
+        '''
+        Returns the C name of the function ``name`` of the pre or post code,
+        and the function. Raises ``NotImplementedError`` if it cannot be used
+        in compiled code.
+        '''
+        function = _namespace.get(name, None)
+        cname = c_functions.get(getattr(function, '__name__', None), None)
+        if cname is None:
+            raise NotImplementedError('Function ' + name + ' not supported in C code')
+        return cname, function
+
+    def _synaptic_array_name(self, kind, var):
+        '''
+        Name in the namespaces of the array of the synaptic (``kind='syn'``),
+        presynaptic (``'pre'``) or postsynaptic (``'post'``) variable ``var``.
+        '''
+        if kind == 'syn':
+            return var
+        return var + '_' + kind
+
+    def _run_program(self, k, synaptic_events):
+        '''
+        Runs the program of the pathway ``k`` on the given synaptic events.
+        '''
+        program, constants, arrays = self._programs[k]
+        _namespace = self.namespaces[k]
+        run_synaptic_program(program, constants,
+                             [_namespace[name] for name in arrays],
+                             np.asarray(synaptic_events, dtype=int),
+                             self._program_presynaptic,
+                             self._program_postsynaptic, self.clock._t)
+
+    def _run_c_code(self, k, synaptic_events):
+        '''
+        Runs the C code of the pathway ``k`` on the given synaptic events.
+        Returns False if the code could not be compiled, in which case the
+        Python code is used from then on.
+        '''
+        c_code, arrays = self._c_codes[k]
+        _namespace = self.namespaces[k]
+        local_dict = dict((cname, _namespace[name]) for cname, name in arrays.iteritems())
+        local_dict['_synapses'] = synaptic_events
+        local_dict['_nevents'] = len(synaptic_events)
+        local_dict['_presynaptic'] = self.presynaptic.data
+        local_dict['_postsynaptic'] = self.postsynaptic.data
+        local_dict['t'] = self.clock._t
+        try:
+            weave.inline(c_code, local_dict.keys(), local_dict=local_dict,
+                         support_code=synaptic_c_support_code,
+                         compiler=self._cpp_compiler,
+                         extra_compile_args=self._extra_compile_args)
+        except Exception:
+            log_warn('brian.synapses', 'C compilation failed, falling back on Python.')
+            self._c_codes[k] = None
+            return False
+        return True
+
     # Pickling support
     def __getstate__(self):
         # code objects cannot be pickled, we therefore delete them and later
@@ -574,7 +790,8 @@ class Synapses(NeuronGroup): # This way we inherit a lot of useful stuff
             namespace['target'] = self.target
 
             # numpy array views don't survive pickling
-            queue.X_flat = queue.X.reshape(queue.X.size, )
+            if hasattr(queue, 'X_flat'):
+                queue.X_flat = queue.X.reshape(queue.X.size, )
 
         # Re-compress the Synapses object (this also adds "np" to the namespaces)
         self._iscompressed = False
@@ -761,6 +978,15 @@ class Synapses(NeuronGroup): # This way we inherit a lot of useful stuff
             nsynapses=len(self.synapses_post[j])
             self.synapses_post[j].resize(nsynapses+len(synapses))
             self.synapses_post[j][nsynapses:]=synapses+nsynapses_all
+        self._update_queues()
+
+    def _update_queues(self):
+        '''
+        Signals to the spike queues that synapses or delays have changed
+        (the compiled spike queues keep their own copy of them).
+        '''
+        for queue in getattr(self, 'queues', []):
+            queue._outdated = True
     
     def __getattr__(self, name):
         if name == 'var_index':
@@ -815,9 +1041,12 @@ class Synapses(NeuronGroup): # This way we inherit a lot of useful stuff
         if self._state_updater is not None:
             self._state_updater(self)
 
-        for queue, _namespace, code in zip(self.queues, self.namespaces, self.codes):
+        for k, (queue, _namespace, code) in enumerate(zip(self.queues, self.namespaces, self.codes)):
             synaptic_events = queue.peek()
-            if len(synaptic_events):
+            if len(synaptic_events) and self._programs[k] is not None:
+                self._run_program(k, synaptic_events)
+            elif len(synaptic_events) and not (self._c_codes[k] is not None and
+                                               self._run_c_code(k, synaptic_events)):
                 # Build the namespace - Here we don't consider static equations
                 _namespace['_synapses'] = synaptic_events
                 _namespace['t'] = self.clock._t
@@ -940,6 +1169,30 @@ class Synapses(NeuronGroup): # This way we inherit a lot of useful stuff
             _namespace['randn']=randn
             _namespace['zeros']=np.zeros
             _namespace['sum']=sum
+        
+        # Translate the codes to programs of the compiled loop, or to C for
+        # weave (None if not possible or not using compiled code)
+        self._programs = []
+        self._c_codes = []
+        for _namespace in self.namespaces:
+            program = c_code = None
+            if (self._use_compiled or self._useweave) and '_synaptic_code' in _namespace:
+                try:
+                    if self._use_compiled:
+                        program = self.generate_program(_namespace['_synaptic_code'],
+                                                        _namespace,
+                                                        direct=_namespace['_direct'])
+                    else:
+                        c_code = self.generate_c_code(_namespace['_synaptic_code'],
+                                                      _namespace,
+                                                      direct=_namespace['_direct'])
+                except NotImplementedError, e:
+                    log_debug('brian.synapses', 'Using Python code: ' + str(e))
+            self._programs.append(program)
+            self._c_codes.append(c_code)
+        if self._use_compiled:
+            self._program_presynaptic = np.asarray(self.presynaptic.data, dtype=int)
+            self._program_postsynaptic = np.asarray(self.postsynaptic.data, dtype=int)
             
         self._iscompressed=True
 
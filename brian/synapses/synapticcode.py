@@ -0,0 +1,319 @@
+'''
+Translation of the pre/post codes of :class:`Synapses` into C++ loops over
+the synaptic events, used with weave (see ``Synapses.generate_c_code``), or
+into programs run by the compiled loop of ``brian/synapses/csynapticcode``
+(see ``Synapses.generate_program``).
+'''
+import ast
+import operator
+import numpy as np
+
+try:
+    from brian.synapses.csynapticcode import csynapticcode
+    has_csynapticcode = True
+except ImportError:
+    has_csynapticcode = False
+
+__all__ = ['python_to_c_statements', 'synaptic_c_support_code',
+           'python_to_program', 'has_csynapticcode']
+
+# C versions of functions, indexed by the __name__ of the numpy function
+# (Brian's unit-safe versions have the same name as the numpy ones)
+c_functions = {'exp': 'exp', 'log': 'log', 'log10': 'log10', 'sqrt': 'sqrt',
+               'sin': 'sin', 'cos': 'cos', 'tan': 'tan',
+               'arcsin': 'asin', 'arccos': 'acos', 'arctan': 'atan',
+               'sinh': 'sinh', 'cosh': 'cosh', 'tanh': 'tanh',
+               'absolute': 'fabs', 'floor': 'floor', 'ceil': 'ceil',
+               'power': 'pow', 'minimum': 'fmin', 'maximum': 'fmax',
+               'clip': 'clip'}
+
+synaptic_c_support_code = '''
+inline double clip(double x, double low, double high)
+{
+    if(x<low) return low;
+    if(x>high) return high;
+    return x;
+}
+'''
+
+_binary_operators = {ast.Add: '+', ast.Sub: '-', ast.Mult: '*', ast.Div: '/'}
+_unary_operators = {ast.UAdd: '+', ast.USub: '-', ast.Not: '!'}
+_comparison_operators = {ast.Lt: '<', ast.LtE: '<=', ast.Gt: '>',
+                         ast.GtE: '>=', ast.Eq: '==', ast.NotEq: '!='}
+_boolean_operators = {ast.And: '&&', ast.Or: '||'}
+
+
+class CExpressionWriter(ast.NodeVisitor):
+    '''
+    Writes a Python expression as a C expression. ``resolve_name(name)``
+    returns the C version of a variable, ``resolve_function(name)`` the
+    C version of a function. Both raise ``NotImplementedError`` for names
+    which cannot be used in C, as does the writer for unsupported syntax.
+    '''
+    def __init__(self, resolve_name, resolve_function):
+        self.resolve_name = resolve_name
+        self.resolve_function = resolve_function
+
+    def generic_visit(self, node):
+        raise NotImplementedError(node.__class__.__name__ + ' not supported in C code')
+
+    def visit_Num(self, node):
+        if not isinstance(node.n, (int, long, float)):
+            raise NotImplementedError('Complex numbers not supported in C code')
+        return repr(node.n)
+
+    def visit_Name(self, node):
+        return self.resolve_name(node.id)
+
+    def visit_BinOp(self, node):
+        left, right = self.visit(node.left), self.visit(node.right)
+        if isinstance(node.op, ast.Pow):
+            return 'pow(' + left + ', ' + right + ')'
+        if node.op.__class__ not in _binary_operators:
+            raise NotImplementedError(node.op.__class__.__name__ + ' not supported in C code')
+        return '(' + left + _binary_operators[node.op.__class__] + right + ')'
+
+    def visit_UnaryOp(self, node):
+        if node.op.__class__ not in _unary_operators:
+            raise NotImplementedError(node.op.__class__.__name__ + ' not supported in C code')
+        return '(' + _unary_operators[node.op.__class__] + self.visit(node.operand) + ')'
+
+    def visit_BoolOp(self, node):
+        op = _boolean_operators[node.op.__class__]
+        return '(' + op.join(self.visit(value) for value in node.values) + ')'
+
+    def visit_Compare(self, node):
+        if len(node.ops) != 1 or node.ops[0].__class__ not in _comparison_operators:
+            raise NotImplementedError('Chained comparisons not supported in C code')
+        return '(' + self.visit(node.left) + \
+               _comparison_operators[node.ops[0].__class__] + \
+               self.visit(node.comparators[0]) + ')'
+
+    def visit_Call(self, node):
+        if not isinstance(node.func, ast.Name) or node.keywords or \
+           node.starargs or node.kwargs:
+            raise NotImplementedError('Only simple function calls supported in C code')
+        return self.resolve_function(node.func.id) + \
+               '(' + ', '.join(self.visit(arg) for arg in node.args) + ')'
+
+
+def python_to_c_statements(code, resolve_target, resolve_name,
+                           resolve_function):
+    '''
+    Translates the statements of ``code`` (assignments and augmented
+    assignments of variables) into C statements, one per line.
+    ``resolve_target(name)`` returns the C version of an assigned variable,
+    ``resolve_name`` and ``resolve_function`` are used for expressions (see
+    :class:`CExpressionWriter`). Raises ``NotImplementedError`` if the code
+    cannot be written in C.
+    '''
+    writer = CExpressionWriter(resolve_name, resolve_function)
+    lines = []
+    for statement in ast.parse(code).body:
+        if isinstance(statement, ast.Assign):
+            if len(statement.targets) != 1:
+                raise NotImplementedError('Multiple assignments not supported in C code')
+            target, op = statement.targets[0], '='
+        elif isinstance(statement, ast.AugAssign):
+            if statement.op.__class__ not in _binary_operators:
+                raise NotImplementedError(statement.op.__class__.__name__ + ' not supported in C code')
+            target = statement.target
+            op = _binary_operators[statement.op.__class__] + '='
+        else:
+            raise NotImplementedError(statement.__class__.__name__ + ' not supported in C code')
+        if not isinstance(target, ast.Name):
+            raise NotImplementedError('Only variables can be assigned in C code')
+        lines.append(resolve_target(target.id) + ' ' + op + ' ' +
+                     writer.visit(statement.value) + ';')
+    return '\n'.join(lines)
+
+
+# Python versions of the operators, used to evaluate constant expressions
+_python_binary_operators = {ast.Add: operator.add, ast.Sub: operator.sub,
+                            ast.Mult: operator.mul, ast.Div: operator.div,
+                            ast.Pow: operator.pow}
+_python_unary_operators = {ast.UAdd: operator.pos, ast.USub: operator.neg,
+                           ast.Not: operator.not_}
+_python_comparison_operators = {ast.Lt: operator.lt, ast.LtE: operator.le,
+                                ast.Gt: operator.gt, ast.GtE: operator.ge,
+                                ast.Eq: operator.eq, ast.NotEq: operator.ne}
+
+
+class ProgramWriter(ast.NodeVisitor):
+    '''
+    Writes a Python expression as instructions of the stack machine of
+    ``csynapticcode`` (see ``csynapticcode.h``). ``resolve_name(name)``
+    returns what a variable refers to, as a tuple ``(kind, value)`` (see
+    ``Synapses.resolve_synaptic_name``), ``resolve_function(name)`` returns
+    the C name of a function and the function. Both raise
+    ``NotImplementedError`` for names which cannot be used, as does the
+    writer for unsupported syntax.
+    
+    Visiting an expression returns a number if it is constant (it is then
+    evaluated in Python, so that e.g. integer divisions are the same as in the
+    Python code), otherwise a list of instructions. The constants and arrays
+    used by the instructions are stored in the ``constants`` and ``arrays``
+    lists (arrays are given as ``(kind, name)``).
+    '''
+    def __init__(self, resolve_name, resolve_function):
+        self.resolve_name = resolve_name
+        self.resolve_function = resolve_function
+        self.constants = []
+        self.arrays = []
+        cs = csynapticcode
+        self.binary_opcodes = {ast.Add: cs.OP_ADD, ast.Sub: cs.OP_SUB,
+                               ast.Mult: cs.OP_MUL, ast.Div: cs.OP_DIV,
+                               ast.Pow: cs.OP_POW}
+        self.unary_opcodes = {ast.USub: cs.OP_NEG, ast.Not: cs.OP_NOT}
+        self.comparison_opcodes = {ast.Lt: cs.OP_LT, ast.LtE: cs.OP_LE,
+                                   ast.Gt: cs.OP_GT, ast.GtE: cs.OP_GE,
+                                   ast.Eq: cs.OP_EQ, ast.NotEq: cs.OP_NE}
+        self.boolean_opcodes = {ast.And: cs.OP_AND, ast.Or: cs.OP_OR}
+        self.load_opcodes = {'syn': cs.OP_LOAD_SYN, 'pre': cs.OP_LOAD_PRE,
+                             'post': cs.OP_LOAD_POST}
+        self.store_opcodes = {'syn': cs.OP_STORE_SYN, 'post': cs.OP_STORE_POST}
+        self.functions = {}
+        for cname, f in [('exp', cs.F_EXP), ('log', cs.F_LOG),
+                         ('log10', cs.F_LOG10), ('sqrt', cs.F_SQRT),
+                         ('sin', cs.F_SIN), ('cos', cs.F_COS),
+                         ('tan', cs.F_TAN), ('asin', cs.F_ASIN),
+                         ('acos', cs.F_ACOS), ('atan', cs.F_ATAN),
+                         ('sinh', cs.F_SINH), ('cosh', cs.F_COSH),
+                         ('tanh', cs.F_TANH), ('fabs', cs.F_FABS),
+                         ('floor', cs.F_FLOOR), ('ceil', cs.F_CEIL)]:
+            self.functions[cname] = (1, cs.OP_CALL1, f)
+        for cname, f in [('pow', cs.F_POW), ('fmin', cs.F_FMIN),
+                         ('fmax', cs.F_FMAX)]:
+            self.functions[cname] = (2, cs.OP_CALL2, f)
+        self.functions['clip'] = (3, cs.OP_CALL3, cs.F_CLIP)
+
+    def code(self, value):
+        '''
+        Returns the instructions computing ``value`` (a number or a list of
+        instructions).
+        '''
+        if isinstance(value, list):
+            return value
+        self.constants.append(float(value))
+        return [csynapticcode.OP_CONST, len(self.constants) - 1]
+
+    def array(self, kind, name):
+        if (kind, name) not in self.arrays:
+            self.arrays.append((kind, name))
+        return self.arrays.index((kind, name))
+
+    def load(self, name):
+        kind, value = self.resolve_name(name)
+        if kind == 'const':
+            return value
+        if kind == 't':
+            return [csynapticcode.OP_LOAD_T]
+        return [self.load_opcodes[kind], self.array(kind, value)]
+
+    def target(self, name, resolve_target):
+        '''
+        Returns the kind and the index of the array of an assigned variable.
+        '''
+        kind, value = resolve_target(name)
+        if kind not in self.store_opcodes:
+            raise NotImplementedError(name + ' cannot be modified in compiled code')
+        return kind, self.array(kind, value)
+
+    def generic_visit(self, node):
+        raise NotImplementedError(node.__class__.__name__ + ' not supported in compiled code')
+
+    def visit_Num(self, node):
+        if not isinstance(node.n, (int, long, float)):
+            raise NotImplementedError('Complex numbers not supported in compiled code')
+        return node.n
+
+    def visit_Name(self, node):
+        return self.load(node.id)
+
+    def visit_BinOp(self, node):
+        left, right = self.visit(node.left), self.visit(node.right)
+        if node.op.__class__ not in self.binary_opcodes:
+            raise NotImplementedError(node.op.__class__.__name__ + ' not supported in compiled code')
+        if not isinstance(left, list) and not isinstance(right, list):
+            return _python_binary_operators[node.op.__class__](left, right)
+        return self.code(left) + self.code(right) + \
+               [self.binary_opcodes[node.op.__class__]]
+
+    def visit_UnaryOp(self, node):
+        if node.op.__class__ not in _python_unary_operators:
+            raise NotImplementedError(node.op.__class__.__name__ + ' not supported in compiled code')
+        operand = self.visit(node.operand)
+        if not isinstance(operand, list):
+            return _python_unary_operators[node.op.__class__](operand)
+        if isinstance(node.op, ast.UAdd):
+            return operand
+        return operand + [self.unary_opcodes[node.op.__class__]]
+
+    def visit_BoolOp(self, node):
+        values = [self.visit(value) for value in node.values]
+        code = self.code(values[0])
+        for value in values[1:]:
+            code = code + self.code(value) + [self.boolean_opcodes[node.op.__class__]]
+        return code
+
+    def visit_Compare(self, node):
+        if len(node.ops) != 1 or node.ops[0].__class__ not in self.comparison_opcodes:
+            raise NotImplementedError('Chained comparisons not supported in compiled code')
+        op = node.ops[0].__class__
+        left, right = self.visit(node.left), self.visit(node.comparators[0])
+        if not isinstance(left, list) and not isinstance(right, list):
+            return _python_comparison_operators[op](left, right)
+        return self.code(left) + self.code(right) + [self.comparison_opcodes[op]]
+
+    def visit_Call(self, node):
+        if not isinstance(node.func, ast.Name) or node.keywords or \
+           node.starargs or node.kwargs:
+            raise NotImplementedError('Only simple function calls supported in compiled code')
+        cname, function = self.resolve_function(node.func.id)
+        nargs, opcode, f = self.functions[cname]
+        if len(node.args) != nargs:
+            raise NotImplementedError('Wrong number of arguments for ' + node.func.id)
+        args = [self.visit(arg) for arg in node.args]
+        if not any(isinstance(arg, list) for arg in args):
+            return float(function(*args))
+        code = []
+        for arg in args:
+            code += self.code(arg)
+        return code + [opcode, f]
+
+
+def python_to_program(code, resolve_target, resolve_name, resolve_function):
+    '''
+    Translates the statements of ``code`` (assignments and augmented
+    assignments of variables) into a program of the stack machine of
+    ``csynapticcode``. ``resolve_target(name)`` returns what an assigned
+    variable refers to, ``resolve_name`` and ``resolve_function`` are used for
+    expressions (see :class:`ProgramWriter`).
+    
+    Returns the program (an array of instructions), the constants (an array)
+    and the list of arrays, given as ``(kind, name)``. Raises
+    ``NotImplementedError`` if the code cannot be translated.
+    '''
+    writer = ProgramWriter(resolve_name, resolve_function)
+    program = []
+    for statement in ast.parse(code).body:
+        if isinstance(statement, ast.Assign):
+            if len(statement.targets) != 1:
+                raise NotImplementedError('Multiple assignments not supported in compiled code')
+            target = statement.targets[0]
+        elif isinstance(statement, ast.AugAssign):
+            if statement.op.__class__ not in writer.binary_opcodes:
+                raise NotImplementedError(statement.op.__class__.__name__ + ' not supported in compiled code')
+            target = statement.target
+        else:
+            raise NotImplementedError(statement.__class__.__name__ + ' not supported in compiled code')
+        if not isinstance(target, ast.Name):
+            raise NotImplementedError('Only variables can be assigned in compiled code')
+        kind, index = writer.target(target.id, resolve_target)
+        value = writer.code(writer.visit(statement.value))
+        if isinstance(statement, ast.AugAssign):
+            value = [writer.load_opcodes[kind], index] + value + \
+                    [writer.binary_opcodes[statement.op.__class__]]
+        program += value + [writer.store_opcodes[kind], index]
+    return (np.array(program, dtype=np.intc),
+            np.array(writer.constants, dtype=float), writer.arrays)
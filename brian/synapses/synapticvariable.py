@@ -159,6 +159,7 @@ class SynapticDelayVariable(SynapticVariable):
         if isinstance(value,str):
             value = self._interpret(value,synapses,level+1)
         self.data[synapses] = np.array(np.array(value)/self.synapses.clock.dt,dtype=self.data.dtype)
+        self.synapses._update_queues()
     
 def slice_to_array(s,N=None):
     '''
@@ -265,7 +265,76 @@ def test_access():
                       [0., 0., 0.]])))    
     
 
+@repeat_with_global_opts([{'useweave': False}, {'useweave': True}])
+def test_sparse_propagation():
+    'Test that sparse propagation gives the same results as dense propagation'
+    W = rand(5, 4)
+    W[W < 0.5] = 0.
+    W[2, :] = 0. # an empty row
+    spikes = [0, 2, 3, 4]
+    for modulation in [None, 'v']:
+        G = NeuronGroup(5, model='v:1')
+        G.v = arange(5) + 1.
+        H_sparse = NeuronGroup(4, model='v:1')
+        H_dense = NeuronGroup(4, model='v:1')
+        C_sparse = Connection(G, H_sparse, 'v', structure='sparse',
+                              modulation=modulation)
+        C_dense = Connection(G, H_dense, 'v', structure='dense',
+                             modulation=modulation)
+        C_sparse.connect(W=W)
+        C_dense.connect(W=W)
+        C_sparse.propagate(spikes)
+        C_dense.propagate(spikes)
+        assert all(abs(H_sparse.v - H_dense.v) < 1e-10)
+        # spikes can also be given as an array
+        C_sparse.propagate(array(spikes))
+        C_dense.propagate(array(spikes))
+        assert all(abs(H_sparse.v - H_dense.v) < 1e-10)
+        C_sparse.propagate([])
+        assert all(abs(H_sparse.v - H_dense.v) < 1e-10)
+    
+    # the synapse indices of the rows
+    C = Connection(G, H_sparse, 'v', structure='sparse')
+    C.connect(W=W)
+    C.compress()
+    synapses, counts = C.W.get_rows_synapses(spikes)
+    assert all(counts == [len(C.W.rowj[i]) for i in spikes])
+    assert all(synapses == hstack([arange(C.W.rowind[i], C.W.rowind[i + 1])
+                                   for i in spikes]))
+
+@repeat_with_global_opts([{'useweave': False}, {'useweave': True}])
+def test_delay_propagation():
+    'Test that all structures give the same results with heterogeneous delays'
+    W = rand(5, 4)
+    W[W < 0.5] = 0.
+    W[1, :] = 1. # two spiking rows with the same targets
+    D = (W > 0) * (arange(20).reshape((5, 4)) % 6) * ms
+    spikes = [0, 1, 3, 4]
+    for modulation in [None, 'v']:
+        G = NeuronGroup(5, model='v:1')
+        G.v = arange(5) + 1.
+        results = []
+        for structure in ['sparse', 'dense', 'dynamic']:
+            H = NeuronGroup(4, model='v:1')
+            C = Connection(G, H, 'v', structure=structure, delay=True,
+                           max_delay=6 * ms, modulation=modulation)
+            C.connect(W=W, delay=D)
+            C.compress()
+            reactions = []
+            for step in range(12):
+                C.propagate(spikes)
+                if step == 5:
+                    # changing the delays during a run
+                    C.delay[1, :] = 1 * ms
+                C.delayed_propagate()
+                reactions.append(H.v.copy())
+            results.append(array(reactions))
+        for r in results[1:]:
+            assert all(abs(r - results[0]) < 1e-10)
+
 if __name__ == '__main__':
     test_construction()
     test_access()
+    test_sparse_propagation()
+    test_delay_propagation()
     test_utility_functions()
@@ -1,3 +1,10 @@
+import os
+import shutil
+import tempfile
+import time
+import weakref
+import gc
+
 from numpy.testing.utils import assert_raises, assert_equal
 
 from brian import *
@@ -236,6 +243,292 @@ def test_middleear():
                      np.asarray(one_gain).flatten())
 
 
+def test_linearfilterbank_kernels():
+    '''Make sure that the default LinearFilterbank (compiled if available)
+       gives the same results as the Python version and as lfilter, for
+       cascades of filters of various orders and several buffers.
+    '''
+    from scipy.signal import lfilter
+    samplerate = 44.1*kHz
+    snd = Sound(np.random.randn(1000, 1), samplerate=samplerate)
+    for nchannels, m, p in [(3, 1, 1), (5, 2, 3), (300, 3, 4), (7, 5, 2)]:
+        b = np.random.randn(nchannels, m, p)*0.3
+        a = np.random.randn(nchannels, m, p)*0.1
+        a[:, 0, :] = 1
+        expected = np.tile(np.asarray(snd), (1, nchannels))
+        for k in range(p):
+            expected = np.array([lfilter(b[i, :, k], a[i, :, k], expected[:, i])
+                                 for i in range(nchannels)]).T
+        fb = LinearFilterbank(snd, b, a)
+        assert np.allclose(np.asarray(fb.process(buffersize=128)), expected)
+        fb.use_compiled = fb.use_weave = False
+        assert np.allclose(np.asarray(fb.process(buffersize=128)), expected)
+
+
+def test_sos_filterbank():
+    '''Make sure that SOSFilterbank gives the same results as the
+       LinearFilterbank it is converted from, and that the single precision
+       version is accurate.
+    '''
+    samplerate = 44.1*kHz
+    snd = Sound(np.random.randn(2000, 1), samplerate=samplerate)
+    cf = erbspace(100*Hz, 10*kHz, 50)
+    fb = Gammatone(snd, cf)
+    expected = np.asarray(fb.process(buffersize=300))
+    sos = fb.to_sos()
+    assert_equal(sos.sos.shape, (50, 4, 6))
+    for use_compiled in [True, False]:
+        sos.use_compiled = use_compiled and sos.use_compiled
+        assert np.allclose(np.asarray(sos.process(buffersize=300)), expected)
+    # higher order filters are split in sections
+    fb.decascade(2)
+    sos = fb.to_sos()
+    assert_equal(sos.sos.shape, (50, 4, 6))
+    assert np.allclose(np.asarray(sos.process(buffersize=300)), expected)
+    # single precision
+    sos = fb.to_sos(dtype=np.float32)
+    assert_equal(sos.sos.dtype, np.float32)
+    output = np.asarray(sos.process(buffersize=300))
+    assert np.allclose(output, expected, atol=1e-3*np.abs(expected).max())
+    assert np.all(sos.float32_error(snd)<1e-3)
+
+
+def test_time_varying_filterbank():
+    '''Make sure that the coefficients of TimeVaryingLinearFilterbank are
+       changed between buffers and interpolated in the same way by the
+       compiled kernel and in Python.
+    '''
+    samplerate = 44.1*kHz
+    snd = Sound(np.random.randn(500, 1), samplerate=samplerate)
+    cf = erbspace(100*Hz, 10*kHz, 10)
+    fb1, fb2 = Gammatone(snd, cf), Gammatone(snd, 1.5*cf)
+    coefficients = [(fb1.filt_b, fb1.filt_a), (fb2.filt_b, fb2.filt_a)]
+    outputs = {}
+    for interpolate in [False, True]:
+        for use_compiled in [True, False]:
+            fb = TimeVaryingLinearFilterbank(snd, fb1.filt_b, fb1.filt_a,
+                                             interpolate=interpolate)
+            fb.use_compiled = use_compiled and fb.use_compiled
+            fb.use_weave = False
+            updates = []
+            def updater(input):
+                updates.append(input.shape[0])
+                fb.set_coefficients(*coefficients[len(updates)%2])
+            control = ControlFilterbank(fb, snd, fb, updater, 50)
+            outputs[interpolate, use_compiled] = np.asarray(control.process(buffersize=50))
+            assert_equal(updates, [50]*10)
+    expected = np.asarray(fb1.process())
+    for use_compiled in [True, False]:
+        assert np.allclose(outputs[True, use_compiled], outputs[True, True])
+        assert np.allclose(outputs[False, use_compiled], outputs[False, True])
+        assert np.allclose(outputs[use_compiled, True][:50], expected[:50])
+    assert not np.allclose(outputs[False, True], outputs[True, True])
+    # with updates at each sample, the interpolation has no effect
+    sound = Sound(np.random.randn(200, 1), samplerate=50*kHz)
+    output = TanCarney(sound, cf, update_interval=1).process()
+    interpolated = TanCarney(sound, cf, update_interval=1, interpolate=True).process()
+    assert np.allclose(np.asarray(interpolated), np.asarray(output))
+
+
+def test_pipeline_filterbank():
+    '''Make sure that filterbank chains computed by several threads (with
+       PipelineFilterbank or ChannelParallelFilterbank) give the same results
+       as in a single thread.
+    '''
+    samplerate = 44.1*kHz
+    snd = Sound(np.random.randn(2000, 1), samplerate=samplerate)
+    cf = erbspace(100*Hz, 10*kHz, 10)
+    rectify = lambda x: np.clip(x, 0, np.inf)
+    expected = np.asarray(FunctionFilterbank(Gammatone(snd, cf), rectify).process())
+    for buffersize, nbuffers in [(1, 2), (100, 4), (4096, 2)]:
+        gammatone = PipelineFilterbank(Gammatone(snd, cf), buffersize, nbuffers)
+        fb = FunctionFilterbank(gammatone, rectify)
+        for processbuffersize in [32, 333]:
+            output = np.asarray(fb.process(buffersize=processbuffersize))
+            assert np.allclose(output, expected)
+        gammatone.stop()
+    for nchunks in [1, 3, 20]:
+        fb = ChannelParallelFilterbank(snd,
+                    lambda source, i, j: FunctionFilterbank(Gammatone(source, cf[i:j]), rectify),
+                    len(cf), nchunks)
+        assert_equal(fb.nchannels, len(cf))
+        assert np.allclose(np.asarray(fb.process(buffersize=100)), expected)
+    # the worker thread stops at the end of the source, later blocks are
+    # computed by the consumer
+    gammatone = PipelineFilterbank(Gammatone(snd, cf), 100, 2)
+    output = np.asarray(gammatone.process(duration=2500))
+    gammatone.thread.join(10)
+    assert not gammatone.thread.is_alive()
+    assert np.allclose(output, Gammatone(snd, cf).process(duration=2500))
+    # the worker thread of an unfinished pipeline stops when the pipeline is
+    # garbage collected (it only holds a reference while computing a block)
+    gammatone = PipelineFilterbank(Gammatone(snd, cf), 10, 2)
+    gammatone.process(duration=100)
+    thread = gammatone.thread
+    ref = weakref.ref(gammatone)
+    del gammatone
+    for _ in range(1000):
+        gc.collect()
+        if ref() is None:
+            break
+        time.sleep(0.01)
+    assert ref() is None
+    thread.join(10)
+    assert not thread.is_alive()
+    # errors of the worker thread are raised in the main thread
+    def error(x):
+        raise ValueError('error in the worker thread')
+    fb = PipelineFilterbank(FunctionFilterbank(snd, error))
+    assert_raises(ValueError, fb.process)
+
+
+def test_buffer_fetch():
+    '''Make sure that fetching the output of a filterbank in segments of
+       varying sizes, with minimum and maximum buffer sizes, gives the output
+       of the whole sound, and that the cache storage is reused.
+    '''
+    samplerate = 44.1*kHz
+    snd = Sound(np.random.randn(2000, 1), samplerate=samplerate)
+    cf = erbspace(100*Hz, 10*kHz, 10)
+    gammatone = Gammatone(snd, cf)
+    fb = FunctionFilterbank(gammatone, lambda x: 2*x)
+    expected = np.asarray(fb.process())
+    for buffersize in [1, 7, 32, 2000]:
+        assert_equal(np.asarray(fb.process(buffersize=buffersize)), expected)
+    segments = [(0, 3), (3, 10), (5, 20), (20, 60), (60, 61), (61, 400),
+                (400, 2000)]
+    for minimum, maximum in [(None, None), (40, None), (None, 13), (40, 13)]:
+        # with a maximum buffer size, the pieces are written into the cache
+        for f, name, size in [(fb, 'minimum_buffer_size', minimum),
+                              (gammatone, 'minimum_buffer_size', minimum),
+                              (gammatone, 'maximum_buffer_size', maximum)]:
+            if size is None:
+                if hasattr(f, name):
+                    delattr(f, name)
+            else:
+                setattr(f, name, size)
+        fb.buffer_init()
+        for start, end in segments:
+            assert_equal(np.asarray(fb.buffer_fetch(start, end)),
+                         expected[start:end])
+    del fb.minimum_buffer_size
+    del gammatone.minimum_buffer_size, gammatone.maximum_buffer_size
+    # the compiled kernel writes the outputs into the cache storage, which
+    # is allocated once
+    fb.buffer_init()
+    fb.buffer_fetch(0, 32)
+    storage = gammatone._buffer_storage
+    for start in range(32, 2000-32, 32):
+        fb.buffer_fetch(start, start+32)
+        output = gammatone.buffer_fetch(start, start+32)
+        if gammatone.use_compiled:
+            assert gammatone._buffer_storage is storage
+            assert output.base is storage
+        assert_equal(output, expected[start:start+32]/2)
+
+
+def test_fir_filtering():
+    '''Make sure that the FFT based FIR filterbank gives the same results as
+       direct convolution, for various buffer sizes.
+    '''
+    samplerate = 44.1*kHz
+    snd = Sound(np.random.randn(2000, 1), samplerate=samplerate)
+    for ir_length in [1, 37, 256]:
+        impulse_response = np.random.randn(3, ir_length)
+        expected = np.array([np.convolve(np.asarray(snd).flatten(), ir)[:2000]
+                             for ir in impulse_response]).T
+        for buffersize in [1, 100, 4096]:
+            fb = FFTFIRFilterbank(snd, impulse_response)
+            output = np.asarray(fb.process(buffersize=buffersize))
+            assert np.allclose(output, expected)
+            # large buffers are processed in several blocks
+            fb = FFTFIRFilterbank(snd, impulse_response)
+            fb.fft_block_factor = 1
+            assert np.allclose(np.asarray(fb.process(buffersize=buffersize)),
+                               expected)
+    # a single impulse response applied to all channels
+    fb = FFTFIRFilterbank(Sound(np.random.randn(100, 2), samplerate=samplerate),
+                          np.ones(5))
+    output = np.asarray(fb.process())
+    assert_equal(output.shape, (100, 2))
+
+
+def test_partitioned_fir_filtering():
+    '''Make sure that partitioned convolution gives the same results as direct
+       convolution, for uniform and non-uniform partitions and buffer sizes
+       which are not multiples of the partition size.
+    '''
+    samplerate = 44.1*kHz
+    snd = Sound(np.random.randn(3000, 2), samplerate=samplerate)
+    for ir_length in [1, 50, 1000]:
+        impulse_response = np.random.randn(2, ir_length)
+        expected = np.array([np.convolve(np.asarray(snd)[:, i], ir)[:3000]
+                             for i, ir in enumerate(impulse_response)]).T
+        for partition_size in [32, [16, 64, 256]]:
+            fb = FIRFilterbank(snd, impulse_response,
+                               partition_size=partition_size)
+            assert isinstance(fb, PartitionedFIRFilterbank)
+            for buffersize in [7, 32, 500]:
+                output = np.asarray(fb.process(buffersize=buffersize))
+                assert np.allclose(output, expected)
+
+
+def test_hrtf_filterbank():
+    '''Make sure that HRTFFilterbank gives the same results as the
+       FIRFilterbank of the HRTFSet, with and without memory-mapped spectra.
+    '''
+    samplerate = 44.1*kHz
+    data = np.random.randn(2, 5, 64)
+    hrtfset = HRTFSet(data, samplerate,
+                      make_coordinates(azim=np.arange(5)))
+    snd = Sound(np.random.randn(1000), samplerate=samplerate)
+    spectra_dir = tempfile.mkdtemp()
+    try:
+        for interleaved in [False, True]:
+            expected = np.asarray(hrtfset.filterbank(snd, interleaved=interleaved).process())
+            for buffersize in [50, 1000]:
+                for directory in [None, spectra_dir, spectra_dir]:
+                    fb = HRTFFilterbank(snd, hrtfset, interleaved=interleaved,
+                                        spectra_dir=directory)
+                    output = np.asarray(fb.process(buffersize=buffersize))
+                    assert_equal(output.shape, (1000, 10))
+                    assert np.allclose(output, expected)
+        assert_equal(len(os.listdir(spectra_dir)), 2)
+    finally:
+        shutil.rmtree(spectra_dir)
+
+
+def test_hrtfset_cache():
+    '''Make sure that HRTF sets are saved and loaded (memory-mapped) with the
+       same data and coordinates, and that HRTFs are created only when
+       accessed.
+    '''
+    samplerate = 44.1*kHz
+    data = np.random.randn(2, 5, 64)
+    hrtfset = HRTFSet(data, samplerate,
+                      make_coordinates(azim=np.arange(5), elev=np.zeros(5)))
+    hrtfset.name = 'test'
+    directory = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(directory, 'test')
+        save_hrtfset(hrtfset, filename)
+        for mmap in [True, False]:
+            loaded = load_hrtfset(filename, mmap=mmap)
+            assert_equal(np.asarray(loaded.data), data)
+            assert_equal(loaded.coordinates, hrtfset.coordinates)
+            assert_equal(loaded.samplerate, samplerate)
+            assert_equal(loaded.name, 'test')
+            hrtf = loaded(azim=3, elev=0)
+            assert_equal(np.asarray(hrtf.right).flatten(), data[1, 3])
+            assert loaded[3] is hrtf
+            subset = loaded.subset(lambda azim: azim>1)
+            assert_equal(len(subset), 3)
+            assert subset[1] is hrtf
+            assert_equal(len(loaded.hrtf), 5)
+    finally:
+        shutil.rmtree(directory)
+
+
 if __name__ == '__main__':
     test_sound_construction()
     test_sound_access()
@@ -243,3 +536,12 @@ if __name__ == '__main__':
     test_linear_filtering()
     test_multichannel_processing()
     test_middleear()
+    test_linearfilterbank_kernels()
+    test_sos_filterbank()
+    test_time_varying_filterbank()
+    test_pipeline_filterbank()
+    test_buffer_fetch()
+    test_fir_filtering()
+    test_partitioned_fir_filtering()
+    test_hrtf_filterbank()
+    test_hrtfset_cache()
@@ -1,5 +1,10 @@
 from brian import *
 from nose.tools import *
+import os
+import tempfile
+import weakref
+import gc
+import time
 from brian.utils.approximatecomparisons import is_approx_equal, is_within_absolute_tolerance
 try:
     from brian.experimental.cuda.gpu_modelfitting import *
@@ -236,6 +241,173 @@ def test_spikemonitor():
 
     reinit_default_clock() # for next test
 
+def test_spikemonitor_arrays():
+    '''
+    Tests the consistency of the different ways to access the spikes
+    recorded by :class:`SpikeMonitor` and :class:`StateSpikeMonitor`.
+    '''
+    reinit_default_clock()
+    spikes = [(0, 1 * ms), (2, 1 * ms), (1, 2 * ms), (0, 3 * ms)]
+    G = SpikeGeneratorGroup(3, spikes)
+    # H spikes one timestep after G
+    H = NeuronGroup(3, model='''v : 1
+                                w : 1''', threshold=0.5, reset=0.)
+    H.w = [1., 2., 3.]
+    C = Connection(G, H, 'v')
+    C.connect_one_to_one(weight=1.)
+    M = SpikeMonitor(G)
+    S = StateSpikeMonitor(H, 'w')
+    net = Network(G, H, C, M, S)
+    net.run(2.5 * ms)
+    # the lists of spikes are only built again after new spikes
+    first_M, first_S = M.spikes, S.spikes
+    assert len(first_M) == 3 and len(first_S) == 3
+    assert M.spikes is first_M and S.spikes is first_S
+    net.run(2.5 * ms)
+    assert M.spikes is not first_M and S.spikes is not first_S
+    # the time steps of the spikes are recorded
+    assert_equal(list(M._step.data), [10, 10, 20, 30])
+    i, t = M.it
+    assert_equal(list(i), [0, 2, 1, 0])
+    assert is_within_absolute_tolerance(max(abs(t - array([1, 1, 2, 3]) * 0.001)), 0.)
+    for (mi, mt), (si, st) in zip(M.spikes, spikes):
+        assert mi == si and is_approx_equal(mt, st)
+    assert len(M.spiketimes) == 3
+    for j in range(3):
+        assert (M[j] == t[i == j]).all()
+        assert (S.values('w', j) == j + 1.).all()
+        assert is_within_absolute_tolerance(max(abs(S.times(j) - M[j] - defaultclock.dt)), 0.)
+    assert_equal(len(S.spikes[0]), 3)
+    M.reinit()
+    assert M.nspikes == 0 and len(M.spikes) == 0 and len(M[0]) == 0
+    reinit_default_clock()
+
+def test_filespikemonitor():
+    '''
+    Tests that :class:`FileSpikeMonitor` and :class:`AERSpikeMonitor` have
+    written all the spikes at the end of a run.
+    '''
+    reinit_default_clock()
+    spikes = [(0, 1 * ms), (2, 1 * ms), (1, 2 * ms), (0, 3 * ms)]
+    G = SpikeGeneratorGroup(3, spikes)
+    handle, filename = tempfile.mkstemp()
+    os.close(handle)
+    handle, aer_filename = tempfile.mkstemp(suffix='.aedat')
+    os.close(handle)
+    try:
+        M = FileSpikeMonitor(G, filename)
+        Maer = AERSpikeMonitor(G, aer_filename)
+        net = Network(G, M, Maer)
+        net.run(5 * ms)
+        lines = open(filename).read().splitlines()
+        assert_equal(len(lines), 4)
+        for line, (i, t) in zip(lines, spikes):
+            mi, mt = line.split(', ')
+            assert int(mi) == i and is_approx_equal(float(mt), float(t))
+        addr, timestamps = load_aer(aer_filename)
+        assert_equal(list(addr), [0, 2, 1, 0])
+        M.close()
+        Maer.close()
+        # a closed monitor cannot record spikes
+        reinit_default_clock()
+        assert_raises(ValueError, lambda: net.run(5 * ms))
+        assert_raises(ValueError, M.flush)
+        # a monitor which is not referenced anymore is garbage collected,
+        # and its file is completed and closed
+        reinit_default_clock()
+        M = FileSpikeMonitor(G, filename)
+        Network(G, M).run(5 * ms)
+        monitor, f = weakref.ref(M), M.f
+        del M
+        gc.collect()
+        assert monitor() is None
+        for _ in range(100): # the file is closed by the thread of the writer
+            if f.closed:
+                break
+            time.sleep(0.01)
+        assert f.closed
+        assert_equal(len(open(filename).read().splitlines()), 4)
+    finally:
+        os.remove(filename)
+        os.remove(aer_filename)
+    reinit_default_clock()
+
+def test_experimental_aerspikemonitor():
+    '''
+    Tests that the :class:`AERSpikeMonitor` of the neuromorphic package (with
+    timestamps in microseconds) writes the spikes of a run.
+    '''
+    from brian.experimental.neuromorphic import AERSpikeMonitor, load_AER
+    reinit_default_clock()
+    G = SpikeGeneratorGroup(3, [(0, 1 * ms), (2, 1 * ms), (1, 2 * ms)])
+    handle, filename = tempfile.mkstemp(suffix='.aedat')
+    os.close(handle)
+    try:
+        M = AERSpikeMonitor(G, filename)
+        net = Network(G, M)
+        net.run(5 * ms)
+        addr, timestamps = load_AER(filename, relative_time=False)
+        assert_equal(list(addr), [0, 2, 1])
+        # timestamps are rounded up to the next microsecond
+        assert (abs(timestamps - array([1000, 1000, 2000])) <= 1).all()
+        # the writer is closed when the program ends, unless closed before
+        from brian.monitor import _background_writers
+        assert M._writer in _background_writers
+        M.close()
+        assert M._writer not in _background_writers
+    finally:
+        os.remove(filename)
+    reinit_default_clock()
+
+def test_statemonitor_spill():
+    '''
+    Tests that a :class:`StateMonitor` writing its values to a file records
+    the same values as a :class:`StateMonitor` storing them in memory.
+    '''
+    reinit_default_clock()
+    G = NeuronGroup(3, model='dV/dt = 1*Hz : 1')
+    G.V = [0., 1., 2.]
+    M = StateMonitor(G, 'V', record=True)
+    M0 = StateMonitor(G, 'V', record=0)
+    handle, filename = tempfile.mkstemp()
+    os.close(handle)
+    try:
+        Mspill = StateMonitor(G, 'V', record=[0, 2], spill_file=filename,
+                              spill_block=7)
+        net = Network(G, M, M0, Mspill)
+        net.run(2 * ms)
+        # values can be accessed during the simulation
+        assert_equal(Mspill.values.shape, (2, 20))
+        net.run(3 * ms)
+        assert_equal(M.values.shape, (3, 50))
+        assert (M.values[[0, 2]] == Mspill.values).all()
+        assert (M[0] == M0[0]).all()
+        assert (M.times == Mspill.times).all()
+        # values is a read-only view on the recordings
+        def write_values(M):
+            M.values[:] = 0
+        assert_raises((ValueError, RuntimeError), write_values, M)
+        assert_raises((ValueError, RuntimeError), write_values, Mspill)
+        values = M.values
+        net.run(1 * ms)
+        assert_equal(values.shape, (3, 50))
+        assert (M.values[:, :50] == values).all()
+        assert (M.values[[0, 2]] == Mspill.values).all()
+        # reinit closes the file, and the values returned before remain valid
+        values = Mspill.values
+        spillfile = Mspill._spillfile
+        Mspill.reinit()
+        assert spillfile.closed
+        net.run(1 * ms)
+        assert_equal(Mspill.values.shape, (2, 10))
+        assert (M.values[[0, 2], -10:] == Mspill.values).all()
+        assert (M.values[[0, 2], :60] == values).all()
+        del values
+        Mspill._spillfile.close()
+    finally:
+        os.remove(filename)
+    reinit_default_clock()
+
 def test_counter():
     '''
     Tests the consistency of :class:`SpikeCounter`,
@@ -473,5 +645,8 @@ def test_coincidencecounter():
 
 if __name__ == '__main__':
     test_spikemonitor()
+    test_spikemonitor_arrays()
+    test_filespikemonitor()
+    test_statemonitor_spill()
     test_counter()
 #    test_coincidencecounter()
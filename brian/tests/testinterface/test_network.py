@@ -1,10 +1,12 @@
 import sys
 from StringIO import StringIO
 
-from numpy.testing.utils import assert_raises
+from numpy.testing.utils import assert_raises, assert_equal
+from numpy.random import seed
 
 from brian import *
 from brian.utils.progressreporting import ProgressReporter
+from brian.utils.profiling import NetworkProfile
 
 
 
@@ -170,6 +172,222 @@ def test_network_clocks():
     net = Network(G1, G2)
     assert(not net.same_clocks())
 
+def test_network_multiple_clocks():
+    '''
+    Test that with several clocks the updates happen in the order of (t, order)
+    '''
+    clock1 = Clock(dt=3*ms)
+    clock2 = Clock(dt=5*ms, order=1)
+    clock3 = Clock(dt=5*ms, order=-1)
+    calls = []
+    @network_operation(clock=clock1)
+    def op1(clock):
+        calls.append((1, int(round(clock.t / ms))))
+    @network_operation(clock=clock2)
+    def op2(clock):
+        calls.append((2, int(round(clock.t / ms))))
+    @network_operation(clock=clock3)
+    def op3(clock):
+        calls.append((3, int(round(clock.t / ms))))
+    net = Network(op1, op2, op3)
+    net.run(20*ms)
+    expected = sorted([(t, 0, 1) for t in range(0, 21, 3)] +
+                      [(t, 1, 2) for t in range(0, 20, 5)] +
+                      [(t, -1, 3) for t in range(0, 20, 5)])
+    assert calls == [(i, t) for t, _, i in expected]
+    # a second run continues where the first one stopped
+    calls[:] = []
+    net.run(10*ms)
+    assert calls[0] == (3, 20)
+    assert len([c for c in calls if c[0] == 2]) == 2
+    assert all(calls[i][1] <= calls[i + 1][1] for i in range(len(calls) - 1))
+
+def test_fused_update():
+    '''
+    Test that running blocks of steps with the fusedsteps preference gives the
+    same results as the standard step by step update
+    '''
+    def run_net(fusedsteps):
+        old_fusedsteps = get_global_preference('fusedsteps')
+        set_global_preferences(fusedsteps=fusedsteps)
+        try:
+            clock = Clock(dt=0.1*ms)
+            slowclock = Clock(dt=0.7*ms, order=1)
+            G = NeuronGroup(10, 'dv/dt = (2 - v) / (10 * ms) : 1', threshold=1,
+                            reset=0, clock=clock)
+            G.v = linspace(0, 1, 10)
+            H = NeuronGroup(10, 'dv/dt = -v / (10 * ms) : 1', clock=clock)
+            C = Connection(G, H, 'v', weight=0.1)
+            spikes = SpikeMonitor(G)
+            slowmon = StateMonitor(H, 'v', record=True, clock=slowclock)
+            net = Network(G, H, C, spikes, slowmon)
+            net.run(20 * ms)
+            net.run(3.35 * ms)
+        finally:
+            set_global_preferences(fusedsteps=old_fusedsteps)
+        return clock.t, spikes.spikes, slowmon.values, slowmon.times
+    t, spikes, values, times = run_net(0)
+    for fusedsteps in [1, 7, 1000]:
+        t_f, spikes_f, values_f, times_f = run_net(fusedsteps)
+        assert t == t_f
+        assert spikes == spikes_f
+        assert_equal(values, values_f)
+        assert_equal(times, times_f)
+    # network operations are called at every step, so they can stop the run
+    old_fusedsteps = get_global_preference('fusedsteps')
+    set_global_preferences(fusedsteps=100)
+    try:
+        clock = Clock(dt=0.1*ms)
+        G = NeuronGroup(1, 'dv/dt = -v / (10 * ms) : 1', clock=clock)
+        calls = []
+        @network_operation(clock=clock)
+        def stop_after_five():
+            calls.append(clock.t)
+            if len(calls) == 5:
+                stop()
+        net = Network(G, stop_after_five)
+        net.run(100 * ms)
+        assert len(calls) == 5
+        # as are network operations which override __call__
+        class StopAfterFive(NetworkOperation):
+            def __call__(self):
+                calls.append(clock.t)
+                if len(calls) == 5:
+                    stop()
+        calls = []
+        net = Network(G, StopAfterFive(clock=clock))
+        net.run(100 * ms)
+        assert len(calls) == 5
+        # and plain functions in custom schedules
+        calls = []
+        def stop_after_five_function():
+            calls.append(clock.t)
+            if len(calls) == 5:
+                net.stop()
+        net = Network(G)
+        net.set_update_schedule(['groups', ([stop_after_five_function], None, True)])
+        net.run(100 * ms)
+        assert len(calls) == 5
+    finally:
+        set_global_preferences(fusedsteps=old_fusedsteps)
+
+def test_threaded_update():
+    '''
+    Test that updating groups and connections concurrently gives the same
+    results as the serial update
+    '''
+    from brian.network import conflict_free_batches, group_resources
+    def make_net():
+        reinit_default_clock()
+        eqs = '''
+        dv/dt = (ge + gi + 1.2 - v) / (10 * ms) : 1
+        dge/dt = -ge / (5 * ms) : 1
+        dgi/dt = -gi / (10 * ms) : 1
+        '''
+        groups = [NeuronGroup(20, eqs, threshold=1, reset=0) for _ in range(3)]
+        for G in groups:
+            G.v = rand(len(G))
+        # reads the state of the first group, uses random numbers, and uses
+        # a user defined reset
+        I = groups[0].v
+        groups.append(NeuronGroup(20, 'dv/dt = (I - v) / (10 * ms) : 1',
+                                  method='Euler'))
+        groups.append(NeuronGroup(20, 'dv/dt = (1.2 - v) / (10 * ms) + '
+                                      '0.1 * xi / (10 * ms) ** .5 : 1',
+                                  threshold=1, reset=0))
+        groups.append(NeuronGroup(20, 'dv/dt = (1.2 - v) / (10 * ms) + '
+                                      '0.1 * xi / (10 * ms) ** .5 : 1',
+                                  threshold=1,
+                                  reset=FunReset(lambda P, spikes: None)))
+        connections = [Connection(groups[0], groups[1], 'ge', weight=0.2),
+                       Connection(groups[1], groups[2], 'ge', weight=0.2),
+                       Connection(groups[2], groups[1], 'gi', weight=-0.2),
+                       Connection(groups[0], groups[2], 'ge', weight=0.1),
+                       Connection(groups[2], groups[0], 'ge', weight=0.1,
+                                  delay=1 * ms)]
+        monitors = [SpikeMonitor(G) for G in groups]
+        return groups, connections, monitors
+    seed(10)
+    groups, connections, monitors = make_net()
+    batches = conflict_free_batches(connections + monitors)
+    assert sum(len(batch) for batch in batches) == 11
+    assert len(batches) == 2
+    assert connections[3] in batches[1] # same target as connections[1]
+    def group_batches(objfun):
+        batches = conflict_free_batches(groups,
+                          lambda G: group_resources(G, objfun, groups))
+        return [[groups.index(G) for G in batch] for batch in batches]
+    assert group_batches('update') == [[0, 1, 2, 4], [3, 5]]
+    assert group_batches('reset') == [[0, 1, 2, 3, 4], [5]]
+    seed(10)
+    groups, connections, monitors = make_net()
+    Network(groups, connections, monitors).run(30 * ms)
+    seed(10)
+    groups_t, connections_t, monitors_t = make_net()
+    Network(groups_t, connections_t, monitors_t).run(30 * ms, threads=3)
+    for G, G_t, M, M_t in zip(groups, groups_t, monitors, monitors_t):
+        assert_equal(G._S, G_t._S)
+        assert M.spikes == M_t.spikes
+    assert sum(M.nspikes for M in monitors) > 0
+
+def test_profiling():
+    '''
+    Test the per-object profile returned by run(profile=True), and that
+    profiling does not change the simulation
+    '''
+    import json
+    def make_net():
+        reinit_default_clock()
+        G = NeuronGroup(10, 'dv/dt = (2 - v) / (10 * ms) : 1', threshold=1,
+                        reset=0)
+        G.v = linspace(0, 1, 10)
+        H = NeuronGroup(10, 'dv/dt = -v / (10 * ms) : 1')
+        C = Connection(G, H, 'v', weight=0.1)
+        spikes = SpikeMonitor(G)
+        @network_operation
+        def count_steps():
+            steps.append(1)
+        return Network(G, H, C, spikes, count_steps), spikes
+    steps = []
+    net, spikes = make_net()
+    net.run(20 * ms)
+    steps = []
+    net_p, spikes_p = make_net()
+    profile = net_p.run(20 * ms, profile=True)
+    assert spikes.spikes == spikes_p.spikes
+    assert len(steps) == 200
+    assert isinstance(profile, NetworkProfile)
+    times = [stats.time for stats in profile.objects]
+    assert times == sorted(times, reverse=True)
+    kinds = [stats.kind for stats in profile.objects]
+    assert len(kinds) == 6 # 2 updates, 2 resets, 1 MultiConnection, 1 operation
+    assert 'groups (update)' in kinds and 'ops end' in kinds
+    for stats in profile.objects:
+        assert stats.calls == 200
+        if stats.kind == 'connections (do_propagate)':
+            assert stats.events == spikes_p.nspikes
+        elif stats.kind == 'ops end':
+            assert stats.events is None
+    assert sum(stats.events for stats in profile.objects
+               if stats.kind == 'resets (reset)') == spikes_p.nspikes
+    assert profile.time >= sum(times)
+    assert 'count_steps' in str(profile)
+    assert 'NeuronGroup 1 (10 neurons)' in str(profile)
+    d = json.loads(profile.to_json())
+    assert len(d['objects']) == 6
+    # The standard schedule is restored after the run
+    assert net_p._update_schedule[id(net_p.clock)][0] == net_p.groups[0].update
+    # Counting the events is not included in the time of the object
+    import time
+    from brian.utils.profiling import ObjectProfile, profiled
+    def slow_count():
+        time.sleep(0.05)
+        return 1
+    stats = ObjectProfile('f', 'ops end', True)
+    profiled(lambda: None, stats, slow_count)()
+    assert stats.events == 1 and stats.calls == 1
+    assert stats.time < 0.05
+
 def test_network_operation():
     reinit_default_clock()
     G = NeuronGroup(1, model='dv/dt = -v / (1 * ms) : 1')
@@ -200,5 +418,9 @@ if __name__ == '__main__':
     test_progressreporting()
     test_network_generation()
     test_network_clocks()
+    test_network_multiple_clocks()
+    test_fused_update()
+    test_threaded_update()
+    test_profiling()
     test_network_operation()
     test_reinit()
\ No newline at end of file
@@ -1,6 +1,8 @@
 from brian import *
 from brian.utils.approximatecomparisons import *
 from nose.tools import *
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+from numpy.random import seed
 
 def test_poissongroup():
     ''' Test PoissonGroup '''
@@ -122,8 +124,114 @@ def test_variable_setting():
         G.vsquared = 2
     assert_raises(ValueError, assign_to_static)
 
+def test_parallel_state_update():
+    '''
+    Test that updating the state variables in several threads gives the same
+    results as the serial update.
+    '''
+    reinit_default_clock()
+    eqs_linear = '''
+    dv/dt = (ge - v) / (10 * ms) : 1
+    dge/dt = -ge / (5 * ms) : 1
+    '''
+    eqs_nonlinear = '''
+    dv/dt = (ge - v + v ** 2) / (10 * ms) : 1
+    dge/dt = -ge / (5 * ms) : 1
+    '''
+    eqs_conditionally_linear = '''
+    dv/dt = ge * (1 - v) / (10 * ms) : 1
+    dge/dt = -ge / (5 * ms) : 1
+    '''
+    for eqs, method in [(eqs_linear, None), (eqs_nonlinear, 'Euler'),
+                        (eqs_nonlinear, 'RK'),
+                        (eqs_conditionally_linear, 'exponential_Euler')]:
+        values = []
+        for threads in [1, 3]:
+            reinit_default_clock()
+            G = NeuronGroup(100, eqs, method=method, threads=threads)
+            G.v = linspace(0, 0.5, 100)
+            G.ge = linspace(1, 0.1, 100)
+            Network(G).run(2 * ms)
+            values.append(G._S.copy())
+        assert_array_almost_equal(values[0], values[1])
+
+    # compiled state updaters, each chunk has its own derivative array
+    for eqs, method in [(eqs_nonlinear, 'Euler'),
+                        (eqs_conditionally_linear, 'exponential_Euler')]:
+        values = []
+        for threads in [1, 3]:
+            reinit_default_clock()
+            G = NeuronGroup(100, eqs, method=method, compile=True,
+                            threads=threads)
+            G.v = linspace(0, 0.5, 100)
+            G.ge = linspace(1, 0.1, 100)
+            Network(G).run(2 * ms)
+            values.append(G._S.copy())
+        assert_array_almost_equal(values[0], values[1])
+
+    # noise: one random stream per chunk, reproducible for a given seed
+    values = []
+    for _ in range(2):
+        reinit_default_clock()
+        seed(3)
+        G = NeuronGroup(100, 'dv/dt = -v / (10 * ms) + xi / (10 * ms) ** .5 : 1',
+                        threads=3)
+        Network(G).run(2 * ms)
+        values.append(G.v.copy())
+    assert_array_equal(values[0], values[1])
+    assert all(values[0] != 0)
+
+    # not all state updaters can be run in parallel
+    assert_raises(TypeError, lambda: NeuronGroup(10, FunStateUpdater(lambda P: None, 1),
+                                                 threads=3))
+
+def test_parallel_threshold_reset():
+    '''
+    Test that thresholding and resetting on several threads gives exactly the
+    same spikes as the serial version.
+    '''
+    eqs = '''
+    dv/dt = (1.5 - v) / (10 * ms) : 1
+    vt : 1
+    vr : 1
+    '''
+    for threshold, reset in [(1, 0), ('v > vt', 'v = vr'),
+                             (VariableThreshold('vt', 'v'), VariableReset('vr', 'v')),
+                             (lambda v: v > 1, 0)]:
+        results = []
+        for threads in [1, 3]:
+            reinit_default_clock()
+            G = NeuronGroup(100, eqs, threshold=threshold, reset=reset,
+                            threads=threads)
+            G.v = linspace(0, 1, 100)
+            G.vt = linspace(1, 1.2, 100)
+            G.vr = linspace(0, 0.5, 100)
+            M = SpikeMonitor(G)
+            Network(G, M).run(20 * ms)
+            results.append((M.spikes, G.v.copy()))
+        assert results[0][0] == results[1][0]
+        assert_array_equal(results[0][1], results[1][1])
+    G = NeuronGroup(10, eqs, threshold=1, reset=0, threads=3)
+    assert isinstance(G._threshold, ParallelThreshold)
+    assert isinstance(G._resetfun, ParallelReset)
+    # the chunks are rebuilt when the state matrix changes, the base reset
+    # does not keep the state vectors of the previous chunks
+    reinit_default_clock()
+    net = Network(G)
+    for _ in range(3):
+        G._S = G._S.copy()
+        G.v = 2
+        net.run(0.1 * ms)
+        assert_array_equal(G.v, 0)
+    assert G._resetfun.basereset.statevectors == {}
+    # resets with refractoriness are applied serially
+    G = NeuronGroup(10, eqs, threshold=1, reset=0, refractory=2 * ms, threads=3)
+    assert not isinstance(G._resetfun, ParallelReset)
+
 
 if __name__ == '__main__':
     test_poissongroup()
     test_linked_var()
-    test_variable_setting()
\ No newline at end of file
+    test_variable_setting()
+    test_parallel_state_update()
+    test_parallel_threshold_reset()
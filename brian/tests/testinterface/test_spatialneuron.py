@@ -0,0 +1,198 @@
+import os
+import shutil
+import tempfile
+import numpy as np
+from numpy.testing.utils import assert_raises
+
+from brian import *
+from brian.experimental.morphology import SpatialNeuron, Morphology, Soma, Cylinder
+import brian.experimental.morphology.morphology as morphology_module
+
+
+def make_neuron(copies=1):
+    '''
+    A small branched neuron: a soma, an axon and a dendrite with two
+    branches, one of which has two branches.
+    '''
+    morpho = Soma(30 * um)
+    morpho.axon = Cylinder(diameter=1 * um, length=100 * um, n=10)
+    morpho.dend = Cylinder(diameter=2 * um, length=50 * um, n=5)
+    morpho.dend.L = Cylinder(diameter=1 * um, length=50 * um, n=5)
+    morpho.dend.R = Cylinder(diameter=1 * um, length=50 * um, n=5)
+    morpho.dend.R.L = Cylinder(diameter=.5 * um, length=20 * um, n=3)
+    morpho.dend.R.R = Cylinder(diameter=.5 * um, length=20 * um, n=3)
+    eqs = '''
+    Im = gl * (-70 * mV - v) + gm * m * (50 * mV - v) : amp / cm ** 2
+    dm/dt = -m / (5 * ms) : 1
+    gl : siemens / cm ** 2
+    gm : siemens / cm ** 2
+    '''
+    # the state updater of SpatialNeuron does not work with code generation
+    usecodegen = get_global_preference('usecodegen')
+    set_global_preferences(usecodegen=False)
+    try:
+        neuron = SpatialNeuron(morphology=morpho, model=eqs, copies=copies)
+    finally:
+        set_global_preferences(usecodegen=usecodegen)
+    neuron.gl = 1e-4 * siemens / cm ** 2
+    neuron.gm = 1e-3 * siemens / cm ** 2
+    return neuron
+
+
+def test_solve_tree():
+    '''
+    Tests that the system connecting the branches, solved by levels of the
+    tree, has the same solution as with a dense solver.
+    '''
+    reinit_default_clock()
+    K = 3
+    neuron = make_neuron(copies=K)
+    updater = neuron._state_updater
+    updater.prepare()
+    parent = updater.parent
+    n = len(parent)
+    assert list(parent) == [0, 0, 1, 1, 3, 3, 5, 5]
+    np.random.seed(2)
+    updater.a[:] = np.random.rand(n, K)
+    updater.b[:] = np.random.rand(n, K)
+    updater.d[:] = 5 + np.random.rand(n, K)
+    updater.B[:] = np.random.rand(n, K)
+    # dense matrices of the systems, one per copy
+    M = np.zeros((K, n, n))
+    for k in range(K):
+        M[k][np.diag_indices(n)] = updater.d[:, k]
+        for i in range(1, n):
+            M[k, i, parent[i]] = updater.a[i, k]
+            M[k, parent[i], i] = updater.b[i, k]
+    B = updater.B.copy()
+    updater.solve_tree()
+    for k in range(K):
+        assert np.allclose(updater.V[:, k], np.linalg.solve(M[k], B[:, k]))
+
+
+def test_copies():
+    '''
+    Tests that the copies of a neuron are simulated as separate neurons.
+    '''
+    K = 3
+    def run_neuron(copies, m0):
+        reinit_default_clock()
+        neuron = make_neuron(copies=copies)
+        m = neuron.m.reshape((copies, -1))
+        m[:, 0] = m0 # soma of each copy
+        Network(neuron).run(2 * ms)
+        return np.array(neuron.v).reshape((copies, -1))
+    # identical copies have identical runs
+    v = run_neuron(K, 1)
+    for k in range(1, K):
+        assert (v[k] == v[0]).all()
+    # copies with different values are the same as single neurons
+    v = run_neuron(K, [0.5, 1, 2])
+    for k, m0 in enumerate([0.5, 1, 2]):
+        assert np.allclose(v[k], run_neuron(1, m0)[0])
+    assert not np.allclose(v[0], v[1])
+    # copies with different membrane capacitances
+    def run_neuron_Cm(copies, Cm):
+        reinit_default_clock()
+        neuron = make_neuron(copies=copies)
+        neuron.Cm.reshape((copies, -1))[:] = np.reshape(Cm, (-1, 1))
+        neuron.m = 1
+        Network(neuron).run(2 * ms)
+        return np.array(neuron.v).reshape((copies, -1))
+    Cm = np.array([0.5, 1, 2]) * uF / cm ** 2
+    v = run_neuron_Cm(K, Cm)
+    for k in range(K):
+        assert np.allclose(v[k], run_neuron_Cm(1, Cm[k])[0])
+    assert not np.allclose(v[0], v[1])
+
+
+def old_loadswc(text):
+    '''
+    The previous SWC loader (one point at a time), for comparison.
+    '''
+    segment = []
+    for line in text.splitlines():
+        if line[0] != '#':
+            numbers = line.split()
+            n = int(numbers[0]) - 1
+            T = morphology_module.swc_types[int(numbers[1])]
+            x, y, z, R = [float(numbers[k]) * um for k in range(2, 6)]
+            P = int(numbers[6]) - 1
+            assert n == len(segment)
+            seg = dict(x=x, y=y, z=z, T=T, diameter=2 * R, parent=P, children=[])
+            if T == 'soma':
+                seg['area'] = 4 * pi * R ** 2
+                seg['length'] = 0 * um
+            else:
+                locationP = (segment[P]['x'], segment[P]['y'], segment[P]['z'])
+                seg['length'] = (sum((np.array((x, y, z)) - np.array(locationP)) ** 2)) ** .5 * meter
+                seg['area'] = seg['length'] * 2 * pi * R
+            if P >= 0:
+                segment[P]['children'].append(n)
+            segment.append(seg)
+    return Morphology().create_from_segments(segment)
+
+
+def assert_same_morphology(morpho1, morpho2):
+    assert morpho1.type == morpho2.type
+    for var in ['x', 'y', 'z', 'diameter', 'length', 'area']:
+        assert np.allclose(np.asarray(getattr(morpho1, var), dtype=float),
+                           np.asarray(getattr(morpho2, var), dtype=float))
+    assert len(morpho1.children) == len(morpho2.children)
+    for kid1, kid2 in zip(morpho1.children, morpho2.children):
+        assert_same_morphology(kid1, kid2)
+
+
+def test_loadswc():
+    '''
+    Tests that SWC files are loaded as with the previous loader, also when the
+    points are not in order, that files with several roots are rejected and
+    that loaded files are cached.
+    '''
+    filename = os.path.join(os.path.dirname(morphology_module.__file__),
+                            'mp_ma_40984_gc2.CNG.swc')
+    text = open(filename).read()
+    reference = old_loadswc(text)
+    tmpdir = tempfile.mkdtemp()
+    def load(text, cache=False):
+        swcfile = os.path.join(tmpdir, 'morpho.swc')
+        open(swcfile, 'w').write(text)
+        return Morphology(swcfile, cache=cache)
+    try:
+        assert_same_morphology(load(text), reference)
+        # Lines in random order
+        lines = [line for line in text.splitlines() if line[0] != '#']
+        np.random.seed(4)
+        shuffled = '\n'.join([lines[i] for i in np.random.permutation(len(lines))])
+        assert_same_morphology(load(shuffled), reference)
+        # Interleaved branches: the soma has two branches of two points
+        contiguous = ['1 1 0 0 0 10 -1', '2 3 10 0 0 1 1', '3 3 20 0 0 1 2',
+                      '4 3 0 10 0 1 1', '5 3 0 20 0 1 4']
+        interleaved = ['1 1 0 0 0 10 -1', '2 3 10 0 0 1 1', '3 3 0 10 0 1 1',
+                       '4 3 20 0 0 1 2', '5 3 0 20 0 1 3']
+        morpho = load('\n'.join(interleaved))
+        assert_same_morphology(morpho, old_loadswc('\n'.join(contiguous)))
+        assert len(morpho.children) == 2 and len(morpho.children[0].x) == 2
+        # Several roots
+        two_roots = ['1 1 0 0 0 10 -1', '2 3 10 0 0 1 1', '3 1 0 10 0 10 -1']
+        assert_raises(ValueError, lambda: load('\n'.join(two_roots)))
+        # A cached file is not parsed again
+        cache = os.path.join(tmpdir, 'cache')
+        load(text, cache=cache)
+        assert len(os.listdir(cache)) == 1
+        parse_swc = morphology_module.parse_swc
+        def failing_parse_swc(text, filename=''):
+            raise AssertionError('The file was parsed again')
+        morphology_module.parse_swc = failing_parse_swc
+        try:
+            assert_same_morphology(load(text, cache=cache), reference)
+        finally:
+            morphology_module.parse_swc = parse_swc
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    test_solve_tree()
+    test_copies()
+    test_loadswc()
@@ -18,6 +18,9 @@ from brian.directcontrol import SpikeGeneratorGroup
 from brian.monitor import StateMonitor
 from brian.threshold import NoThreshold
 from brian.stdunits import ms, mV, nS, nF
+from brian.utils.dynamicarray import DynamicArray1D
+from brian.synapses.spikequeue import (SpikeQueue, PythonSpikeQueue,
+                                      has_cspikequeue)
 
 
 def test_construction_single_synapses():
@@ -462,6 +465,85 @@ def test_incorrect_pre_reference():
     # only throw an error to avoid this problem.
     assert_raises(ValueError, lambda: Synapses(G, G2, pre='x_pre += 1'))
 
+def test_generate_c_code():
+    '''
+    Test the translation of the pre/post codes to C.
+    '''
+    G = NeuronGroup(2, 'v:1')
+    wmax = 2.
+    clip = np.clip
+    syn = Synapses(G, G, model='w:1', pre='v+=w',
+                   post='w=clip(w+v_pre**2, 0, wmax)')
+    _namespace = syn.namespaces[0]
+    code, arrays = syn.generate_c_code(_namespace['_synaptic_code'],
+                                       _namespace)
+    assert '_post_v[_j] += _syn_w[_s];' in code
+    assert arrays == {'_post_v': 'v_post', '_syn_w': 'w'}
+    _namespace = syn.namespaces[1]
+    code, arrays = syn.generate_c_code(_namespace['_synaptic_code'],
+                                       _namespace, direct=True)
+    assert '_syn_w[_s] = clip((_syn_w[_s]+pow(_pre_v[_i], 2)), 0, (2.0));' in code
+    assert arrays == {'_pre_v': 'v_pre', '_syn_w': 'w'}
+    
+    # codes which are run in Python
+    syn = Synapses(G, G, model='w:1', pre='v+=w*rand()', post='v+=w')
+    for _namespace, direct in zip(syn.namespaces, [False, True]):
+        assert_raises(NotImplementedError,
+                      lambda: syn.generate_c_code(_namespace['_synaptic_code'],
+                                                  _namespace, direct=direct))
+
+def test_compiled_code():
+    '''
+    Test that the pre/post codes give the same results when they are run by
+    the compiled loop (brian/synapses/csynapticcode) and in Python, with
+    several synapses per postsynaptic neuron.
+    '''
+    from brian.synapses.synapticcode import has_csynapticcode
+    if not has_csynapticcode:
+        return
+    def run_net(use_compiled):
+        # namespace of the codes
+        taupre = taupost = 5 * ms
+        wmax = 0.5
+        clip, exp = np.clip, np.exp
+        reinit_default_clock()
+        np.random.seed(5)
+        spikes = zip(np.random.randint(0, 5, 200),
+                     np.sort(np.random.rand(200)) * 50 * ms)
+        G = SpikeGeneratorGroup(5, spikes)
+        H = NeuronGroup(3, 'dv/dt = -v / (10 * ms) : 1', threshold=1, reset=0)
+        S = Synapses(G, H, model='''w : 1
+                                    dApre/dt = -Apre / taupre : 1 (event-driven)
+                                    dApost/dt = -Apost / taupost : 1 (event-driven)''',
+                     pre='''v += w + (1 / 2) * w
+                            Apre += 0.1
+                            w = clip(w - Apost, 0, wmax)''',
+                     post='''Apost += 0.1
+                             w = clip(w + Apre, 0, wmax)''')
+        S[:, :] = True
+        S[0, 1] = True # two synapses between the same neurons
+        S.w = np.random.rand(len(S)) * wmax
+        S._use_compiled = use_compiled
+        S._useweave = False
+        net = Network(G, H, S)
+        net.run(60 * ms)
+        if use_compiled:
+            assert all(program is not None for program in S._programs)
+        return [np.array(S.w[:]), np.array(S.Apre[:]), np.array(S.Apost[:]),
+                np.array(S.lastupdate[:]), np.array(H.v[:])]
+    for compiled, python in zip(run_net(True), run_net(False)):
+        assert np.allclose(compiled, python)
+
+    # the program of a code
+    G = NeuronGroup(2, 'v:1')
+    syn = Synapses(G, G, model='w:1', pre='v += w * (1 / 2) + 2 * 3')
+    syn[:, :] = True
+    syn.compress() # creates the arrays of the namespace
+    program, constants, arrays = syn.generate_program(syn.namespaces[0]['_synaptic_code'],
+                                                      syn.namespaces[0])
+    assert list(constants) == [0.0, 6.0] # 1 / 2 is an integer division
+    assert arrays == ['v_post', 'w']
+
 ################################################################################
 # Low level unit tests, test single helper functions
 from brian.synapses.synapticvariable import slice_to_array
@@ -473,6 +555,45 @@ slice_to_t.__name__ = 'slice_to_t'
 from brian.synapses.synapses import invert_array, smallest_inttype, indent
 
 
+def test_spikequeue():
+    '''
+    Tests that the default spike queue (compiled if available) stores the
+    same events as the Python spike queue.
+    '''
+    reinit_default_clock()
+    G = NeuronGroup(5, model='v:1')
+    np.random.seed(3)
+    # 3 synapses per neuron, synapse k has delay k % 4 (timesteps)
+    synapses = []
+    for i in range(len(G)):
+        synapses.append(DynamicArray1D(3, dtype=int))
+        synapses[i][:] = np.arange(3*i, 3*i+3)
+    delays = np.arange(15) % 4
+    queues = [SpikeQueue(G, synapses, delays),
+              PythonSpikeQueue(G, synapses, delays)]
+    for queue in queues:
+        queue.compress()
+    for _ in range(20):
+        spikes = np.unique(np.random.randint(0, len(G), 3))
+        events = []
+        for queue in queues:
+            queue.propagate(spikes)
+            events.append(np.sort(queue.peek()))
+            queue.next()
+        assert (events[0] == events[1]).all()
+    # Delays longer than the maximum delay
+    queue = SpikeQueue(G, synapses, delays, max_delay=defaultclock.dt)
+    assert_raises(ValueError, queue.compress)
+    # An error while counting the events must not leave stale counts, which
+    # would make the compiled queue grow at the next insertion
+    if has_cspikequeue:
+        queue = SpikeQueue(G, synapses, delays, maxevents=4)
+        assert_raises(RuntimeError, lambda: queue.insert([0, 0, 0, 100],
+                                                         [0, 1, 2, 3]))
+        queue.insert([0, 0, 0, 0], [0, 1, 2, 3])
+        assert queue.n_maxevents == 4
+        assert list(queue.peek()) == [0, 1, 2, 3]
+
 def test_slice_to_array():
     '''
     Test the slice_to_array function (converts a slice to the corresponding
@@ -565,6 +686,9 @@ if __name__ == '__main__':
     test_construction_and_access()
     test_model_definition()
     test_incorrect_pre_reference()
+    test_generate_c_code()
+    test_compiled_code()
+    test_spikequeue()
     test_slice_to_array()
     test_slice_to_test()
     test_smallest_inttype()
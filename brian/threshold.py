@@ -39,7 +39,7 @@ Threshold mechanisms
 import re
 from random import sample # Python standard random module (sample is different)
 
-from numpy import clip, Inf
+from numpy import clip, Inf, concatenate, asarray
 from numpy.random import rand, randn
 try:
     import weave
@@ -56,10 +56,11 @@ from brian.inspection import namespace, get_identifiers
 from brian.log import log_warn
 from brian.units import check_units, second, msecond, mvolt
 from brian.utils.approximatecomparisons import is_approx_equal
+from brian.utils.parallel import make_group_chunks, get_thread_pool
 
 __all__ = ['Threshold', 'FunThreshold', 'VariableThreshold', 'NoThreshold',
           'EmpiricalThreshold', 'SimpleFunThreshold', 'PoissonThreshold',
-          'HomogeneousPoissonThreshold', 'StringThreshold']
+          'HomogeneousPoissonThreshold', 'StringThreshold', 'ParallelThreshold']
 
 CThreshold = PythonThreshold = None
 
@@ -496,3 +497,75 @@ class HomogeneousPoissonThreshold(PoissonThreshold):
         spikes = sample(xrange(len(P)), n)
         spikes.sort() # necessary only for subgrouping
         return spikes
+
+
+class ParallelThreshold(Threshold):
+    '''
+    Applies another threshold in parallel on chunks of neurons.
+    
+    **Initialised as:** ::
+    
+        ParallelThreshold(basethreshold[, threads=2[, chunks=None]])
+    
+    with arguments:
+    
+    ``basethreshold``
+        The threshold to apply, see :meth:`supports` for which ones can be
+        used.
+    ``threads``
+        The number of threads to use.
+    ``chunks``
+        The number of contiguous chunks of neurons, by default the number of
+        threads.
+    
+    Each chunk produces its own sorted array of spiking neurons, and these
+    are concatenated in increasing order of neuron index, so that the
+    result is exactly the same as for the base threshold.
+    '''
+    def __init__(self, basethreshold, threads=2, chunks=None):
+        if not ParallelThreshold.supports(basethreshold):
+            raise TypeError('Parallel thresholds are not supported for ' +
+                            basethreshold.__class__.__name__)
+        self.basethreshold = basethreshold
+        self.threads = threads
+        if chunks is None:
+            chunks = threads
+        self.nchunks = chunks
+        self._chunks = None
+        self._chunked_S = None
+
+    @staticmethod
+    def supports(threshold):
+        '''
+        Whether ``threshold`` can be applied to chunks of neurons
+        independently, i.e. if it only depends on the current state of each
+        neuron. String thresholds are not supported since they share their
+        namespace between calls.
+        '''
+        return threshold.__class__ in (Threshold, VariableThreshold,
+                                       FunThreshold, SimpleFunThreshold)
+
+    def _chunk_spikes(self, chunk):
+        return asarray(self.basethreshold(chunk), dtype=int) + chunk.i
+
+    def __call__(self, P):
+        if self._chunked_S is not P._S:
+            self._chunks = make_group_chunks(P, self.nchunks)
+            self._chunked_S = P._S
+        spikes = get_thread_pool(self.threads).map(self._chunk_spikes,
+                                                   self._chunks, chunksize=1)
+        return concatenate(spikes)
+
+    def __getstate__(self):
+        # views on the group are rebuilt on demand
+        pickle_dict = self.__dict__.copy()
+        pickle_dict['_chunks'] = None
+        pickle_dict['_chunked_S'] = None
+        return pickle_dict
+
+    def __repr__(self):
+        return '%s(%r, threads=%d)' % (self.__class__.__name__,
+                                       self.basethreshold, self.threads)
+
+    def __str__(self):
+        return '%s on %d threads' % (str(self.basethreshold), self.threads)
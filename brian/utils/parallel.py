@@ -0,0 +1,98 @@
+'''
+Support for updating groups in parallel on chunks of neurons
+
+A group's state matrix is split column-wise into contiguous chunks, each of
+which is seen through a :class:`GroupChunk` view. State updaters, thresholds
+and resets can then be applied to each chunk as if it was the group itself,
+in a pool of threads (see :func:`get_thread_pool`).
+'''
+from numpy import linspace, zeros, random
+from multiprocessing.pool import ThreadPool
+
+__all__ = ['GroupChunk', 'make_group_chunks', 'get_thread_pool']
+
+_thread_pools = {}
+
+
+def get_thread_pool(threads):
+    '''
+    Returns a pool of ``threads`` threads, shared by all the objects that
+    ask for a pool of this size.
+    '''
+    pool = _thread_pools.get(threads, None)
+    if pool is None:
+        pool = _thread_pools[threads] = ThreadPool(threads)
+    return pool
+
+
+class ChunkSpikes(object):
+    '''
+    Stands in for the ``LS`` spike container of a :class:`GroupChunk`, it
+    only knows the spikes of the current time step (local indices).
+    '''
+    def __init__(self):
+        self.spikes = zeros(0, dtype=int)
+
+    def lastspikes(self):
+        return self.spikes
+
+
+class GroupChunk(object):
+    '''
+    A view on the contiguous neurons ``i:j`` of a group.
+
+    It has the attributes of a group that state updaters, thresholds and
+    resets use (``_S``, ``clock``, ``state_``, ``len``, ``LS.lastspikes()``),
+    so that they can be applied to it as if it was the group itself. If a
+    ``seed`` is given, it also has its own ``random_state``, a
+    ``numpy.random.RandomState`` object used for noise terms.
+    
+    The state vectors returned by ``state_`` are cached on the chunk, which
+    is discarded when its group's state matrix changes.
+    '''
+    def __init__(self, P, i, j, seed=None):
+        self.i = i
+        self.j = j
+        self.clock = P.clock
+        self._S = P._S[:, i:j]
+        self.var_index = P.var_index
+        self.staticvars = getattr(P, 'staticvars', {})
+        self._spikesarray = zeros(j - i, dtype=int)
+        self.LS = ChunkSpikes()
+        self._statevectors = {}
+        if seed is not None:
+            self.random_state = random.RandomState(seed)
+
+    def state_(self, name):
+        if name in self.staticvars:
+            f = self.staticvars[name]
+            return f(*[self.state_(var) for var in f.func_code.co_varnames])
+        V = self._statevectors.get(name, None)
+        if V is None:
+            if isinstance(name, int):
+                V = self._S[name]
+            else:
+                V = self._S[self.var_index[name]]
+            self._statevectors[name] = V
+        return V
+    state = state_
+
+    def __len__(self):
+        return self.j - self.i
+
+
+def make_group_chunks(P, nchunks, seeds=False):
+    '''
+    Splits group ``P`` into (at most) ``nchunks`` contiguous
+    :class:`GroupChunk` objects of nearly equal size, in increasing order of
+    neuron index. If ``seeds`` is ``True``, each chunk gets its own random
+    stream, seeded from the numpy random number generator.
+    '''
+    N = P._S.shape[1]
+    bounds = linspace(0, N, nchunks + 1).astype(int)
+    if seeds:
+        chunkseeds = random.randint(2 ** 31 - 1, size=nchunks)
+    else:
+        chunkseeds = [None] * nchunks
+    return [GroupChunk(P, i, j, seed) for i, j, seed
+            in zip(bounds[:-1], bounds[1:], chunkseeds) if j > i]
@@ -0,0 +1,201 @@
+'''
+Per-object profiling of Network.run (see ``Network.run(profile=True)``).
+'''
+from timeit import default_timer
+import json
+
+__all__ = ['NetworkProfile', 'ObjectProfile']
+
+
+class ObjectProfile(object):
+    '''
+    Time spent in one object of the update schedule of a network
+
+    Has attributes:
+
+    ``name``
+        A description of the object (class name and name or index).
+    ``kind``
+        The schedule item that calls the object (``'groups'``,
+        ``'connections'``, ``'ops end'``, etc.), with the method called.
+    ``time``
+        The total time spent in the object (in seconds).
+    ``calls``
+        The number of calls, i.e., the number of time steps of the object.
+    ``events``
+        The number of events processed by the object (spikes for groups,
+        connections and monitors, synaptic events for synapses), ``None``
+        if the object does not process events.
+    '''
+    def __init__(self, name, kind, count_events):
+        self.name = name
+        self.kind = kind
+        self.time = 0.0
+        self.calls = 0
+        self.events = None
+        if count_events:
+            self.events = 0
+
+    time_per_step = property(fget=lambda self:self.time / max(self.calls, 1))
+    events_per_second = property(fget=lambda self:None if self.events is None
+                                 else self.events / max(self.time, 1e-9))
+
+    def as_dict(self):
+        return {'name': self.name, 'kind': self.kind, 'time': self.time,
+                'calls': self.calls, 'time_per_step': self.time_per_step,
+                'events': self.events,
+                'events_per_second': self.events_per_second}
+
+
+def event_counter(obj, objfun):
+    '''
+    Returns a function ``count()`` returning the number of events processed
+    by a call of ``obj.objfun`` (called before the call), or ``None`` if
+    the events of the object cannot be counted.
+    '''
+    if objfun == 'do_propagate':
+        count = lambda: len(obj.source.get_spikes(obj.delay))
+    elif objfun == 'update' and hasattr(obj, 'queues'): # Synapses
+        count = lambda: sum([len(queue.peek()) for queue in obj.queues])
+    elif objfun == 'reset' and hasattr(obj, 'get_spikes'):
+        # the reset is applied to the spikes of the current time step
+        count = lambda: len(obj.get_spikes(0))
+    else:
+        return None
+    try:
+        count()
+    except (AttributeError, TypeError):
+        return None
+    return count
+
+
+def profiled(f, stats, count=None):
+    '''
+    Returns a version of the function ``f()`` which adds its execution time
+    and number of events (``count()``) to ``stats``.
+    '''
+    timer = default_timer
+    if count is None:
+        def profiled_f():
+            start = timer()
+            f()
+            stats.time += timer() - start
+            stats.calls += 1
+    else:
+        def profiled_f():
+            # the events are counted before f() runs, outside the timed region
+            stats.events += count()
+            start = timer()
+            f()
+            stats.time += timer() - start
+            stats.calls += 1
+    return profiled_f
+
+
+class NetworkProfile(object):
+    '''
+    Per-object profile of a network run, returned by
+    ``Network.run(duration, profile=True)``
+
+    Has attributes:
+
+    ``objects``
+        A list of :class:`ObjectProfile`, sorted by decreasing total time.
+    ``time``
+        The total time of the run (in seconds).
+    ``duration``
+        The simulated duration.
+
+    **Methods**
+
+    .. method:: table()
+
+        Returns the profile as a table (string), this is also what
+        ``str(profile)`` returns.
+
+    .. method:: as_dict()
+
+        Returns the profile as a dictionary (that can be saved as JSON).
+
+    .. method:: to_json([filename])
+
+        Returns the profile in JSON format, and writes it to ``filename``
+        if specified.
+    '''
+    def __init__(self):
+        self.objects = []
+        self.time = 0.0
+        self.duration = 0.0
+        self._profiles = {}
+        self._names = {}
+
+    def wrap(self, schedule):
+        '''
+        Returns the profiled version of a schedule, a list of tuples
+        ``(f, kind, obj, objfun)`` where ``f`` is ``obj.objfun``, or ``obj``
+        itself if ``objfun`` is ``None``.
+        '''
+        wrapped = []
+        for f, kind, obj, objfun in schedule:
+            key = (id(obj), objfun)
+            count = event_counter(obj, objfun)
+            if key not in self._profiles:
+                if objfun is not None:
+                    kind += ' (' + objfun + ')'
+                self._profiles[key] = ObjectProfile(self.describe(obj), kind,
+                                                    count is not None)
+                self.objects.append(self._profiles[key])
+            wrapped.append(profiled(f, self._profiles[key], count))
+        return wrapped
+
+    def describe(self, obj):
+        '''
+        Short description of an object of the schedule, objects of the same
+        class are numbered in the order of the schedule.
+        '''
+        name = obj.__class__.__name__
+        if name == 'NetworkOperation' and hasattr(obj, 'function'):
+            return name + ' ' + getattr(obj.function, '__name__', '')
+        if id(obj) not in self._names:
+            number = len([n for n in self._names.itervalues() if n[0] == name])
+            self._names[id(obj)] = (name, number)
+        name = '%s %d' % self._names[id(obj)]
+        try:
+            name += ' (%d neurons)' % len(obj)
+        except TypeError:
+            pass
+        return name
+
+    def sort(self):
+        self.objects.sort(key=lambda stats:-stats.time)
+
+    def as_dict(self):
+        return {'time': self.time, 'duration': float(self.duration),
+                'objects': [stats.as_dict() for stats in self.objects]}
+
+    def to_json(self, filename=None):
+        s = json.dumps(self.as_dict(), indent=2)
+        if filename is not None:
+            f = open(filename, 'w')
+            f.write(s)
+            f.close()
+        return s
+
+    def table(self):
+        scheduled = sum([stats.time for stats in self.objects])
+        lines = ['%-40s %-28s %10s %6s %10s %8s %12s' % ('Object', 'Schedule',
+                     'Time (s)', '%', 'Calls', 'us/step', 'Events/s')]
+        for stats in self.objects:
+            if stats.events is None:
+                rate = '-'
+            else:
+                rate = '%.3g' % stats.events_per_second
+            lines.append('%-40s %-28s %10.4f %6.1f %10d %8.1f %12s' % (
+                         stats.name[:40], stats.kind[:28], stats.time,
+                         100. * stats.time / max(self.time, 1e-9),
+                         stats.calls, 1e6 * stats.time_per_step, rate))
+        lines.append('Total run time: %.4f s (%.4f s in the scheduled objects)' %
+                     (self.time, scheduled))
+        return '\n'.join(lines)
+
+    __str__ = table
@@ -73,6 +73,34 @@ if not os.getenv('BRIAN_SETUP_NO_EXTENSIONS', False):
                                                         'circular.cpp')],
                                      include_dirs=[numpy.get_include()]
                                      ))    
+    ext_modules.append(Extension('brian.synapses.cspikequeue._cspikequeue',
+                                 sources=[os.path.join('brian', 'synapses',
+                                                       'cspikequeue', x) for x in
+                                                       ('cspikequeue_wrap.cxx',
+                                                        'cspikequeue.cpp')],
+                                     include_dirs=[numpy.get_include()]
+                                     ))
+    ext_modules.append(Extension('brian.synapses.csynapticcode._csynapticcode',
+                                 sources=[os.path.join('brian', 'synapses',
+                                                       'csynapticcode', x) for x in
+                                                       ('csynapticcode_wrap.cxx',
+                                                        'csynapticcode.cpp')],
+                                     include_dirs=[numpy.get_include()]
+                                     ))
+    # The kernel of LinearFilterbank uses several processors with OpenMP
+    if sys.platform.startswith('linux'):
+        openmp_args = ['-fopenmp']
+    else:
+        openmp_args = []
+    ext_modules.append(Extension('brian.hears.filtering.clinearfilterbank._clinearfilterbank',
+                                 sources=[os.path.join('brian', 'hears', 'filtering',
+                                                       'clinearfilterbank', x) for x in
+                                                       ('clinearfilterbank_wrap.cxx',
+                                                        'clinearfilterbank.cpp')],
+                                     include_dirs=[numpy.get_include()],
+                                     extra_compile_args=openmp_args,
+                                     extra_link_args=openmp_args
+                                     ))
 
 
 setup(name='brian',
@@ -81,6 +109,8 @@ setup(name='brian',
   packages=['brian',
                 'brian.connections',
                 'brian.synapses',
+                    'brian.synapses.cspikequeue',
+                    'brian.synapses.csynapticcode',
                 'brian.deprecated',
                 'brian.experimental',
                     'brian.experimental.cuda',
@@ -88,7 +118,6 @@ setup(name='brian',
                     'brian.experimental.codegen2',
                     'brian.experimental.codegen2.gpu',
                     'brian.experimental.compensation',
-                    'brian.experimental.cspikequeue',
                     'brian.experimental.cuda',
                     'brian.experimental.genn',
                     'brian.experimental.nemo',
@@ -96,6 +125,7 @@ setup(name='brian',
                     'brian.experimental.neuromorphic',
                 'brian.hears',
                     'brian.hears.filtering',
+                        'brian.hears.filtering.clinearfilterbank',
                     'brian.hears.hrtf',
                 'brian.library',
                     'brian.library.electrophysiology',
@@ -115,7 +145,7 @@ setup(name='brian',
   # Add the source files for the CSpikeQueue as package data so they end up
   # being included in the installation directory for a possible later manual
   # build.
-  package_data={'brian.experimental.cspikequeue': ['*.h', '*.c??']},
+  package_data={'brian.synapses.cspikequeue': ['*.h', '*.c??', '*.i']},
   cmdclass={'build_ext': optional_build_ext},
   provides=['brian'],
   requires=['matplotlib(>=0.90.1)',